@@ -0,0 +1,88 @@
+"""Measure how many workspace keys per second can be opened for service tokens V3,
+building a new box for every key or reusing the boxes of the key pair kept by the
+client config of each token.
+
+Run with ``python -m benchmarks.bench_asymmetric`` from the root of the repository.
+"""
+import time
+from base64 import b64encode
+from typing import Callable, List, Tuple
+
+from infisical.models.secret_service import ClientConfig
+from infisical.utils.crypto import decrypt_asymmetric, encrypt_asymmetric
+from nacl import public
+
+TOKEN_COUNTS = (10, 100)
+ROUNDS = 10
+
+# The client config of a token, the public key of the peer and the encrypted key
+Envelope = Tuple[ClientConfig, str, str, str]
+
+
+def b64(key: object) -> str:
+    return b64encode(bytes(key)).decode("utf-8")  # type: ignore[call-overload]
+
+
+def make_envelopes(count: int) -> List[Envelope]:
+    peer = public.PrivateKey.generate()
+    envelopes: List[Envelope] = []
+
+    for _ in range(count):
+        private_key = public.PrivateKey.generate()
+        ciphertext, nonce = encrypt_asymmetric(
+            "a1b2c3d4e5f60718293a4b5c6d7e8f90", b64(private_key.public_key), b64(peer)
+        )
+        client_config = ClientConfig(
+            auth_mode="service_token_v3",
+            credentials={
+                "public_key": b64(private_key.public_key),
+                "private_key": b64(private_key),
+            },
+            cache_ttl=300,
+        )
+        envelopes.append((client_config, b64(peer.public_key), ciphertext, nonce))
+
+    return envelopes
+
+
+def open_with_new_boxes(envelopes: List[Envelope]) -> None:
+    for client_config, peer_public_key, ciphertext, nonce in envelopes:
+        private_key = client_config.credentials.private_key
+        decrypt_asymmetric(ciphertext, nonce, peer_public_key, private_key)
+
+
+def open_with_key_pairs(envelopes: List[Envelope]) -> None:
+    for client_config, peer_public_key, ciphertext, nonce in envelopes:
+        client_config.get_key_pair().decrypt(ciphertext, nonce, peer_public_key)
+
+
+def measure(open_envelopes: Callable[[List[Envelope]], None], count: int) -> float:
+    """Return the rate of ``open_envelopes`` over ``ROUNDS`` rounds, in keys per second,
+    like a gateway bootstrapping the same tokens again
+    """
+    envelopes = make_envelopes(count)
+    start = time.perf_counter()
+
+    for _ in range(ROUNDS):
+        open_envelopes(envelopes)
+
+    return count * ROUNDS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    strategies = {
+        "new boxes": open_with_new_boxes,
+        "key pairs": open_with_key_pairs,
+    }
+
+    print(f"{'tokens':>8} " + " ".join(f"{name:>18}" for name in strategies))
+
+    for count in TOKEN_COUNTS:
+        rates = [
+            measure(open_envelopes, count) for open_envelopes in strategies.values()
+        ]
+        print(f"{count:>8} " + " ".join(f"{rate:>11,.0f} keys/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
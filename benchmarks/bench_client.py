@@ -0,0 +1,273 @@
+"""Measure the client end to end against an in-process stub of the Infisical API,
+serving secrets encrypted exactly like the real API over local sockets, so that it
+runs anywhere without network access nor token:
+
+- cold start: creating a client and getting a first secret, project key included
+- warm ``get_secret()``: getting a cached secret, and refetching it from the stub
+- ``get_all_secrets()``: fetching and decrypting environments of several sizes
+- concurrent access: many threads getting cached and refetched secrets
+- memory: the peak and retained memory of fetching the largest environment
+
+The responses of the stub are rendered once, so that the measured time is the time
+of the client. Results can be written as JSON, and compared to the results of a
+previous run with ``--baseline``, which fails the run when a result is worse by more
+than ``--tolerance``; ``--results`` compares the results of a file instead.
+
+Run with ``python -m benchmarks.bench_client`` from the root of the repository;
+``--help`` lists the options, e.g. ``--counts 10 1000`` for a quicker run.
+"""
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from infisical import InfisicalClient
+
+from testing.fake_api import SERVICE_TOKEN, FakeInfisicalAPI
+from testing.stub_servers import Handler, HTTP1StubServer
+
+SECRET_COUNTS = (10, 1_000, 10_000)
+VALUE_SIZE = 64  # bytes
+ROUNDS = 5
+THREADS = 16
+# The fraction by which a result can be worse than its baseline
+TOLERANCE = 0.25
+# The environment and path of the secrets of warm and concurrent reads
+SCOPE_PATH = "/10"
+
+Results = Dict[str, float]
+
+
+def make_api(counts: Sequence[int], value_size: int) -> FakeInfisicalAPI:
+    """Return a stub with ``count`` secrets in the path ``/<count>`` for each count"""
+    api = FakeInfisicalAPI()
+    value = "v" * value_size
+
+    for count in sorted(set(counts) | {10}):
+        for index in range(count):
+            api.add_secret(f"SECRET_{index}", value, path=f"/{count}")
+
+    return api
+
+
+def render_once(handle: Handler) -> Handler:
+    responses: Dict[Tuple[str, str], Tuple[int, Dict[str, str], str]] = {}
+
+    def handle_rendered(method, path, body, headers):  # type: ignore[no-untyped-def]
+        if (method, path) not in responses:
+            responses[method, path] = handle(method, path, body, headers)
+
+        return responses[method, path]
+
+    return handle_rendered
+
+
+def create_client(site_url: str, **kwargs) -> InfisicalClient:  # type: ignore[no-untyped-def]
+    # Without the deprecation warning printed by every new client
+    with contextlib.redirect_stdout(io.StringIO()):
+        return InfisicalClient(
+            token=SERVICE_TOKEN, site_url=site_url, pool_maxsize=THREADS, **kwargs
+        )
+
+
+def median_time(func: Callable[[], object], rounds: int) -> float:
+    """Return the median duration of ``func`` over ``rounds`` calls, in seconds"""
+    durations = []
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations)
+
+
+def rate(func: Callable[[], object], calls: int, threads: int = 1) -> float:
+    """Return the number of calls of ``func`` per second over ``threads`` threads"""
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda _: func(), range(calls)))
+
+        return calls / (time.perf_counter() - start)
+
+
+def bench_cold_start(site_url: str, rounds: int) -> Results:
+    return {
+        "cold start (ms)": 1000
+        * median_time(
+            lambda: create_client(site_url).get_secret("SECRET_0", path=SCOPE_PATH),
+            rounds,
+        )
+    }
+
+
+def bench_get_secret(site_url: str) -> Results:
+    cached_client = create_client(site_url)
+    refetching_client = create_client(site_url, cache_ttl=0)
+
+    def get_cached() -> None:
+        cached_client.get_secret("SECRET_0", path=SCOPE_PATH)
+
+    def get_refetched() -> None:
+        refetching_client.get_secret("SECRET_0", path=SCOPE_PATH)
+
+    get_cached()
+    get_refetched()
+
+    return {
+        "warm get_secret, cached (calls/s)": rate(get_cached, 20_000),
+        "warm get_secret, refetched (calls/s)": rate(get_refetched, 500),
+    }
+
+
+def bench_get_all_secrets(site_url: str, counts: Sequence[int], rounds: int) -> Results:
+    client = create_client(site_url, cache_ttl=0, cache_max_entries=max(counts))
+    client.get_secret("SECRET_0", path=SCOPE_PATH)
+
+    return {
+        f"get_all_secrets, {count} secrets (ms)": 1000
+        * median_time(partial(client.get_all_secrets, path=f"/{count}"), rounds)
+        for count in counts
+    }
+
+
+def bench_concurrency(site_url: str, threads: int) -> Results:
+    cached_client = create_client(site_url)
+    refetching_client = create_client(site_url, cache_ttl=0)
+    cached_client.get_all_secrets(path=SCOPE_PATH)
+    refetching_client.get_secret("SECRET_0", path=SCOPE_PATH)
+
+    def get_cached() -> None:
+        cached_client.get_secret("SECRET_0", type="shared", path=SCOPE_PATH)
+
+    # Concurrent misses of the same secret share a request, as they would in an app
+    def get_refetched() -> None:
+        refetching_client.get_secret("SECRET_0", path=SCOPE_PATH)
+
+    return {
+        f"{threads} threads, cached get_secret (calls/s)": rate(
+            get_cached, 50_000, threads
+        ),
+        f"{threads} threads, refetched get_secret (calls/s)": rate(
+            get_refetched, 2_000, threads
+        ),
+    }
+
+
+def bench_memory(site_url: str, count: int) -> Results:
+    client = create_client(site_url, cache_max_entries=count)
+    client.get_secret("SECRET_0", path=SCOPE_PATH)
+
+    tracemalloc.start()
+
+    try:
+        client.get_all_secrets(path=f"/{count}")
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        f"get_all_secrets, {count} secrets, peak memory (MiB)": peak / 2**20,
+        f"get_all_secrets, {count} secrets, retained memory (MiB)": retained / 2**20,
+    }
+
+
+def compare(results: Results, baseline: Results, tolerance: float) -> List[str]:
+    """Print the change of each result from its baseline, and return the names of
+    the results worse by more than ``tolerance``, rates being better when higher
+    """
+    width = max(len(name) for name in results)
+    regressions: List[str] = []
+
+    for name, value in results.items():
+        if not baseline.get(name):
+            continue
+
+        change = value / baseline[name] - 1
+        worse = -change if name.endswith("/s)") else change
+        print(
+            f"{name:<{width}} {baseline[name]:>12,.2f} -> {value:>12,.2f} {change:>+8.1%}"
+        )
+
+        if worse > tolerance:
+            regressions.append(name)
+
+    return regressions
+
+
+def measure(args: argparse.Namespace) -> Results:
+    """Run the benchmarks, print their results and write them to ``args.json``"""
+    api = make_api(args.counts, args.value_size)
+    server = HTTP1StubServer(render_once(api.handle)).start()
+    results: Results = {}
+
+    try:
+        results.update(bench_cold_start(server.url, args.rounds))
+        results.update(bench_get_secret(server.url))
+        results.update(bench_get_all_secrets(server.url, args.counts, args.rounds))
+        results.update(bench_concurrency(server.url, args.threads))
+        results.update(bench_memory(server.url, max(args.counts)))
+    finally:
+        server.stop()
+
+    width = max(len(name) for name in results)
+
+    for name, value in results.items():
+        print(f"{name:<{width}} {value:>12,.2f}")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+    print()
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=SECRET_COUNTS)
+    parser.add_argument("--value-size", type=int, default=VALUE_SIZE)
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    parser.add_argument("--threads", type=int, default=THREADS)
+    parser.add_argument("--json", help="A file to write the results to")
+    parser.add_argument("--baseline", help="A file of results to compare to")
+    parser.add_argument(
+        "--results", help="A file of results to compare, instead of measuring them"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help="The fraction by which a result can be worse than its baseline",
+    )
+    args = parser.parse_args(argv)
+
+    if args.results:
+        with open(args.results) as file:
+            results = json.load(file)
+    else:
+        results = measure(args)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+        regressions = compare(results, baseline, args.tolerance)
+
+        if regressions:
+            sys.exit(
+                f"{len(regressions)} results are worse than their baseline by more "
+                f"than {args.tolerance:.0%}: {'; '.join(regressions)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Measure how many secrets per second ``get_all_secrets()`` can decrypt.
+
+Run with ``python -m benchmarks.bench_decrypt`` from the root of the repository.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from infisical.utils.crypto import (
+    SymmetricCiphertext,
+    decrypt_symmetric_128_bit_hex_key_utf8,
+    decrypt_symmetric_128_bit_hex_key_utf8_batch,
+    encrypt_symmetric_128_bit_hex_key_utf8,
+)
+
+WORKSPACE_KEY = "a1b2c3d4e5f60718293a4b5c6d7e8f90"
+SECRET_COUNTS = (100, 1_000, 10_000)
+
+
+def make_ciphertexts(count: int) -> List[SymmetricCiphertext]:
+    # Every secret has an encrypted name and an encrypted value
+    return [
+        encrypt_symmetric_128_bit_hex_key_utf8(plaintext, WORKSPACE_KEY)
+        for index in range(count)
+        for plaintext in (f"SECRET_{index}", f"value-{index}-" + "x" * 32)
+    ]
+
+
+def decrypt_one_by_one(ciphertexts: List[SymmetricCiphertext]) -> None:
+    for ciphertext, iv, tag in ciphertexts:
+        decrypt_symmetric_128_bit_hex_key_utf8(
+            key=WORKSPACE_KEY, ciphertext=ciphertext, iv=iv, tag=tag
+        )
+
+
+def decrypt_batch(ciphertexts: List[SymmetricCiphertext]) -> None:
+    decrypt_symmetric_128_bit_hex_key_utf8_batch(WORKSPACE_KEY, ciphertexts)
+
+
+def measure(decrypt: Callable[[List[SymmetricCiphertext]], None], count: int) -> float:
+    """Return the best rate of ``decrypt`` over a few rounds, in secrets per second"""
+    ciphertexts = make_ciphertexts(count)
+    best = float("inf")
+
+    for _ in range(5):
+        start = time.perf_counter()
+        decrypt(ciphertexts)
+        best = min(best, time.perf_counter() - start)
+
+    return count / best
+
+
+def main() -> None:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+
+        def decrypt_threaded(ciphertexts: List[SymmetricCiphertext]) -> None:
+            decrypt_symmetric_128_bit_hex_key_utf8_batch(
+                WORKSPACE_KEY, ciphertexts, executor=executor
+            )
+
+        strategies = {
+            "one by one": decrypt_one_by_one,
+            "batch": decrypt_batch,
+            "batch, 4 threads": decrypt_threaded,
+        }
+
+        print(f"{'secrets':>8} " + " ".join(f"{name:>18}" for name in strategies))
+
+        for count in SECRET_COUNTS:
+            rates = [measure(decrypt, count) for decrypt in strategies.values()]
+            print(f"{count:>8} " + " ".join(f"{rate:>12,.0f} sec/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
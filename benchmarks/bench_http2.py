@@ -0,0 +1,114 @@
+"""Compare fetching the secrets of many paths at once over HTTP/1.1 and over HTTP/2,
+against local stub servers answering every request after the same latency.
+
+Over HTTP/1.1 each concurrent request needs a connection of its own, while over
+HTTP/2 they are all multiplexed on a single connection.
+
+Run with ``python -m benchmarks.bench_http2`` from the root of the repository, with
+the ``http2`` extra installed.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple, Type, Union
+
+from infisical import InfisicalClient
+from infisical.api import create_api_request_with_auth
+
+from testing.fake_api import SERVICE_TOKEN, FakeInfisicalAPI
+from testing.stub_servers import H2StubServer, HTTP1StubServer
+
+LATENCY = 0.02  # seconds
+FAN_OUTS = (8, 32, 128)
+SECRETS_PER_PATH = 20
+
+
+def make_api(fan_out: int) -> FakeInfisicalAPI:
+    api = FakeInfisicalAPI()
+
+    for path_index in range(fan_out):
+        for index in range(SECRETS_PER_PATH):
+            api.add_secret(f"SECRET_{index}", f"value-{index}", path=f"/{path_index}")
+
+    api.delay = LATENCY
+
+    return api
+
+
+def create_http1_client(site_url: str, fan_out: int) -> InfisicalClient:
+    return InfisicalClient(
+        token=SERVICE_TOKEN, site_url=site_url, cache_ttl=0, pool_maxsize=fan_out
+    )
+
+
+def create_http2_client(site_url: str, fan_out: int) -> InfisicalClient:
+    client = InfisicalClient(
+        token=SERVICE_TOKEN,
+        site_url=site_url,
+        cache_ttl=0,
+        pool_maxsize=fan_out,
+        http2=True,
+    )
+    # The stub server speaks cleartext HTTP/2, which is never negotiated over http
+    client.api_request = create_api_request_with_auth(
+        site_url,
+        SERVICE_TOKEN.rsplit(".", 1)[0],
+        pool_maxsize=fan_out,
+        http2=True,
+        http2_prior_knowledge=True,
+    )
+
+    return client
+
+
+def measure(
+    server_class: Union[Type[HTTP1StubServer], Type[H2StubServer]],
+    create_client: Callable[[str, int], InfisicalClient],
+    fan_out: int,
+) -> Tuple[float, int]:
+    """Return the best time to fetch ``fan_out`` paths concurrently, in seconds, and
+    the number of connections the server accepted
+    """
+    api = make_api(fan_out)
+    server = server_class(api.handle).start()
+    client = create_client(server.url, fan_out)
+    # Only measure the requests for the secrets, not the bootstrap of the client
+    client.get_all_secrets(path="/0")
+    best = float("inf")
+
+    try:
+        with ThreadPoolExecutor(max_workers=fan_out) as executor:
+            for _ in range(5):
+                start = time.perf_counter()
+                list(
+                    executor.map(
+                        lambda index: client.get_all_secrets(path=f"/{index}"),
+                        range(fan_out),
+                    )
+                )
+                best = min(best, time.perf_counter() - start)
+    finally:
+        server.stop()
+
+    return best, server.connections
+
+
+def main() -> None:
+    print(f"Server latency: {LATENCY * 1000:.0f} ms")
+    print(f"{'fan-out':>8} {'HTTP/1.1':>24} {'HTTP/2':>24}")
+
+    for fan_out in FAN_OUTS:
+        results = [
+            measure(HTTP1StubServer, create_http1_client, fan_out),
+            measure(H2StubServer, create_http2_client, fan_out),
+        ]
+        print(
+            f"{fan_out:>8} "
+            + " ".join(
+                f"{elapsed * 1000:>8.1f} ms, {connections:>3} conns"
+                for elapsed, connections in results
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
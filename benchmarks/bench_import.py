@@ -0,0 +1,124 @@
+"""Measure the time to import the package in a new interpreter, with
+``python -X importtime``, and list the heavy dependencies it loads: they should only
+be loaded by the first request, or the first decryption.
+
+Run with ``python -m benchmarks.bench_import`` from the root of the repository;
+``--max-ms`` fails the run when an import takes longer, and ``--show`` prints the
+slowest modules.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+ROUNDS = 10
+STATEMENTS = (
+    "import infisical",
+    "from infisical import InfisicalClient",
+    "from infisical import AsyncInfisicalClient",
+)
+HEAVY_MODULES = (
+    "Cryptodome",
+    "asyncio",
+    "cryptography",
+    "httpx",
+    "nacl",
+    "requests",
+    "urllib3",
+)
+
+# The cumulative import time of each module, in microseconds, by name indented by
+# two spaces per level of nesting
+ImportTimes = Dict[str, int]
+
+
+def import_times(statement: str) -> ImportTimes:
+    """Return the import times of the modules imported by ``statement``, in a new
+    interpreter
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    times: ImportTimes = {}
+
+    # e.g. "import time:       219 |        412 |   infisical.constants"
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        _, cumulative, module = line.split("|")
+        times[module[1:].rstrip()] = int(cumulative)
+
+    return times
+
+
+def top_level_time(times: ImportTimes, startup: ImportTimes) -> int:
+    """Return the time of the top-level imports, the others being included in them,
+    except the ones of the interpreter's startup, e.g. ``site``
+    """
+    return sum(
+        time
+        for module, time in times.items()
+        if not module.startswith(" ") and module not in startup
+    )
+
+
+def heavy_modules(times: ImportTimes) -> Set[str]:
+    loaded = {module.strip().split(".")[0] for module in times}
+
+    return loaded.intersection(HEAVY_MODULES)
+
+
+def measure(
+    statement: str, rounds: int, startup: ImportTimes
+) -> Tuple[float, Set[str], ImportTimes]:
+    """Return the median import time of ``statement`` over ``rounds`` interpreters, in
+    milliseconds, the heavy modules it loads and the import times of its last round
+    """
+    durations: List[float] = []
+
+    for _ in range(rounds):
+        times = import_times(statement)
+        durations.append(top_level_time(times, startup) / 1000)
+
+    return statistics.median(durations), heavy_modules(times), times
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    parser.add_argument("--max-ms", type=float, help="The maximum import time")
+    parser.add_argument("--show", type=int, default=0, help="Modules to print")
+    args = parser.parse_args(argv)
+
+    startup = import_times("pass")
+    width = max(len(statement) for statement in STATEMENTS)
+    too_slow = False
+
+    for statement in STATEMENTS:
+        duration, heavy, times = measure(statement, args.rounds, startup)
+        print(
+            f"{statement:<{width}} {duration:>8,.1f} ms   "
+            f"heavy: {', '.join(sorted(heavy)) or '-'}"
+        )
+
+        slowest = sorted(
+            (module for module in times if module not in startup),
+            key=lambda module: -times[module],
+        )
+
+        for module in slowest[: args.show]:
+            print(f"    {module.strip():<40} {times[module] / 1000:>8,.1f} ms")
+
+        too_slow |= args.max_ms is not None and duration > args.max_ms
+
+    if too_slow:
+        sys.exit(f"An import took more than {args.max_ms} ms!")
+
+
+if __name__ == "__main__":
+    main()
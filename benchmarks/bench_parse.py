@@ -0,0 +1,92 @@
+"""Compare the cost of reading a ``/api/v3/secrets`` response into secret bundles
+with the pydantic models and with :class:`~infisical.models.raw.RawSecret`.
+
+The decryption is left out to only measure the parsing and bundling.
+
+Run with ``python -m benchmarks.bench_parse`` from the root of the repository.
+"""
+import copy
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from infisical.helpers.secrets import (
+    transform_raw_secret_to_secret_bundle,
+    transform_secret_to_secret_bundle,
+)
+from infisical.models.api import SecretsResponse
+from infisical.models.raw import RawSecret
+
+WORKSPACE_ID = "6437ffd2e7cb0d9b4fa3ff89"
+SECRET_COUNTS = (100, 1_000, 10_000)
+
+
+def make_response(count: int) -> Dict[str, Any]:
+    now = datetime.utcnow().isoformat() + "Z"
+
+    return {
+        "secrets": [
+            {
+                "id": f"{index:024x}",
+                "version": 1,
+                "type": "shared",
+                "secretKeyCiphertext": "a" * 24,
+                "secretKeyIV": "b" * 24,
+                "secretKeyTag": "c" * 24,
+                "secretValueCiphertext": "d" * 64,
+                "secretValueIV": "e" * 24,
+                "secretValueTag": "f" * 24,
+                "createdAt": now,
+                "updatedAt": now,
+            }
+            for index in range(count)
+        ],
+        "imports": [],
+    }
+
+
+def parse_with_pydantic(json_object: Dict[str, Any]) -> None:
+    for obj in json_object["secrets"]:
+        obj["workspace"] = WORKSPACE_ID
+        obj["environment"] = "dev"
+
+    for secret in SecretsResponse.parse_obj(json_object).secrets:
+        transform_secret_to_secret_bundle(secret, "NAME", "VALUE")
+
+
+def parse_raw(json_object: Dict[str, Any]) -> None:
+    last_fetched_at = datetime.now()
+
+    for obj in json_object["secrets"]:
+        transform_raw_secret_to_secret_bundle(
+            RawSecret(obj, WORKSPACE_ID, "dev"), "NAME", "VALUE", last_fetched_at
+        )
+
+
+def measure(parse: Callable[[Dict[str, Any]], None], count: int) -> float:
+    """Return the best rate of ``parse`` over a few rounds, in secrets per second"""
+    responses: List[Dict[str, Any]] = [
+        copy.deepcopy(make_response(count)) for _ in range(5)
+    ]
+    best = float("inf")
+
+    for json_object in responses:
+        start = time.perf_counter()
+        parse(json_object)
+        best = min(best, time.perf_counter() - start)
+
+    return count / best
+
+
+def main() -> None:
+    strategies = {"pydantic": parse_with_pydantic, "raw": parse_raw}
+
+    print(f"{'secrets':>8} " + " ".join(f"{name:>18}" for name in strategies))
+
+    for count in SECRET_COUNTS:
+        rates = [measure(parse, count) for parse in strategies.values()]
+        print(f"{count:>8} " + " ".join(f"{rate:>12,.0f} sec/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
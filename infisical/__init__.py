@@ -1,3 +1,32 @@
-from .client.infisicalclient import InfisicalClient
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["InfisicalClient"]
+if TYPE_CHECKING:
+    from .client.asyncinfisicalclient import AsyncInfisicalClient
+    from .client.infisicalclient import InfisicalClient
+    from .client.infisicalclientpool import InfisicalClientPool
+
+__all__ = ["AsyncInfisicalClient", "InfisicalClient", "InfisicalClientPool"]
+
+# The clients are imported on first access, so that e.g. importing the synchronous
+# client does not import asyncio
+_CLIENT_MODULES = {
+    "AsyncInfisicalClient": ".client.asyncinfisicalclient",
+    "InfisicalClient": ".client.infisicalclient",
+    "InfisicalClientPool": ".client.infisicalclientpool",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _CLIENT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(_CLIENT_MODULES[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> Any:
+    return sorted(list(globals()) + __all__)
@@ -1,18 +1,28 @@
+from typing import TYPE_CHECKING, Any, Union
+
 from infisical.__version__ import __version__
-from infisical.utils.http import BaseUrlSession, get_http_client
+
+if TYPE_CHECKING:
+    from infisical.utils.http import BaseUrlSession, HTTP2Session
 
 USER_AGENT = f"InfisicalPythonSDK/{__version__}"
 
 
-def create_api_request_with_auth(base_url: str, service_token: str) -> BaseUrlSession:
+def create_api_request_with_auth(
+    base_url: str, service_token: str, **http_options: Any
+) -> Union["BaseUrlSession", "HTTP2Session"]:
     """Returns a :class:`requests.Session` with a ``base_url`` and the authorization
     bearer set to the ``service_token``.
 
     :param base_url: The base url to use
     :param service_token: The service token to use as a authorization bearer token
+    :param http_options: The pool, timeout and retry options of :func:`get_http_client`
     :return: A :class:`requests.Session` instance preconfigured
     """
-    api_request = get_http_client(base_url=base_url.rstrip("/"))
+    # The HTTP stack is only imported by the clients sending requests
+    from infisical.utils.http import get_http_client
+
+    api_request = get_http_client(base_url=base_url.rstrip("/"), **http_options)
 
     api_request.headers.update({"User-Agent": USER_AGENT})
     api_request.headers.update({"Content-Type": "application/json"})
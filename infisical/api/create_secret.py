@@ -1,8 +1,12 @@
+from typing import TYPE_CHECKING
+
 from infisical.models.api import CreateSecretDTO, SecretResponse
-from requests import Session
+
+if TYPE_CHECKING:
+    from infisical.utils.http import ApiRequest
 
 
-def create_secret_req(api_request: Session, options: CreateSecretDTO) -> SecretResponse:
+def create_secret_req(api_request: "ApiRequest", options: CreateSecretDTO) -> SecretResponse:
     response = api_request.post(
         url=f"/api/v3/secrets/{options.secret_name}",
         json={
@@ -18,6 +22,7 @@ def create_secret_req(api_request: Session, options: CreateSecretDTO) -> SecretR
             "secretPath": options.path,
         },
     )
+    response.raise_for_status()
 
     json_object = response.json()
 
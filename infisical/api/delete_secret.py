@@ -1,8 +1,14 @@
+from typing import TYPE_CHECKING
+
 from infisical.models.api import DeleteSecretDTO, SecretResponse
-from requests import Session
+
+if TYPE_CHECKING:
+    from infisical.utils.http import ApiRequest
 
 
-def delete_secret_req(api_request: Session, options: DeleteSecretDTO) -> SecretResponse:
+def delete_secret_req(
+    api_request: "ApiRequest", options: DeleteSecretDTO
+) -> SecretResponse:
     response = api_request.delete(
         url=f"/api/v3/secrets/{options.secret_name}",
         json={
@@ -12,6 +18,7 @@ def delete_secret_req(api_request: Session, options: DeleteSecretDTO) -> SecretR
             "secretPath": options.path,
         },
     )
+    response.raise_for_status()
 
     json_object = response.json()
 
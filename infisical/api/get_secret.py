@@ -1,8 +1,40 @@
+import json
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
 from infisical.models.api import GetSecretDTO, SecretResponse
-from requests import Session
+from infisical.utils.validators import ResponseValidator
+
+if TYPE_CHECKING:
+    from infisical.utils.http import ApiRequest
+
+
+def get_secret_req(api_request: "ApiRequest", options: GetSecretDTO) -> SecretResponse:
+    response = api_request.get(
+        url=f"/api/v3/secrets/{options.secret_name}",
+        params={
+            "workspaceId": options.workspace_id,
+            "environment": options.environment,
+            "type": options.type,
+            "secretPath": options.path,
+        },
+    )
+    response.raise_for_status()
+
+    return read_secret(response.json(), options)
+
 
+def get_secret_if_modified_req(
+    api_request: "ApiRequest",
+    options: GetSecretDTO,
+    validator: Optional[ResponseValidator] = None,
+) -> Tuple[Optional[SecretResponse], ResponseValidator]:
+    """Fetch a secret like :func:`get_secret_req`, unless it did not change since the
+    response identified by ``validator``, like
+    :func:`~infisical.api.get_secrets.get_raw_secrets_if_modified_req`.
 
-def get_secret_req(api_request: Session, options: GetSecretDTO) -> SecretResponse:
+    :return: The secret, or ``None`` if it did not change, and the validator of the
+        response
+    """
     response = api_request.get(
         url=f"/api/v3/secrets/{options.secret_name}",
         params={
@@ -11,10 +43,24 @@ def get_secret_req(api_request: Session, options: GetSecretDTO) -> SecretRespons
             "type": options.type,
             "secretPath": options.path,
         },
+        headers=validator.to_headers() if validator else None,
     )
 
-    json_object = response.json()
+    if validator and response.status_code == 304:
+        return None, validator
+
+    response.raise_for_status()
+
+    content = response.content
+    next_validator = ResponseValidator.from_response(response.headers, content)
+
+    if validator and next_validator.content_hash == validator.content_hash:
+        return None, next_validator
+
+    return read_secret(json.loads(content), options), next_validator
+
 
+def read_secret(json_object: Dict[str, Any], options: GetSecretDTO) -> SecretResponse:
     json_object["secret"]["workspace"] = options.workspace_id
     json_object["secret"]["environment"] = options.environment
 
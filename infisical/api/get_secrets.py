@@ -1,8 +1,18 @@
+import json
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
 from infisical.models.api import GetSecretsDTO, SecretsResponse
-from requests import Session
+from infisical.models.raw import RawSecret
+from infisical.utils.stream import JSONStream
+from infisical.utils.validators import ResponseValidator
+
+if TYPE_CHECKING:
+    from infisical.utils.http import ApiRequest
 
+STREAM_CHUNK_SIZE = 64 * 1024
 
-def get_secrets_req(api_request: Session, options: GetSecretsDTO) -> SecretsResponse:
+
+def get_secrets_req(api_request: "ApiRequest", options: GetSecretsDTO) -> SecretsResponse:
     """Send request again Infisical API to fetch secrets.
     See more information on https://infisical.com/docs/api-reference/endpoints/secrets/read
 
@@ -21,6 +31,7 @@ def get_secrets_req(api_request: Session, options: GetSecretsDTO) -> SecretsResp
             "include_imports": str(options.include_imports).lower()
         },
     )
+    response.raise_for_status()
 
     json_object = response.json()
 
@@ -37,3 +48,131 @@ def get_secrets_req(api_request: Session, options: GetSecretsDTO) -> SecretsResp
 
     return (data.secrets if data.secrets else [], data.imports if data.imports else [])
     
+
+
+def get_raw_secrets_req(
+    api_request: "ApiRequest", options: GetSecretsDTO
+) -> Tuple[List[RawSecret], List[RawSecret]]:
+    """Send request again Infisical API to fetch secrets, like :func:`get_secrets_req`
+    but reading the secrets as :class:`RawSecret` without validating the response.
+
+    :param api_request: The :class:`requests.Session` instance used to perform the request
+    :param options: The workspace, environment and path to fetch the secrets of
+    :return: The secrets of the path, and the secrets it imports
+    """
+    response = api_request.get(
+        "/api/v3/secrets",
+        params={
+            "environment": options.environment,
+            "workspaceId": options.workspace_id,
+            "secretPath": options.path,
+            "include_imports": str(options.include_imports).lower(),
+        },
+    )
+    response.raise_for_status()
+
+    return read_raw_secrets(response.json(), options)
+
+
+def get_raw_secrets_if_modified_req(
+    api_request: "ApiRequest",
+    options: GetSecretsDTO,
+    validator: Optional[ResponseValidator] = None,
+) -> Tuple[Optional[Tuple[List[RawSecret], List[RawSecret]]], ResponseValidator]:
+    """Send a request to Infisical API to fetch secrets like :func:`get_raw_secrets_req`,
+    unless they did not change since the response identified by ``validator``.
+
+    The request is conditional on the ETag or Last-Modified date of that response,
+    and a response with the same content is recognized by its hash otherwise.
+
+    :param api_request: The :class:`requests.Session` instance used to perform the request
+    :param options: The workspace, environment and path to fetch the secrets of
+    :param validator: The validator of the previous response, if any
+    :return: The secrets of the path and those it imports, or ``None`` if they did
+        not change, and the validator of the response
+    """
+    response = api_request.get(
+        "/api/v3/secrets",
+        params={
+            "environment": options.environment,
+            "workspaceId": options.workspace_id,
+            "secretPath": options.path,
+            "include_imports": str(options.include_imports).lower(),
+        },
+        headers=validator.to_headers() if validator else None,
+    )
+
+    if validator and response.status_code == 304:
+        return None, validator
+
+    response.raise_for_status()
+
+    content = response.content
+    next_validator = ResponseValidator.from_response(response.headers, content)
+
+    if validator and next_validator.content_hash == validator.content_hash:
+        return None, next_validator
+
+    return read_raw_secrets(json.loads(content), options), next_validator
+
+
+def read_raw_secrets(
+    json_object: Dict[str, Any], options: GetSecretsDTO
+) -> Tuple[List[RawSecret], List[RawSecret]]:
+    secrets = [
+        RawSecret(obj, options.workspace_id, options.environment)
+        for obj in json_object["secrets"]
+    ]
+    imported_secrets = [
+        RawSecret(obj, options.workspace_id, options.environment)
+        for secret_import in json_object.get("imports") or []
+        for obj in secret_import["secrets"]
+    ]
+
+    return secrets, imported_secrets
+
+
+def iter_raw_secrets_req(
+    api_request: "ApiRequest", options: GetSecretsDTO, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[RawSecret]:
+    """Send request again Infisical API to fetch secrets, like :func:`get_raw_secrets_req`
+    but parsing the response while it is received and yielding the secrets one by one,
+    those of the path and those it imports in the order of the response.
+
+    :param api_request: The :class:`requests.Session` instance used to perform the request
+    :param options: The workspace, environment and path to fetch the secrets of
+    :param chunk_size: The number of bytes read from the response at once
+    :return: An iterator over the secrets
+    """
+    with api_request.get(
+        "/api/v3/secrets",
+        params={
+            "environment": options.environment,
+            "workspaceId": options.workspace_id,
+            "secretPath": options.path,
+            "include_imports": str(options.include_imports).lower(),
+        },
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+
+        stream = JSONStream(response.iter_content(chunk_size=chunk_size))
+
+        def iter_secrets() -> Iterator[RawSecret]:
+            for _ in stream.iter_array():
+                yield RawSecret(
+                    stream.read_value(), options.workspace_id, options.environment
+                )
+
+        for key in stream.iter_object():
+            if key == "secrets":
+                yield from iter_secrets()
+            elif key == "imports" and stream.peek() == "[":
+                for _ in stream.iter_array():
+                    for import_key in stream.iter_object():
+                        if import_key == "secrets":
+                            yield from iter_secrets()
+                        else:
+                            stream.read_value()
+            else:
+                stream.read_value()
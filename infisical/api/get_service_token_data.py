@@ -1,9 +1,13 @@
+from typing import TYPE_CHECKING
+
 from infisical.api.models import GetServiceTokenDetailsResponse
-from requests import Session
+
+if TYPE_CHECKING:
+    from infisical.utils.http import ApiRequest
 
 
 def get_service_token_data_req(
-    api_request: Session,
+    api_request: "ApiRequest",
 ) -> GetServiceTokenDetailsResponse:
     """Send request again Infisical API to fetch service token data.
     See more information on https://infisical.com/docs/api-reference/endpoints/service-tokens/get
@@ -1,9 +1,13 @@
+from typing import TYPE_CHECKING
+
 from infisical.api.models import GetServiceTokenKeyResponse
-from requests import Session
+
+if TYPE_CHECKING:
+    from infisical.utils.http import ApiRequest
 
 
 def get_service_token_data_key_req(
-    api_request: Session,
+    api_request: "ApiRequest",
 ) -> GetServiceTokenKeyResponse:
     """Send request again Infisical API to fetch service token data v3 key.
 
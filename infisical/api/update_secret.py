@@ -1,8 +1,14 @@
+from typing import TYPE_CHECKING
+
 from infisical.models.api import SecretResponse, UpdateSecretDTO
-from requests import Session
+
+if TYPE_CHECKING:
+    from infisical.utils.http import ApiRequest
 
 
-def update_secret_req(api_request: Session, options: UpdateSecretDTO) -> SecretResponse:
+def update_secret_req(
+    api_request: "ApiRequest", options: UpdateSecretDTO
+) -> SecretResponse:
     response = api_request.patch(
         url=f"/api/v3/secrets/{options.secret_name}",
         json={
@@ -15,6 +21,7 @@ def update_secret_req(api_request: Session, options: UpdateSecretDTO) -> SecretR
             "secretPath": options.path,
         },
     )
+    response.raise_for_status()
 
     json_object = response.json()
 
@@ -0,0 +1,277 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from infisical.client.infisicalclient import InfisicalClient
+from infisical.constants import INFISICAL_URL
+from infisical.models.models import MergedSecrets, SecretBundle, SecretWriteResult
+from infisical.utils.cache import DEFAULT_MAX_ENTRIES
+from typing_extensions import Literal
+
+T = TypeVar("T")
+
+
+class AsyncInfisicalClient:
+    """asyncio counterpart of :class:`InfisicalClient`.
+
+    Every call is dispatched to a dedicated thread pool of ``max_concurrency``
+    threads, so concurrent calls overlap on the network over kept-alive
+    connections without blocking the event loop. The pool has ``pool_maxsize``
+    threads by default, one per connection of the HTTP connection pool; a larger
+    ``max_concurrency`` runs more calls at once, e.g. over HTTP/2 or with more
+    connections than the pool keeps alive. The secret service, the decryption
+    logic and the cache are the ones of the wrapped :class:`InfisicalClient`,
+    which receives any extra keyword argument.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        token_json: Optional[str] = None,
+        site_url: str = INFISICAL_URL,
+        debug: bool = False,
+        cache_ttl: int = 300,
+        cache_max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_concurrency: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        self.client = InfisicalClient(
+            token=token,
+            token_json=token_json,
+            site_url=site_url,
+            debug=debug,
+            cache_ttl=cache_ttl,
+            cache_max_entries=cache_max_entries,
+            **kwargs,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency
+            if max_concurrency is not None
+            else self.client.pool_maxsize,
+            thread_name_prefix="infisical",
+        )
+
+    async def __aenter__(self) -> "AsyncInfisicalClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
+
+    async def close(self) -> None:
+        """Wait for pending calls, release the thread pool and close the underlying
+        client, see :meth:`InfisicalClient.close`
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, partial(self._executor.shutdown, wait=True))
+        await loop.run_in_executor(None, self.client.close)
+
+    async def get_all_secrets(
+        self,
+        environment: str = "dev",
+        path: str = "/",
+        include_imports: bool = True,
+        attach_to_os_environ: bool = False,
+    ) -> List[SecretBundle]:
+        """Return all the secrets accessible by the instance of Infisical"""
+        return await self._run(
+            self.client.get_all_secrets,
+            environment,
+            path,
+            include_imports,
+            attach_to_os_environ,
+        )
+
+    async def get_all_secrets_many(
+        self,
+        scopes: List[Tuple[str, str]],
+        include_imports: bool = True,
+        attach_to_os_environ: bool = False,
+    ) -> MergedSecrets:
+        """Return the secrets of several environments and paths, fetched concurrently
+        and merged into one secret per name
+
+        :param scopes: The ``(environment, path)`` pairs to fetch, by increasing precedence
+        :return: Secret bundles ordered by the first scope and position of their name,
+            and the outcome of each scope
+        """
+        return await self._run(
+            self.client.get_all_secrets_many,
+            scopes,
+            include_imports,
+            attach_to_os_environ,
+        )
+
+    async def get_secret(
+        self,
+        secret_name: str,
+        type: Literal["shared", "personal"] = "personal",
+        environment: str = "dev",
+        path: str = "/",
+    ) -> SecretBundle:
+        """Return secret with name `secret_name`
+
+        :param secret_name: Key of secret
+        :param type: Type of secret that is either "shared" or "personal"
+        :return: Secret bundle for secret with name `secret_name`
+        """
+        return await self._run(
+            self.client.get_secret, secret_name, type, environment, path
+        )
+
+    async def get_secrets(
+        self,
+        secret_names: List[str],
+        type: Literal["shared", "personal"] = "personal",
+        environment: str = "dev",
+        path: str = "/",
+    ) -> List[SecretBundle]:
+        """Return secrets with names `secret_names` fetched in a single request
+
+        :param secret_names: Keys of secrets
+        :param type: Type of secrets that is either "shared" or "personal"
+        :return: Secret bundles for secrets with names `secret_names`, in the same order
+        """
+        return await self._run(
+            self.client.get_secrets, secret_names, type, environment, path
+        )
+
+    async def create_secret(
+        self,
+        secret_name: str,
+        secret_value: str,
+        type: Literal["shared", "personal"] = "shared",
+        environment: str = "dev",
+        path: str = "/",
+    ) -> SecretBundle:
+        """Create secret with name `secret_name` and value `secret_value`
+
+        :param secret_name: Name of secret to create
+        :param secret_value: Value of secret to create
+        :param type: Type of secret to create that is either "shared" or "personal"
+        :return: Secret bundle for created secret with name `secret_name`
+        """
+        return await self._run(
+            self.client.create_secret,
+            secret_name,
+            secret_value,
+            type,
+            environment,
+            path,
+        )
+
+    async def update_secret(
+        self,
+        secret_name: str,
+        secret_value: str,
+        type: Literal["shared", "personal"] = "shared",
+        environment: str = "dev",
+        path: str = "/",
+    ) -> SecretBundle:
+        """Update secret with name `secret_name` and value `secret_value`
+
+        :param secret_name: Name of secret to update
+        :param secret_value: New value of secret to update
+        :param type: Type of secret to update that is either "shared" or "personal"
+        :return: Secret bundle for updated secret with name `secret_name`
+        """
+        return await self._run(
+            self.client.update_secret,
+            secret_name,
+            secret_value,
+            type,
+            environment,
+            path,
+        )
+
+    async def delete_secret(
+        self,
+        secret_name: str,
+        type: Literal["shared", "personal"] = "shared",
+        environment: str = "dev",
+        path: str = "/",
+    ) -> SecretBundle:
+        """Delete secret with name `secret_name`
+
+        :param secret_name: Name of secret to delete
+        :param type: Type of secret to update that is either "shared" or "personal"
+        :return: Secret bundle for updated secret with name `secret_name`
+        """
+        return await self._run(
+            self.client.delete_secret, secret_name, type, environment, path
+        )
+
+    async def create_secrets(
+        self,
+        secrets: List[Tuple[str, str]],
+        type: Literal["shared", "personal"] = "shared",
+        environment: str = "dev",
+        path: str = "/",
+        max_concurrency: Optional[int] = None,
+    ) -> List[SecretWriteResult]:
+        """Create secrets from the `(secret_name, secret_value)` pairs `secrets`
+
+        :param secrets: Names and values of secrets to create
+        :param max_concurrency: Maximum number of requests sent at the same time, `pool_maxsize` by default
+        :return: Result, with the secret bundle or the error, of each secret in the same order
+        """
+        return await self._run(
+            self.client.create_secrets,
+            secrets,
+            type,
+            environment,
+            path,
+            max_concurrency,
+        )
+
+    async def update_secrets(
+        self,
+        secrets: List[Tuple[str, str]],
+        type: Literal["shared", "personal"] = "shared",
+        environment: str = "dev",
+        path: str = "/",
+        max_concurrency: Optional[int] = None,
+    ) -> List[SecretWriteResult]:
+        """Update secrets from the `(secret_name, secret_value)` pairs `secrets`
+
+        :param secrets: Names and new values of secrets to update
+        :param max_concurrency: Maximum number of requests sent at the same time, `pool_maxsize` by default
+        :return: Result, with the secret bundle or the error, of each secret in the same order
+        """
+        return await self._run(
+            self.client.update_secrets,
+            secrets,
+            type,
+            environment,
+            path,
+            max_concurrency,
+        )
+
+    async def delete_secrets(
+        self,
+        secret_names: List[str],
+        type: Literal["shared", "personal"] = "shared",
+        environment: str = "dev",
+        path: str = "/",
+        max_concurrency: Optional[int] = None,
+    ) -> List[SecretWriteResult]:
+        """Delete secrets with names `secret_names`
+
+        :param secret_names: Names of secrets to delete
+        :param max_concurrency: Maximum number of requests sent at the same time, `pool_maxsize` by default
+        :return: Result, with the secret bundle or the error, of each secret in the same order
+        """
+        return await self._run(
+            self.client.delete_secrets,
+            secret_names,
+            type,
+            environment,
+            path,
+            max_concurrency,
+        )
@@ -1,30 +1,65 @@
 import json
-from typing import Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple, Union
 
 from infisical.api import create_api_request_with_auth
 from infisical.constants import (
     AUTH_MODE_SERVICE_TOKEN,
     AUTH_MODE_SERVICE_TOKEN_V3,
+    CACHE_REFRESH_JITTER,
+    DEFAULT_POOLSIZE,
+    DEFAULT_TIMEOUT,
     INFISICAL_URL,
     SERVICE_TOKEN_REGEX,
 )
 from infisical.exceptions import InfisicalTokenError
 from infisical.helpers.client import (
     create_secret_helper,
+    create_secrets_helper,
     delete_secret_helper,
+    delete_secrets_helper,
     get_all_secrets_helper,
+    get_all_secrets_many_helper,
     get_secret_helper,
+    get_secrets_helper,
+    iter_secrets_helper,
+    poll_secrets_helper,
+    restore_snapshot,
     update_secret_helper,
+    update_secrets_helper,
 )
-from infisical.models.models import SecretBundle
+from infisical.models.models import MergedSecrets, SecretBundle, SecretWriteResult
 from infisical.models.secret_service import ClientConfig
+from infisical.utils.cache import DEFAULT_MAX_ENTRIES, SecretCache
 from infisical.utils.crypto import (
     create_symmetric_key_helper,
     decrypt_symmetric_helper,
     encrypt_symmetric_helper,
 )
+from infisical.utils.instrumentation import Instrumentation
+from infisical.utils.refresher import BackgroundRefresher
+from infisical.utils.registry import (
+    SharedClientState,
+    client_state_registry,
+    get_registry_key,
+)
+from infisical.utils.singleflight import SingleFlight
+from infisical.utils.snapshot import SecretSnapshot
+from infisical.utils.sync import SecretSyncState
+from infisical.utils.validators import ResponseValidatorCache
+from infisical.utils.watcher import SecretChangesCallback, SecretWatch, SecretWatcher
 from typing_extensions import Literal
 
+if TYPE_CHECKING:
+    from infisical.utils.http import (
+        BaseUrlSession,
+        ConnectionPool,
+        HTTP2Session,
+        PoolStats,
+    )
+
 
 class InfisicalClient:
     def __init__(
@@ -34,9 +69,71 @@ class InfisicalClient:
         site_url: str = INFISICAL_URL,
         debug: bool = False,
         cache_ttl: int = 300,
+        cache_max_entries: int = DEFAULT_MAX_ENTRIES,
+        background_refresh: bool = False,
+        cache_max_stale: int = 3600,
+        snapshot_path: Optional[str] = None,
+        share_snapshot: bool = False,
+        incremental_sync: bool = False,
+        decryption_workers: int = 1,
+        lazy_decrypt: bool = False,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = False,
+        connect_timeout: float = DEFAULT_TIMEOUT,
+        read_timeout: float = DEFAULT_TIMEOUT,
+        retries: int = 3,
+        backoff_factor: float = 1,
+        http2: bool = False,
+        conditional_requests: bool = False,
+        share_state: bool = False,
+        connection_pool: Optional["ConnectionPool"] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ):
-        self.cache: Dict[str, SecretBundle] = {}
+        if share_snapshot and not snapshot_path:
+            raise ValueError("A snapshot_path is required to share the snapshot!")
+
+        self.background_refresh = background_refresh
+        self.cache = SecretCache(
+            ttl=cache_ttl,
+            max_entries=cache_max_entries,
+            max_stale=cache_max_stale if background_refresh else 0,
+            jitter=CACHE_REFRESH_JITTER if background_refresh else 0,
+            instrumentation=instrumentation,
+        )
+        self.refresher = BackgroundRefresher()
+        self.watcher = SecretWatcher(partial(poll_secrets_helper, self))
+        self.flights = SingleFlight()
+        self.sync_state = SecretSyncState() if incremental_sync else None
+        self.validators = ResponseValidatorCache() if conditional_requests else None
+        self.lazy_decrypt = lazy_decrypt
+        self.instrumentation = instrumentation
+        self.decryption_executor = (
+            ThreadPoolExecutor(
+                max_workers=decryption_workers, thread_name_prefix="infisical-decrypt"
+            )
+            if decryption_workers > 1
+            else None
+        )
         self.client_config: Optional[ClientConfig] = None
+        self._api_request: Optional[Union["BaseUrlSession", "HTTP2Session"]] = None
+        self._api_request_factory: Optional[
+            Callable[[], Union["BaseUrlSession", "HTTP2Session"]]
+        ] = None
+        self._api_request_lock = threading.Lock()
+        self.pool_maxsize = pool_maxsize
+        self.connection_pool = connection_pool
+        http_options = {
+            "retries": retries,
+            "backoff_factor": backoff_factor,
+            "timeout": (connect_timeout, read_timeout),
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "http2": http2,
+            "connection_pool": connection_pool,
+            "instrumentation": instrumentation,
+        }
 
         if token and token != "":
             token_match = SERVICE_TOKEN_REGEX.fullmatch(token)
@@ -53,7 +150,9 @@ class InfisicalClient:
                 cache_ttl=cache_ttl,
             )
 
-            self.api_request = create_api_request_with_auth(site_url, service_token)
+            self._api_request_factory = partial(
+                create_api_request_with_auth, site_url, service_token, **http_options
+            )
         
         if token_json and token_json != "":
             token_dict = json.loads(token_json)
@@ -67,12 +166,103 @@ class InfisicalClient:
                 cache_ttl=cache_ttl
             )
 
-            self.api_request = create_api_request_with_auth(site_url, token_dict["serviceToken"])
+            self._api_request_factory = partial(
+                create_api_request_with_auth,
+                site_url,
+                token_dict["serviceToken"],
+                **http_options,
+            )
+
+        self.shared_state: Optional[SharedClientState] = None
+        token_key = token_json or token
+
+        if (
+            share_state
+            and token_key
+            and self.client_config
+            and self._api_request_factory
+        ):
+            # Clients created with any option changing what is cached, or how it is
+            # fetched, get a state of their own
+            self.shared_state = client_state_registry.register(
+                get_registry_key(
+                    site_url,
+                    token_key,
+                    cache_ttl,
+                    cache_max_entries,
+                    background_refresh,
+                    cache_max_stale,
+                    snapshot_path,
+                    share_snapshot,
+                    incremental_sync,
+                    lazy_decrypt,
+                    conditional_requests,
+                    *http_options.values(),
+                ),
+                partial(
+                    SharedClientState,
+                    self._api_request_factory,
+                    self.client_config,
+                    self.cache,
+                    self.flights,
+                ),
+            )
+
+            self.client_config = self.shared_state.client_config
+            self.cache = self.shared_state.cache
+            self.flights = self.shared_state.flights
 
         self.debug = debug
 
+        self.snapshot = SecretSnapshot(snapshot_path) if snapshot_path else None
+        self.share_snapshot = share_snapshot
+        restore_snapshot(self)
+
         print("WARNING: You are using a deprecated version of the Infisical SDK. Please use the new Infisical SDK found here: https://pypi.org/project/infisical-python/")
 
+    @property
+    def api_request(self) -> Union["BaseUrlSession", "HTTP2Session"]:
+        """The HTTP session of the client, created on first use so that clients only
+        reading their snapshot or cache never import the HTTP stack
+        """
+        if self._api_request is None:
+            if self.shared_state is not None:
+                return self.shared_state.api_request
+
+            if self._api_request_factory is None:
+                raise AttributeError("The client has no token to send requests with!")
+
+            with self._api_request_lock:
+                if self._api_request is None:
+                    self._api_request = self._api_request_factory()
+
+        return self._api_request
+
+    @api_request.setter
+    def api_request(self, api_request: Union["BaseUrlSession", "HTTP2Session"]) -> None:
+        self._api_request = api_request
+
+    def close(self) -> None:
+        """Stop the background refreshes, the watches and the decryption threads of
+        the client, and close its connections unless they are shared with other
+        clients. The client must not be used afterwards.
+        """
+        self.watcher.close()
+        self.refresher.close()
+
+        if self.decryption_executor is not None:
+            self.decryption_executor.shutdown(wait=True)
+            self.decryption_executor = None
+
+        # A session, or connection pool, shared with other clients stays open for them,
+        # and a session that was never created needs no closing
+        if (
+            self._api_request is not None
+            and self.shared_state is None
+            and self.connection_pool is None
+        ):
+            self._api_request.close()
+
     def get_all_secrets(
         self, 
         environment: str = "dev", 
@@ -83,6 +273,65 @@ class InfisicalClient:
         """Return all the secrets accessible by the instance of Infisical"""
         return get_all_secrets_helper(self, environment, path, include_imports, attach_to_os_environ)
 
+    def get_all_secrets_many(
+        self,
+        scopes: List[Tuple[str, str]],
+        include_imports: bool = True,
+        attach_to_os_environ: bool = False,
+    ) -> MergedSecrets:
+        """Return the secrets of several environments and paths, fetched concurrently
+        and merged into one secret per name
+
+        :param scopes: The ``(environment, path)`` pairs to fetch, by increasing precedence
+        :param include_imports: Whether to also return the secrets imported by the paths
+        :param attach_to_os_environ: Whether to attach the merged secrets to `os.environ`
+        :return: Secret bundles ordered by the first scope and position of their name,
+            and the outcome of each scope, a scope that failed being merged as empty
+        """
+        return get_all_secrets_many_helper(
+            self, scopes, include_imports, attach_to_os_environ
+        )
+
+    def iter_secrets(
+        self,
+        environment: str = "dev",
+        path: str = "/",
+        include_imports: bool = True,
+    ) -> Iterator[SecretBundle]:
+        """Yield the secrets accessible by the instance of Infisical one by one, while
+        the response is received, without caching them
+
+        :param environment: The environment to fetch the secrets of
+        :param path: The path to fetch the secrets of
+        :param include_imports: Whether to also yield the secrets imported by the path
+        :return: An iterator over the secret bundles
+        """
+        return iter_secrets_helper(self, environment, path, include_imports)
+
+    def watch(
+        self,
+        environment: str,
+        path: str,
+        callback: SecretChangesCallback,
+        include_imports: bool = True,
+        interval: Optional[float] = None,
+    ) -> SecretWatch:
+        """Call `callback` with the secrets added, changed and removed in `environment`
+        and `path`, polled in the background
+
+        :param environment: The environment to watch
+        :param path: The path to watch
+        :param callback: Called with the :class:`SecretChanges` found by each poll
+        :param include_imports: Whether to also watch the secrets imported by the path
+        :param interval: How often to poll, in seconds, defaults to `cache_ttl`
+        :return: The watch, to `cancel()` when the changes are not needed anymore
+        """
+        return self.watcher.watch(
+            (environment, path, include_imports),
+            callback,
+            interval if interval is not None else self.cache.ttl,
+        )
+
     def get_secret(
         self,
         secret_name: str,
@@ -98,6 +347,21 @@ class InfisicalClient:
         """
         return get_secret_helper(self, secret_name, type, environment, path)
 
+    def get_secrets(
+        self,
+        secret_names: List[str],
+        type: Literal["shared", "personal"] = "personal",
+        environment: str = "dev",
+        path: str = "/",
+    ) -> List[SecretBundle]:
+        """Return secrets with names `secret_names` fetched in a single request
+
+        :param secret_names: Keys of secrets
+        :param type: Type of secrets that is either "shared" or "personal"
+        :return: Secret bundles for secrets with names `secret_names`, in the same order
+        """
+        return get_secrets_helper(self, secret_names, type, environment, path)
+
     def create_secret(
         self,
         secret_name: str,
@@ -151,6 +415,72 @@ class InfisicalClient:
         """
         return delete_secret_helper(self, secret_name, type, environment, path)
 
+    def create_secrets(
+        self,
+        secrets: List[Tuple[str, str]],
+        type: Literal["shared", "personal"] = "shared",
+        environment: str = "dev",
+        path: str = "/",
+        max_concurrency: Optional[int] = None,
+    ) -> List[SecretWriteResult]:
+        """Create secrets from the `(secret_name, secret_value)` pairs `secrets`
+
+        :param secrets: Names and values of secrets to create
+        :param type: Type of secrets to create that is either "shared" or "personal"
+        :param max_concurrency: Maximum number of requests sent at the same time, `pool_maxsize` by default
+        :return: Result, with the secret bundle or the error, of each secret in the same order
+        """
+        return create_secrets_helper(
+            self, secrets, type, environment, path, max_concurrency
+        )
+
+    def update_secrets(
+        self,
+        secrets: List[Tuple[str, str]],
+        type: Literal["shared", "personal"] = "shared",
+        environment: str = "dev",
+        path: str = "/",
+        max_concurrency: Optional[int] = None,
+    ) -> List[SecretWriteResult]:
+        """Update secrets from the `(secret_name, secret_value)` pairs `secrets`
+
+        :param secrets: Names and new values of secrets to update
+        :param type: Type of secrets to update that is either "shared" or "personal"
+        :param max_concurrency: Maximum number of requests sent at the same time, `pool_maxsize` by default
+        :return: Result, with the secret bundle or the error, of each secret in the same order
+        """
+        return update_secrets_helper(
+            self, secrets, type, environment, path, max_concurrency
+        )
+
+    def delete_secrets(
+        self,
+        secret_names: List[str],
+        type: Literal["shared", "personal"] = "shared",
+        environment: str = "dev",
+        path: str = "/",
+        max_concurrency: Optional[int] = None,
+    ) -> List[SecretWriteResult]:
+        """Delete secrets with names `secret_names`
+
+        :param secret_names: Names of secrets to delete
+        :param type: Type of secrets to delete that is either "shared" or "personal"
+        :param max_concurrency: Maximum number of requests sent at the same time, `pool_maxsize` by default
+        :return: Result, with the secret bundle or the error, of each secret in the same order
+        """
+        return delete_secrets_helper(
+            self, secret_names, type, environment, path, max_concurrency
+        )
+
+    def get_pool_stats(self) -> List["PoolStats"]:
+        """Return the statistics of the HTTP connection pool of each host, e.g. to size
+        `pool_maxsize`: more `num_connections` than `maxsize` means that connections
+        were opened then discarded because the pool was full
+        """
+        from infisical.utils.http import get_pool_stats
+
+        return get_pool_stats(self._api_request) if self._api_request is not None else []
+
     def create_symmetric_key(self) -> str:
         """Create a base64-encoded, 256-bit symmetric key"""
         return create_symmetric_key_helper()
@@ -0,0 +1,244 @@
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, List, NamedTuple, Optional
+
+from infisical.client.infisicalclient import InfisicalClient
+from infisical.constants import INFISICAL_URL
+from infisical.exceptions import InfisicalTokenError
+from infisical.utils.cache import DEFAULT_MAX_ENTRIES
+from infisical.utils.registry import RegistryKey, get_registry_key
+
+if TYPE_CHECKING:
+    from infisical.utils.http import ApiRequest, ConnectionPool
+
+DEFAULT_MAX_CACHED_SECRETS = 10000
+
+
+class ClientPoolStats(NamedTuple):
+    tenants: int
+    cached_secrets: int
+    evictions: int
+
+
+class InfisicalClientPool:
+    """The clients of many service tokens of the same Infisical instance, e.g. in a
+    gateway serving hundreds of projects.
+
+    Clients are created on the first :meth:`get_client` call of their token and
+    fetch their project key on their first request, so tenants that are never used
+    cost nothing. All of them send their requests over the connection pool of the
+    first one to send a request, instead of one pool per token.
+
+    The secrets cached by all the clients are bounded by ``max_cached_secrets``:
+    once they hold more, whether after a new client or a fetch of any of them, the
+    least recently used tenants are evicted, clearing their cache and closing their
+    client. An evicted tenant gets a new client on its next :meth:`get_client`
+    call, so clients should not be kept across calls.
+
+    :param site_url: The URL of the Infisical instance of every client
+    :param max_cached_secrets: The maximum number of secrets cached by all clients
+    :param client_options: The options of :class:`InfisicalClient` given to every
+        client, except the token and the connection pool
+    """
+
+    def __init__(
+        self,
+        site_url: str = INFISICAL_URL,
+        max_cached_secrets: int = DEFAULT_MAX_CACHED_SECRETS,
+        **client_options: Any,
+    ):
+        if max_cached_secrets < 1:
+            raise ValueError("The pool must be able to cache at least one secret!")
+
+        if "share_state" in client_options or "connection_pool" in client_options:
+            raise ValueError("The clients of a pool already share their connections!")
+
+        # A single tenant never caches more than the whole pool can
+        client_options["cache_max_entries"] = min(
+            client_options.get("cache_max_entries", DEFAULT_MAX_ENTRIES),
+            max_cached_secrets,
+        )
+
+        self.site_url = site_url
+        self.max_cached_secrets = max_cached_secrets
+        self.client_options = client_options
+        self.evictions = 0
+        self._clients: "OrderedDict[RegistryKey, InfisicalClient]" = OrderedDict()
+        self._connection_pool: Optional["ConnectionPool"] = None
+        self._connection_pool_lock = threading.Lock()
+        self._lock = threading.Lock()
+        # Kept up to date by the caches of the clients, instead of summing them
+        self._cached_secrets = 0
+        self._cached_secrets_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get_client(
+        self, token: Optional[str] = None, token_json: Optional[str] = None
+    ) -> InfisicalClient:
+        """Return the client of the service token ``token`` or ``token_json``,
+        creating it if needed
+
+        :param token: A service token
+        :param token_json: A service token V3, as JSON
+        :return: The client of the token, shared by all the callers using it
+        """
+        key = self._get_key(token, token_json)
+
+        with self._lock:
+            client = self._clients.get(key)
+
+            if client is None:
+                client = InfisicalClient(
+                    token=token,
+                    token_json=token_json,
+                    site_url=self.site_url,
+                    **self.client_options,
+                )
+                # The session is only created, on the pool of the others, by the
+                # first request of the client
+                client._api_request_factory = partial(
+                    self._create_api_request, client, client._api_request_factory
+                )
+
+                # The cache of a new client may hold the secrets of its snapshot
+                self._count_cached_secrets(len(client.cache))
+                client.cache.on_resize = partial(self._on_cache_resize, key)
+                self._clients[key] = client
+            else:
+                self._clients.move_to_end(key)
+
+            evicted_clients = self._evict_idle_tenants(key)
+
+        self._close(evicted_clients)
+
+        return client
+
+    def remove(
+        self, token: Optional[str] = None, token_json: Optional[str] = None
+    ) -> bool:
+        """Release the client of a token, e.g. once it was revoked
+
+        :return: Whether the token had a client
+        """
+        key = self._get_key(token, token_json)
+
+        with self._lock:
+            client = self._clients.pop(key, None)
+
+            if client is not None:
+                self._detach(client)
+
+        if client is None:
+            return False
+
+        self._close([client])
+
+        return True
+
+    def stats(self) -> ClientPoolStats:
+        with self._lock:
+            return ClientPoolStats(
+                tenants=len(self._clients),
+                cached_secrets=self._cached_secrets,
+                evictions=self.evictions,
+            )
+
+    def close(self) -> None:
+        """Release every client and close the connections they share"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+            for client in clients:
+                self._detach(client)
+
+        self._close(clients)
+
+        with self._connection_pool_lock:
+            connection_pool, self._connection_pool = self._connection_pool, None
+
+        if connection_pool is not None:
+            connection_pool.close()
+
+    def _get_key(self, token: Optional[str], token_json: Optional[str]) -> RegistryKey:
+        credentials = token_json or token
+
+        if not credentials:
+            raise InfisicalTokenError("A token or token_json is required!")
+
+        return get_registry_key(self.site_url, credentials)
+
+    def _create_api_request(
+        self, client: InfisicalClient, create_api_request: Callable[..., "ApiRequest"]
+    ) -> "ApiRequest":
+        """Create the session of ``client`` on the connection pool of the clients, the
+        first session providing it
+        """
+        with self._connection_pool_lock:
+            api_request = create_api_request(connection_pool=self._connection_pool)
+
+            if self._connection_pool is None:
+                from infisical.utils.http import get_connection_pool
+
+                self._connection_pool = get_connection_pool(api_request)
+
+            # The pool is closed by the pool of clients, never by one of them
+            client.connection_pool = self._connection_pool
+
+        return api_request
+
+    def _count_cached_secrets(self, change: int) -> bool:
+        """Count the change of the secrets cached by a client
+
+        :return: Whether the clients cache more secrets than the budget
+        """
+        with self._cached_secrets_lock:
+            self._cached_secrets += change
+
+            return self._cached_secrets > self.max_cached_secrets
+
+    def _on_cache_resize(self, key: RegistryKey, change: int) -> None:
+        if not self._count_cached_secrets(change) or change < 0:
+            return
+
+        with self._lock:
+            evicted_clients = self._evict_idle_tenants(key)
+
+        self._close(evicted_clients)
+
+    def _evict_idle_tenants(self, in_use: RegistryKey) -> List[InfisicalClient]:
+        """Evict the least recently used tenants while the clients cache more secrets
+        than the budget, and return their clients to close once the lock is released
+
+        :param in_use: The tenant in use, never evicted since its cache is bounded
+        """
+        evicted_clients: List[InfisicalClient] = []
+
+        for key in list(self._clients):
+            if self._cached_secrets <= self.max_cached_secrets:
+                break
+
+            if key != in_use:
+                client = self._clients.pop(key)
+                self._detach(client)
+                evicted_clients.append(client)
+                self.evictions += 1
+
+        return evicted_clients
+
+    def _detach(self, client: InfisicalClient) -> None:
+        # The cache stops counting towards the budget before it is cleared, in case
+        # a caller still holding the client fills it again
+        client.cache.on_resize = None
+        self._count_cached_secrets(-len(client.cache))
+
+    @staticmethod
+    def _close(clients: List[InfisicalClient]) -> None:
+        # Closing a client waits for its pending decryptions, so the clients are
+        # closed once the lock of the pool is released
+        for client in clients:
+            client.close()
+            client.cache.clear()
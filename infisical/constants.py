@@ -4,4 +4,11 @@ INFISICAL_URL = "https://app.infisical.com"
 AUTH_MODE_SERVICE_TOKEN = "service_token"
 AUTH_MODE_SERVICE_TOKEN_V3 = "service_token_v3"
 
+# Defaults of the HTTP session, defined here so that they do not import requests
+DEFAULT_TIMEOUT = 40  # seconds
+DEFAULT_POOLSIZE = 10  # Like requests
+
+# Share of the cache ttl randomly removed from each entry when refreshing in background
+CACHE_REFRESH_JITTER = 0.1
+
 SERVICE_TOKEN_REGEX = re.compile(r"(st\.[a-f0-9-]+\.[a-f0-9]+)\.([a-f0-9]+)")
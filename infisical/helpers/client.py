@@ -1,6 +1,9 @@
 import os
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -8,94 +11,553 @@ if TYPE_CHECKING:
     from infisical import InfisicalClient
 
 from infisical.logger import logger
-from infisical.models.models import SecretBundle
+from infisical.models.models import (
+    MergedSecrets,
+    SecretBundle,
+    SecretScopeResult,
+    SecretWriteResult,
+)
+from infisical.models.secret_service import ClientConfig, WorkspaceConfig
 from infisical.services.secret_service import SecretService
+from infisical.utils.cache import CacheKey
+from infisical.utils.snapshot import ScopeKey
+from infisical.utils.validators import ResponseValidatorCache
 
+WORKSPACE_CONFIG_FLIGHT = "workspace_config"
 
-def get_all_secrets_helper(instance: "InfisicalClient", environment: str, path: str, include_imports: bool, attach_to_os_environ: bool):
-    try:
-        if not instance.client_config:
-            raise Exception("Failed to find client config")
 
-        if not instance.client_config.workspace_config:
-            instance.client_config.workspace_config = (
-                SecretService.populate_client_config(
+def ensure_workspace_config(instance: "InfisicalClient") -> WorkspaceConfig:
+    """Return the workspace config of ``instance``, fetching it on first use.
+
+    Concurrent first calls share a single bootstrap request.
+    """
+    client_config = instance.client_config
+
+    if not client_config:
+        raise Exception("Failed to find client config")
+
+    if client_config.workspace_config:
+        return client_config.workspace_config
+
+    return instance.flights.do(
+        WORKSPACE_CONFIG_FLIGHT,
+        partial(bootstrap_workspace_config, instance, client_config),
+    )
+
+
+def bootstrap_workspace_config(
+    instance: "InfisicalClient", client_config: ClientConfig
+) -> WorkspaceConfig:
+    """Fetch the workspace config of ``client_config`` and store it, reading it from
+    the shared snapshot when another process of the host already fetched it.
+    """
+    if client_config.workspace_config:
+        return client_config.workspace_config
+
+    start = time.perf_counter()
+    snapshot = instance.snapshot
+
+    if instance.share_snapshot and snapshot is not None:
+        # The first process of the host to get here fetches the key for all
+        with snapshot.lock():
+            key_envelope = snapshot.key_envelope if snapshot.load() else None
+
+            if key_envelope is not None:
+                workspace_config = SecretService.open_workspace_key_envelope(
+                    key_envelope=key_envelope,
+                    client_config=client_config,
+                )
+            else:
+                workspace_config = SecretService.populate_client_config(
                     api_request=instance.api_request,
-                    client_config=instance.client_config,
+                    client_config=client_config,
                 )
-            )
 
-        secret_bundles = SecretService.get_decrypted_secrets(
+                if workspace_config.key_envelope is not None:
+                    snapshot.save(
+                        key_envelope=workspace_config.key_envelope,
+                        workspace_key=workspace_config.workspace_key,
+                    )
+    else:
+        workspace_config = SecretService.populate_client_config(
             api_request=instance.api_request,
-            workspace_id=instance.client_config.workspace_config.workspace_id,
-            environment=environment,
-            path=path,
-            workspace_key=instance.client_config.workspace_config.workspace_key,
-            include_imports=include_imports
+            client_config=client_config,
+        )
+
+    client_config.workspace_config = workspace_config
+
+    if instance.instrumentation is not None:
+        instance.instrumentation.on_bootstrap(time.perf_counter() - start)
+
+    return workspace_config
+
+
+def get_all_secrets_helper(instance: "InfisicalClient", environment: str, path: str, include_imports: bool, attach_to_os_environ: bool) -> List[SecretBundle]:
+    try:
+        secret_bundles = get_scope_secrets(
+            instance, (environment, path, include_imports)
         )
+    except Exception:
+        return [SecretService.get_fallback_secret(secret_name="")]
 
+    if attach_to_os_environ:
         for secret_bundle in secret_bundles:
-            cache_key = f"{secret_bundle.type}-{secret_bundle.secret_name}"
-            instance.cache[cache_key] = secret_bundle
-            if attach_to_os_environ:
+            if secret_bundle.secret_value is not None:
                 os.environ[secret_bundle.secret_name] = secret_bundle.secret_value
 
-        return secret_bundles
+    return secret_bundles
+
+
+def get_scope_secrets(
+    instance: "InfisicalClient", scope_key: ScopeKey
+) -> List[SecretBundle]:
+    """Return the secrets of ``scope_key``, from its snapshot if they cannot be
+    fetched, or raise the error of the fetch without snapshot
+    """
+    try:
+        ensure_workspace_config(instance)
+
+        if instance.share_snapshot:
+            return refresh_shared_scope(instance, scope_key)
+
+        return fetch_all_secrets(instance, scope_key)
     except Exception as exc:
         if instance.debug:
             logger.exception(exc)
 
-    return [SecretService.get_fallback_secret(secret_name="")]
+        snapshot_secrets = get_snapshot_secrets(instance, scope_key)
 
+        if snapshot_secrets is None:
+            raise
 
-def get_secret_helper(
+        return snapshot_secrets[0]
+
+
+def get_all_secrets_many_helper(
+    instance: "InfisicalClient",
+    scopes: List[Tuple[str, str]],
+    include_imports: bool,
+    attach_to_os_environ: bool,
+) -> MergedSecrets:
+    """Fetch the secrets of every ``(environment, path)`` of ``scopes`` concurrently
+    and merge them, keeping one secret per name.
+
+    Within a scope, a personal secret wins over a shared one, then a secret of the
+    path wins over an imported one; across scopes, the last scope wins. Secrets are
+    ordered by the first scope and position where their name appears. A scope that
+    cannot be fetched is reported with its error, and merged as if it had no secret.
+    """
+
+    def get_scope_result(scope: Tuple[str, str]) -> SecretScopeResult:
+        environment, path = scope
+
+        try:
+            secret_bundles = get_scope_secrets(
+                instance, (environment, path, include_imports)
+            )
+        except Exception as exc:
+            return SecretScopeResult(
+                environment=environment, path=path, secret_bundles=[], error=exc
+            )
+
+        return SecretScopeResult(
+            environment=environment,
+            path=path,
+            secret_bundles=secret_bundles,
+            error=None,
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(len(scopes), instance.pool_maxsize))
+    ) as executor:
+        scope_results = list(executor.map(get_scope_result, scopes))
+
+    merged_secret_bundles: Dict[str, SecretBundle] = {}
+
+    for scope_result in scope_results:
+        winners: Dict[str, SecretBundle] = {}
+
+        # Secrets of the path come first, then the imported ones
+        for secret_bundle in scope_result.secret_bundles:
+            winner = winners.get(secret_bundle.secret_name)
+
+            if winner is None or (
+                winner.type == "shared" and secret_bundle.type == "personal"
+            ):
+                winners[secret_bundle.secret_name] = secret_bundle
+
+        for secret_name, secret_bundle in winners.items():
+            merged_secret_bundles[secret_name] = secret_bundle
+
+    if attach_to_os_environ:
+        for secret_bundle in merged_secret_bundles.values():
+            if secret_bundle.secret_value is not None:
+                os.environ[secret_bundle.secret_name] = secret_bundle.secret_value
+
+    return MergedSecrets(
+        secret_bundles=list(merged_secret_bundles.values()), scopes=scope_results
+    )
+
+
+def fetch_all_secrets(
+    instance: "InfisicalClient", scope_key: ScopeKey
+) -> List[SecretBundle]:
+    """Fetch all the secrets of ``scope_key`` from Infisical, cache them and store
+    them in the snapshot, if any.
+
+    Concurrent fetches of the same scope share a single request. With incremental
+    sync, only the secrets that changed since the previous fetch are decrypted.
+    """
+    environment, path, include_imports = scope_key
+    workspace_config = ensure_workspace_config(instance)
+
+    def fetch() -> List[SecretBundle]:
+        validators = instance.validators
+
+        if validators is not None:
+            secret_bundles = revalidate_all_secrets(instance, validators, scope_key)
+        elif instance.sync_state is None:
+            secret_bundles = SecretService.get_decrypted_secrets(
+                api_request=instance.api_request,
+                workspace_id=workspace_config.workspace_id,
+                environment=environment,
+                path=path,
+                workspace_key=workspace_config.workspace_key,
+                include_imports=include_imports,
+                executor=instance.decryption_executor,
+                lazy_decrypt=instance.lazy_decrypt,
+                instrumentation=instance.instrumentation,
+            )
+        else:
+            sync_state = instance.sync_state
+            secret_bundles, synced_secrets = SecretService.sync_decrypted_secrets(
+                api_request=instance.api_request,
+                workspace_id=workspace_config.workspace_id,
+                environment=environment,
+                path=path,
+                workspace_key=workspace_config.workspace_key,
+                include_imports=include_imports,
+                synced_secrets=sync_state.get(scope_key),
+                executor=instance.decryption_executor,
+                lazy_decrypt=instance.lazy_decrypt,
+                instrumentation=instance.instrumentation,
+            )
+            sync_state.set(scope_key, synced_secrets)
+
+        cache_secret_bundles(instance, environment, path, secret_bundles)
+        save_snapshot(instance, scope_key, secret_bundles)
+
+        return secret_bundles
+
+    return list(instance.flights.do(("secrets",) + scope_key, fetch))
+
+
+def revalidate_all_secrets(
+    instance: "InfisicalClient",
+    validators: ResponseValidatorCache,
+    scope_key: ScopeKey,
+) -> List[SecretBundle]:
+    """Fetch the secrets of ``scope_key`` with a conditional request, returning the
+    previous secrets with a new fetch time when they did not change.
+
+    Only the secrets that changed are decrypted otherwise.
+    """
+    environment, path, include_imports = scope_key
+    workspace_config = ensure_workspace_config(instance)
+    validated_response = validators.get(("secrets",) + scope_key)
+    validator, synced_secrets = validated_response or (None, {})
+
+    synced, next_validator = SecretService.sync_decrypted_secrets_if_modified(
+        api_request=instance.api_request,
+        workspace_id=workspace_config.workspace_id,
+        environment=environment,
+        path=path,
+        workspace_key=workspace_config.workspace_key,
+        include_imports=include_imports,
+        synced_secrets=synced_secrets,
+        validator=validator,
+        executor=instance.decryption_executor,
+        lazy_decrypt=instance.lazy_decrypt,
+        instrumentation=instance.instrumentation,
+    )
+
+    if synced is None:
+        validators.not_modified += 1
+        last_fetched_at = datetime.now()
+        secret_bundles = [
+            synced_secret.secret_bundle.copy(
+                update={"last_fetched_at": last_fetched_at}
+            )
+            for synced_secret in synced_secrets.values()
+        ]
+    else:
+        validators.modified += 1
+        secret_bundles, synced_secrets = synced
+
+    if instance.sync_state is not None:
+        instance.sync_state.set(scope_key, synced_secrets)
+
+    validators.set(("secrets",) + scope_key, next_validator, synced_secrets)
+
+    return secret_bundles
+
+
+def poll_secrets_helper(
+    instance: "InfisicalClient", scope_key: ScopeKey
+) -> List[SecretBundle]:
+    """Fetch the secrets of ``scope_key`` for a watch, raising instead of falling
+    back to the snapshot so that a failed poll is not mistaken for a change.
+    """
+    ensure_workspace_config(instance)
+
+    if instance.share_snapshot:
+        return refresh_shared_scope(instance, scope_key)
+
+    return fetch_all_secrets(instance, scope_key)
+
+
+def iter_secrets_helper(
+    instance: "InfisicalClient", environment: str, path: str, include_imports: bool
+) -> Iterator[SecretBundle]:
+    workspace_config = ensure_workspace_config(instance)
+
+    yield from SecretService.iter_decrypted_secrets(
+        api_request=instance.api_request,
+        workspace_id=workspace_config.workspace_id,
+        environment=environment,
+        path=path,
+        workspace_key=workspace_config.workspace_key,
+        include_imports=include_imports,
+    )
+
+
+def cache_secret_bundles(
     instance: "InfisicalClient",
-    secret_name: str,
-    type: Literal["shared", "personal"],
     environment: str,
     path: str,
-):
-    cache_key = f"{type}-{secret_name}"
-    cached_secret: Union[SecretBundle, None] = None
+    secret_bundles: List[SecretBundle],
+    age: float = 0,
+) -> None:
+    """Cache all the secrets fetched for ``environment`` and ``path``"""
+    workspace_id = ensure_workspace_config(instance).workspace_id
+    personal_secret_names = {
+        secret_bundle.secret_name
+        for secret_bundle in secret_bundles
+        if secret_bundle.type == "personal"
+    }
+
+    # Secrets of the path come first and take precedence over imported ones, and
+    # secrets without a type are shared, the default of the API
+    for secret_bundle in reversed(secret_bundles):
+        instance.cache.set(
+            CacheKey(
+                workspace_id,
+                environment,
+                path,
+                secret_bundle.type or "shared",
+                secret_bundle.secret_name,
+            ),
+            secret_bundle,
+            age=age,
+            # A personal lookup resolves to the shared secret when there is no override
+            serves_personal=secret_bundle.secret_name not in personal_secret_names,
+        )
+
+
+def restore_snapshot(instance: "InfisicalClient") -> None:
+    """Restore the workspace config and the cached secrets of ``instance`` from its
+    snapshot, then revalidate every restored scope in the background.
+    """
+    snapshot = instance.snapshot
+    client_config = instance.client_config
+
+    if not snapshot or not client_config:
+        return
+
+    key_envelope = snapshot.key_envelope if snapshot.load() else None
+
+    if key_envelope is None:
+        return
+
     try:
-        if not instance.client_config:
-            raise Exception("Failed to find client config")
+        workspace_config = SecretService.open_workspace_key_envelope(
+            key_envelope=key_envelope,
+            client_config=client_config,
+        )
+    except Exception as exc:
+        logger.warning("Ignoring snapshot %s: %s", snapshot.path, exc)
+        return
 
-        if not instance.client_config.workspace_config:
-            instance.client_config.workspace_config = (
-                SecretService.populate_client_config(
-                    api_request=instance.api_request,
-                    client_config=instance.client_config,
-                )
-            )
+    client_config.workspace_config = workspace_config
 
-        cached_secret = instance.cache.get(cache_key)
+    for scope_key in list(snapshot.scopes):
+        snapshot_secrets = get_snapshot_secrets(instance, scope_key)
 
-        if cached_secret:
-            current_time = datetime.now()
-            cache_expiry_time = cached_secret.last_fetched_at + timedelta(
-                seconds=instance.client_config.cache_ttl
+        if snapshot_secrets is None:
+            continue
+
+        secret_bundles, fetched_at = snapshot_secrets
+        environment, path, include_imports = scope_key
+
+        cache_secret_bundles(
+            instance,
+            environment,
+            path,
+            secret_bundles,
+            age=(datetime.now() - fetched_at).total_seconds(),
+        )
+        if instance.share_snapshot:
+            revalidate = partial(refresh_shared_scope, instance, scope_key)
+        else:
+            revalidate = partial(
+                get_all_secrets_helper,
+                instance,
+                environment,
+                path,
+                include_imports,
+                False,
             )
 
-            if current_time < cache_expiry_time:
-                if instance.debug:
-                    print(f"Returning cached secret: {cached_secret.secret_name}")
+        instance.refresher.schedule(("secrets",) + scope_key, revalidate)
 
-                return cached_secret
 
-        secret_bundle = SecretService.get_decrypted_secret(
-            api_request=instance.api_request,
-            secret_name=secret_name,
-            workspace_id=instance.client_config.workspace_config.workspace_id,
-            environment=environment,
-            workspace_key=instance.client_config.workspace_config.workspace_key,
-            type=type,
-            path=path,
+def load_shared_scope(
+    instance: "InfisicalClient", scope_key: ScopeKey
+) -> Optional[List[SecretBundle]]:
+    """Cache and return the secrets of ``scope_key`` from the shared snapshot, if they
+    were fetched less than ``cache_ttl`` seconds ago.
+    """
+    if instance.snapshot is None:
+        return None
+
+    instance.snapshot.load()
+    snapshot_secrets = get_snapshot_secrets(instance, scope_key)
+
+    if snapshot_secrets is None:
+        return None
+
+    secret_bundles, fetched_at = snapshot_secrets
+    age = (datetime.now() - fetched_at).total_seconds()
+
+    if age >= instance.cache.ttl:
+        return None
+
+    environment, path, _ = scope_key
+    cache_secret_bundles(instance, environment, path, secret_bundles, age=age)
+
+    return secret_bundles
+
+
+def refresh_shared_scope(
+    instance: "InfisicalClient", scope_key: ScopeKey
+) -> List[SecretBundle]:
+    """Return fresh secrets of ``scope_key``, reading them from the shared snapshot
+    when another process of the host already fetched them.
+
+    Only the process holding the snapshot lock fetches the scope from the API, the
+    others wait for it and read its result from the snapshot.
+    """
+    snapshot = instance.snapshot
+
+    if snapshot is None:
+        return fetch_all_secrets(instance, scope_key)
+
+    secret_bundles = load_shared_scope(instance, scope_key)
+
+    if secret_bundles is not None:
+        return secret_bundles
+
+    with snapshot.lock():
+        secret_bundles = load_shared_scope(instance, scope_key)
+
+        if secret_bundles is not None:
+            return secret_bundles
+
+        return fetch_all_secrets(instance, scope_key)
+
+
+def is_shared_scope(instance: "InfisicalClient", scope_key: ScopeKey) -> bool:
+    """Return whether the shared snapshot of ``instance`` tracks ``scope_key``"""
+    snapshot = instance.snapshot
+
+    if not instance.share_snapshot or snapshot is None:
+        return False
+
+    snapshot.load()
+
+    return scope_key in snapshot.scopes
+
+
+def get_snapshot_secrets(
+    instance: "InfisicalClient", scope_key: ScopeKey
+) -> Optional[Tuple[List[SecretBundle], datetime]]:
+    snapshot = instance.snapshot
+    client_config = instance.client_config
+
+    if not snapshot or not client_config or not client_config.workspace_config:
+        return None
+
+    try:
+        return snapshot.get_secrets(
+            scope_key, client_config.workspace_config.workspace_key
         )
+    except Exception as exc:
+        logger.warning("Failed to read snapshot %s: %s", snapshot.path, exc)
 
-        instance.cache[secret_name] = secret_bundle
+    return None
 
-        return secret_bundle
+
+def save_snapshot(
+    instance: "InfisicalClient",
+    scope_key: ScopeKey,
+    secret_bundles: List[SecretBundle],
+) -> None:
+    snapshot = instance.snapshot
+    workspace_config = ensure_workspace_config(instance)
+
+    if not snapshot or not workspace_config.key_envelope:
+        return
+
+    try:
+        snapshot.save(
+            key_envelope=workspace_config.key_envelope,
+            workspace_key=workspace_config.workspace_key,
+            scope_key=scope_key,
+            secret_bundles=secret_bundles,
+        )
+    except Exception as exc:
+        logger.warning("Failed to write snapshot %s: %s", snapshot.path, exc)
+
+
+def get_secret_helper(
+    instance: "InfisicalClient",
+    secret_name: str,
+    type: Literal["shared", "personal"],
+    environment: str,
+    path: str,
+) -> SecretBundle:
+    cached_secret: Union[SecretBundle, None] = None
+    try:
+        workspace_config = ensure_workspace_config(instance)
+
+        cache_key = CacheKey(
+            workspace_config.workspace_id,
+            environment,
+            path,
+            type,
+            secret_name,
+        )
+        served_secret = get_cached_secret(instance, cache_key)
+
+        if served_secret:
+            if instance.debug:
+                print(f"Returning cached secret: {served_secret.secret_name}")
+
+            return served_secret
+
+        cached_secret = instance.cache.get_stale(cache_key)
+
+        return fetch_secret(instance, cache_key)
 
     except Exception as exc:
         if instance.debug:
@@ -110,6 +572,187 @@ def get_secret_helper(
     return SecretService.get_fallback_secret(secret_name=secret_name)
 
 
+def get_cached_secret(
+    instance: "InfisicalClient", cache_key: CacheKey
+) -> Union[SecretBundle, None]:
+    """Return the cached secret for ``cache_key`` if it can be served.
+
+    With background refresh enabled, an expired secret is still served and a
+    refresh is scheduled, until it goes past ``cache_max_stale``.
+    """
+    if not instance.background_refresh:
+        return instance.cache.get(cache_key)
+
+    secret_bundle, is_stale = instance.cache.get_or_stale(cache_key)
+
+    if secret_bundle and is_stale:
+        instance.refresher.schedule(cache_key, partial(fetch_secret, instance, cache_key))
+
+    return secret_bundle
+
+
+def fetch_secret(instance: "InfisicalClient", cache_key: CacheKey) -> SecretBundle:
+    """Fetch the secret for ``cache_key`` from Infisical and cache it.
+
+    Concurrent fetches of the same secret share a single request.
+    """
+    workspace_config = ensure_workspace_config(instance)
+
+    def fetch() -> SecretBundle:
+        scope_key = (cache_key.environment, cache_key.path, True)
+
+        # Only refresh a scope that another call already fetched, instead of
+        # listing the whole scope for a single secret
+        if is_shared_scope(instance, scope_key):
+            try:
+                refresh_shared_scope(instance, scope_key)
+            except Exception as exc:
+                if instance.debug:
+                    logger.exception(exc)
+
+            shared_secret = instance.cache.get(cache_key)
+
+            if shared_secret:
+                return shared_secret
+
+        validators = instance.validators
+
+        if validators is not None:
+            secret_bundle = revalidate_secret(instance, validators, cache_key)
+        else:
+            secret_bundle = SecretService.get_decrypted_secret(
+                api_request=instance.api_request,
+                secret_name=cache_key.secret_name,
+                workspace_id=cache_key.workspace_id,
+                environment=cache_key.environment,
+                workspace_key=workspace_config.workspace_key,
+                type=cache_key.type,
+                path=cache_key.path,
+                instrumentation=instance.instrumentation,
+            )
+
+        instance.cache.set(cache_key, secret_bundle)
+
+        return secret_bundle
+
+    return instance.flights.do(cache_key, fetch)
+
+
+def revalidate_secret(
+    instance: "InfisicalClient",
+    validators: ResponseValidatorCache,
+    cache_key: CacheKey,
+) -> SecretBundle:
+    """Fetch the secret for ``cache_key`` with a conditional request, returning the
+    previous secret with a new fetch time when it did not change.
+    """
+    workspace_config = ensure_workspace_config(instance)
+    validated_response = validators.get(cache_key)
+
+    secret_bundle, validator = SecretService.get_decrypted_secret_if_modified(
+        api_request=instance.api_request,
+        secret_name=cache_key.secret_name,
+        workspace_id=cache_key.workspace_id,
+        environment=cache_key.environment,
+        workspace_key=workspace_config.workspace_key,
+        type=cache_key.type,
+        path=cache_key.path,
+        validator=validated_response.validator if validated_response else None,
+        instrumentation=instance.instrumentation,
+    )
+
+    if secret_bundle is not None:
+        validators.modified += 1
+    elif validated_response is not None:
+        validators.not_modified += 1
+        secret_bundle = validated_response.value.copy(
+            update={"last_fetched_at": datetime.now()}
+        )
+    else:
+        raise Exception("Failed to revalidate secret without a validator")
+
+    validators.set(cache_key, validator, secret_bundle)
+
+    return secret_bundle
+
+
+def get_secrets_helper(
+    instance: "InfisicalClient",
+    secret_names: List[str],
+    type: Literal["shared", "personal"],
+    environment: str,
+    path: str,
+) -> List[SecretBundle]:
+    try:
+        workspace_config = ensure_workspace_config(instance)
+
+        workspace_id = workspace_config.workspace_id
+        secret_bundles: Dict[str, SecretBundle] = {}
+
+        for secret_name in secret_names:
+            cached_secret = get_cached_secret(
+                instance, CacheKey(workspace_id, environment, path, type, secret_name)
+            )
+            if cached_secret:
+                secret_bundles[secret_name] = cached_secret
+
+        missing_secret_names = [
+            secret_name
+            for secret_name in secret_names
+            if secret_name not in secret_bundles
+        ]
+
+        if missing_secret_names:
+            fetched_secret_bundles = SecretService.get_decrypted_secrets_by_name(
+                api_request=instance.api_request,
+                workspace_id=workspace_id,
+                environment=environment,
+                path=path,
+                workspace_key=workspace_config.workspace_key,
+                secret_names=missing_secret_names,
+                type=type,
+                instrumentation=instance.instrumentation,
+            )
+
+            for secret_bundle in fetched_secret_bundles.values():
+                instance.cache.set(
+                    CacheKey(
+                        workspace_id,
+                        environment,
+                        path,
+                        type,
+                        secret_bundle.secret_name,
+                    ),
+                    secret_bundle,
+                )
+
+            secret_bundles.update(fetched_secret_bundles)
+    except Exception as exc:
+        # The token may not be allowed to list secrets, or the request failed:
+        # resolve each secret on its own, which also handles cache and fallbacks
+        if instance.debug:
+            logger.exception(exc)
+    else:
+        return [
+            secret_bundles[secret_name]
+            if secret_name in secret_bundles
+            else SecretService.get_fallback_secret(secret_name=secret_name)
+            for secret_name in secret_names
+        ]
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(len(secret_names), instance.pool_maxsize))
+    ) as executor:
+        return list(
+            executor.map(
+                lambda secret_name: get_secret_helper(
+                    instance, secret_name, type, environment, path
+                ),
+                secret_names,
+            )
+        )
+
+
 def create_secret_helper(
     instance: "InfisicalClient",
     secret_name: str,
@@ -119,30 +762,20 @@ def create_secret_helper(
     path: str,
 ):
     try:
-        if not instance.client_config:
-            raise Exception("Failed to find client config")
-
-        if not instance.client_config.workspace_config:
-            instance.client_config.workspace_config = (
-                SecretService.populate_client_config(
-                    api_request=instance.api_request,
-                    client_config=instance.client_config,
-                )
-            )
+        workspace_config = ensure_workspace_config(instance)
 
         secret_bundle = SecretService.create_secret(
             api_request=instance.api_request,
             secret_name=secret_name,
             secret_value=secret_value,
-            workspace_id=instance.client_config.workspace_config.workspace_id,
+            workspace_id=workspace_config.workspace_id,
             environment=environment,
-            workspace_key=instance.client_config.workspace_config.workspace_key,
+            workspace_key=workspace_config.workspace_key,
             type=type,
             path=path,
         )
 
-        cache_key = f"{type}-{secret_name}"
-        instance.cache[cache_key] = secret_bundle
+        update_cache_after_write(instance, secret_bundle, environment, path)
 
         return secret_bundle
     except Exception as exc:
@@ -161,30 +794,20 @@ def update_secret_helper(
     path: str,
 ):
     try:
-        if not instance.client_config:
-            raise Exception("Failed to find client config")
-
-        if not instance.client_config.workspace_config:
-            instance.client_config.workspace_config = (
-                SecretService.populate_client_config(
-                    api_request=instance.api_request,
-                    client_config=instance.client_config,
-                )
-            )
+        workspace_config = ensure_workspace_config(instance)
 
         secret_bundle = SecretService.update_secret(
             api_request=instance.api_request,
             secret_name=secret_name,
             secret_value=secret_value,
-            workspace_id=instance.client_config.workspace_config.workspace_id,
+            workspace_id=workspace_config.workspace_id,
             environment=environment,
-            workspace_key=instance.client_config.workspace_config.workspace_key,
+            workspace_key=workspace_config.workspace_key,
             type=type,
             path=path,
         )
 
-        cache_key = f"{type}-{secret_name}"
-        instance.cache[cache_key] = secret_bundle
+        update_cache_after_write(instance, secret_bundle, environment, path)
 
         return secret_bundle
     except Exception as exc:
@@ -202,29 +825,21 @@ def delete_secret_helper(
     path: str,
 ):
     try:
-        if not instance.client_config:
-            raise Exception("Failed to find client config")
-
-        if not instance.client_config.workspace_config:
-            instance.client_config.workspace_config = (
-                SecretService.populate_client_config(
-                    api_request=instance.api_request,
-                    client_config=instance.client_config,
-                )
-            )
+        workspace_config = ensure_workspace_config(instance)
 
         secret_bundle = SecretService.delete_secret(
             api_request=instance.api_request,
             secret_name=secret_name,
-            workspace_id=instance.client_config.workspace_config.workspace_id,
+            workspace_id=workspace_config.workspace_id,
             environment=environment,
-            workspace_key=instance.client_config.workspace_config.workspace_key,
+            workspace_key=workspace_config.workspace_key,
             type=type,
             path=path,
         )
 
-        cache_key = f"{type}-{secret_name}"
-        instance.cache[cache_key] = secret_bundle
+        update_cache_after_write(
+            instance, secret_bundle, environment, path, deleted=True
+        )
 
         return secret_bundle
     except Exception as exc:
@@ -232,3 +847,149 @@ def delete_secret_helper(
             logger.exception(exc)
 
     return SecretService.get_fallback_secret(secret_name=secret_name)
+
+
+def write_secrets_helper(
+    instance: "InfisicalClient",
+    secret_names: List[str],
+    write: Callable[[WorkspaceConfig], List[SecretWriteResult]],
+    environment: str,
+    path: str,
+    deleted: bool = False,
+) -> List[SecretWriteResult]:
+    """Run the batch ``write`` and keep the cache consistent with its results.
+
+    If the workspace config cannot be fetched, every secret fails with that error.
+    """
+    try:
+        workspace_config = ensure_workspace_config(instance)
+    except Exception as exc:
+        if instance.debug:
+            logger.exception(exc)
+
+        return [
+            SecretWriteResult(secret_name=secret_name, secret_bundle=None, error=exc)
+            for secret_name in secret_names
+        ]
+
+    results = write(workspace_config)
+
+    for result in results:
+        if result.secret_bundle is not None:
+            update_cache_after_write(
+                instance, result.secret_bundle, environment, path, deleted=deleted
+            )
+        elif instance.debug:
+            logger.error("Failed to write secret %s: %s", result.secret_name, result.error)
+
+    return results
+
+
+def create_secrets_helper(
+    instance: "InfisicalClient",
+    secrets: List[Tuple[str, str]],
+    type: Literal["shared", "personal"],
+    environment: str,
+    path: str,
+    max_concurrency: Optional[int],
+) -> List[SecretWriteResult]:
+    return write_secrets_helper(
+        instance,
+        [secret_name for secret_name, _ in secrets],
+        lambda workspace_config: SecretService.create_secrets(
+            api_request=instance.api_request,
+            workspace_key=workspace_config.workspace_key,
+            workspace_id=workspace_config.workspace_id,
+            environment=environment,
+            type=type,
+            secrets=secrets,
+            path=path,
+            max_concurrency=max_concurrency or instance.pool_maxsize,
+        ),
+        environment,
+        path,
+    )
+
+
+def update_secrets_helper(
+    instance: "InfisicalClient",
+    secrets: List[Tuple[str, str]],
+    type: Literal["shared", "personal"],
+    environment: str,
+    path: str,
+    max_concurrency: Optional[int],
+) -> List[SecretWriteResult]:
+    return write_secrets_helper(
+        instance,
+        [secret_name for secret_name, _ in secrets],
+        lambda workspace_config: SecretService.update_secrets(
+            api_request=instance.api_request,
+            workspace_key=workspace_config.workspace_key,
+            workspace_id=workspace_config.workspace_id,
+            environment=environment,
+            type=type,
+            secrets=secrets,
+            path=path,
+            max_concurrency=max_concurrency or instance.pool_maxsize,
+        ),
+        environment,
+        path,
+    )
+
+
+def delete_secrets_helper(
+    instance: "InfisicalClient",
+    secret_names: List[str],
+    type: Literal["shared", "personal"],
+    environment: str,
+    path: str,
+    max_concurrency: Optional[int],
+) -> List[SecretWriteResult]:
+    return write_secrets_helper(
+        instance,
+        secret_names,
+        lambda workspace_config: SecretService.delete_secrets(
+            api_request=instance.api_request,
+            workspace_key=workspace_config.workspace_key,
+            workspace_id=workspace_config.workspace_id,
+            environment=environment,
+            type=type,
+            secret_names=secret_names,
+            path=path,
+            max_concurrency=max_concurrency or instance.pool_maxsize,
+        ),
+        environment,
+        path,
+        deleted=True,
+    )
+
+
+def update_cache_after_write(
+    instance: "InfisicalClient",
+    secret_bundle: SecretBundle,
+    environment: str,
+    path: str,
+    deleted: bool = False,
+) -> None:
+    """Keep the cache consistent after the secret of ``secret_bundle`` was written"""
+    workspace_id = ensure_workspace_config(instance).workspace_id
+    cache_key = CacheKey(
+        workspace_id,
+        environment,
+        path,
+        secret_bundle.type or "shared",
+        secret_bundle.secret_name,
+    )
+
+    if deleted:
+        instance.cache.delete(cache_key)
+    else:
+        instance.cache.set(cache_key, secret_bundle)
+
+    if secret_bundle.type == "shared":
+        # A personal lookup may have been resolved to the previous shared secret
+        instance.cache.delete(
+            CacheKey(
+                workspace_id, environment, path, "personal", secret_bundle.secret_name
+            )
+        )
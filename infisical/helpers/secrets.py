@@ -1,6 +1,8 @@
 from datetime import datetime
+from typing import Optional
 
 from infisical.models.models import Secret, SecretBundle
+from infisical.models.raw import RawSecret
 
 
 def transform_secret_to_secret_bundle(
@@ -18,3 +20,24 @@ def transform_secret_to_secret_bundle(
         is_fallback=False,
         last_fetched_at=datetime.now(),
     )
+
+
+def transform_raw_secret_to_secret_bundle(
+    secret: RawSecret,
+    secret_name: str,
+    secret_value: str,
+    last_fetched_at: Optional[datetime] = None,
+) -> SecretBundle:
+    """Build the bundle of ``secret`` without validating it again, its fields having
+    the expected types already.
+    """
+    return SecretBundle.construct(
+        secret_name=secret_name,
+        secret_value=secret_value,
+        version=secret.version,
+        type=secret.type,
+        created_at=secret.created_at,
+        updated_at=secret.updated_at,
+        is_fallback=False,
+        last_fetched_at=last_fetched_at or datetime.now(),
+    )
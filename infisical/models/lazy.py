@@ -0,0 +1,120 @@
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from infisical.models.models import SecretBundle
+from infisical.models.raw import RawSecret
+from infisical.utils.crypto import decrypt_symmetric_128_bit_hex_key_utf8
+from pydantic import PrivateAttr
+
+
+class _LazySecretValue:
+    # pydantic leaves out of a model's namespace the attributes named like a field,
+    # so the property is inherited from this plain class instead. Type checkers see
+    # the field of SecretBundle, which the property stands for.
+    if TYPE_CHECKING:
+        secret_value: Optional[str]
+    else:
+
+        @property
+        def secret_value(self) -> str:
+            """The value of the secret, decrypted on first read"""
+            return self.decrypt()
+
+
+class LazySecretBundle(_LazySecretValue, SecretBundle):
+    """A secret bundle whose value is only decrypted when ``secret_value`` is first
+    read, then kept like the value of a regular bundle.
+
+    Until then, the bundle holds the ciphertext of the value and the workspace key.
+    Copies of a bundle not decrypted yet stay lazy, while :meth:`dict` and
+    :meth:`json` decrypt the value to include it. :meth:`to_encrypted_dict` keeps
+    the ciphertext of the value instead.
+    """
+
+    _ciphertext: str = PrivateAttr()
+    _iv: str = PrivateAttr()
+    _tag: str = PrivateAttr()
+    _workspace_key: str = PrivateAttr()
+    _secret_value: Optional[str] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_raw_secret(
+        cls,
+        secret: RawSecret,
+        secret_name: str,
+        workspace_key: str,
+        last_fetched_at: Optional[datetime] = None,
+    ) -> "LazySecretBundle":
+        secret_bundle = cls.construct(
+            secret_name=secret_name,
+            version=secret.version,
+            type=secret.type,
+            created_at=secret.created_at,
+            updated_at=secret.updated_at,
+            is_fallback=False,
+            last_fetched_at=last_fetched_at or datetime.now(),
+        )
+        secret_bundle._ciphertext = secret.secret_value_ciphertext
+        secret_bundle._iv = secret.secret_value_iv
+        secret_bundle._tag = secret.secret_value_tag
+        secret_bundle._workspace_key = workspace_key
+
+        return secret_bundle
+
+    @classmethod
+    def from_encrypted_dict(
+        cls, obj: Dict[str, Any], workspace_key: str
+    ) -> "LazySecretBundle":
+        """Return the bundle stored by :meth:`to_encrypted_dict`, still encrypted"""
+        secret_bundle = cls.construct(**dict(SecretBundle.parse_obj(obj)))
+        secret_bundle._ciphertext = obj["secretValueCiphertext"]
+        secret_bundle._iv = obj["secretValueIV"]
+        secret_bundle._tag = obj["secretValueTag"]
+        secret_bundle._workspace_key = workspace_key
+
+        return secret_bundle
+
+    @property
+    def is_decrypted(self) -> bool:
+        return self._secret_value is not None
+
+    def decrypt(self) -> str:
+        """Decrypt the value of the secret, unless it is decrypted already"""
+        if self._secret_value is None:
+            self._secret_value = decrypt_symmetric_128_bit_hex_key_utf8(
+                ciphertext=self._ciphertext,
+                iv=self._iv,
+                tag=self._tag,
+                key=self._workspace_key,
+            )
+
+        return self._secret_value
+
+    def to_secret_bundle(self) -> SecretBundle:
+        """Return a regular bundle of the secret, with its decrypted value"""
+        return SecretBundle.construct(
+            _fields_set=self.__fields_set__ | {"secret_value"},
+            **{**dict(self), "secret_value": self.decrypt()},
+        )
+
+    def to_encrypted_dict(self) -> Dict[str, Any]:
+        """Return the JSON data of the bundle with the ciphertext of its value instead
+        of the value, without decrypting it
+        """
+        secret_bundle = SecretBundle.construct(
+            _fields_set=self.__fields_set__, **dict(self)
+        )
+
+        return {
+            **json.loads(secret_bundle.json(by_alias=True, exclude={"secret_value"})),
+            "secretValueCiphertext": self._ciphertext,
+            "secretValueIV": self._iv,
+            "secretValueTag": self._tag,
+        }
+
+    def dict(self, **kwargs: Any) -> Dict[str, Any]:
+        return self.to_secret_bundle().dict(**kwargs)
+
+    def json(self, **kwargs: Any) -> str:
+        return self.to_secret_bundle().json(**kwargs)
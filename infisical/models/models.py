@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 from typing_extensions import Literal
@@ -35,6 +35,64 @@ class SecretBundle(BaseModel):
     last_fetched_at: datetime
 
 
+class SecretWriteResult(BaseModel):
+    """The outcome of writing one secret of a batch"""
+
+    secret_name: str
+    secret_bundle: Optional[SecretBundle]
+    error: Optional[Exception]
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class SecretScopeResult(BaseModel):
+    """The outcome of fetching the secrets of one environment and path"""
+
+    environment: str
+    path: str
+    secret_bundles: List[SecretBundle]
+    error: Optional[Exception]
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class MergedSecrets(BaseModel):
+    """The secrets of several environments and paths merged into one secret per
+    name, and the outcome of each of them
+    """
+
+    secret_bundles: List[SecretBundle]
+    scopes: List[SecretScopeResult]
+
+    @property
+    def ok(self) -> bool:
+        return all(scope.ok for scope in self.scopes)
+
+
+class SecretChanges(BaseModel):
+    """The secrets of an environment and path that changed between two polls"""
+
+    environment: str
+    path: str
+    added: List[SecretBundle]
+    changed: List[SecretBundle]
+    removed: List[SecretBundle]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+
 class ServiceTokenData(BaseModel):
     id: str = Field(..., alias="id")
     name: str
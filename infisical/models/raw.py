@@ -0,0 +1,102 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from infisical.models.models import Secret
+from pydantic.datetime_parse import parse_datetime
+from typing_extensions import Literal
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp of the API, like pydantic would but faster"""
+    try:
+        # The API returns UTC timestamps ending with "Z", which fromisoformat only
+        # supports from Python 3.11
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return parse_datetime(value)
+
+
+class RawSecret:
+    """An encrypted secret read straight from an API response, without validation.
+
+    This is a lean counterpart of :class:`~infisical.models.models.Secret` used on the
+    hot paths: the fields are copied from the JSON object as-is and the timestamps
+    are only parsed when accessed. :meth:`to_model` returns the validated model.
+    """
+
+    __slots__ = (
+        "id",
+        "version",
+        "workspace",
+        "user",
+        "type",
+        "environment",
+        "secret_key_ciphertext",
+        "secret_key_iv",
+        "secret_key_tag",
+        "secret_value_ciphertext",
+        "secret_value_iv",
+        "secret_value_tag",
+        "raw_created_at",
+        "raw_updated_at",
+        "_created_at",
+        "_updated_at",
+    )
+
+    def __init__(
+        self, json_object: Dict[str, Any], workspace: str, environment: str
+    ) -> None:
+        self.id: str = json_object["id"]
+        self.version: int = json_object["version"]
+        self.workspace = workspace
+        self.user: Optional[str] = json_object.get("user")
+        self.type: Literal["shared", "personal"] = json_object["type"]
+        self.environment = environment
+        self.secret_key_ciphertext: str = json_object["secretKeyCiphertext"]
+        self.secret_key_iv: str = json_object["secretKeyIV"]
+        self.secret_key_tag: str = json_object["secretKeyTag"]
+        self.secret_value_ciphertext: str = json_object["secretValueCiphertext"]
+        self.secret_value_iv: str = json_object["secretValueIV"]
+        self.secret_value_tag: str = json_object["secretValueTag"]
+        self.raw_created_at: str = json_object["createdAt"]
+        self.raw_updated_at: str = json_object["updatedAt"]
+        self._created_at: Optional[datetime] = None
+        self._updated_at: Optional[datetime] = None
+
+    @property
+    def created_at(self) -> datetime:
+        if self._created_at is None:
+            self._created_at = parse_timestamp(self.raw_created_at)
+
+        return self._created_at
+
+    @property
+    def updated_at(self) -> datetime:
+        if self._updated_at is None:
+            self._updated_at = parse_timestamp(self.raw_updated_at)
+
+        return self._updated_at
+
+    def to_model(self) -> Secret:
+        """Return the secret as a validated :class:`~infisical.models.models.Secret`"""
+        return Secret(
+            id=self.id,
+            version=self.version,
+            workspace=self.workspace,
+            user=self.user,
+            type=self.type,
+            environment=self.environment,
+            secretKeyCiphertext=self.secret_key_ciphertext,
+            secretKeyIV=self.secret_key_iv,
+            secretKeyTag=self.secret_key_tag,
+            secretValueCiphertext=self.secret_value_ciphertext,
+            secretValueIV=self.secret_value_iv,
+            secretValueTag=self.secret_value_tag,
+            createdAt=self.created_at,
+            updatedAt=self.updated_at,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"RawSecret(id={self.id!r}, version={self.version!r}, type={self.type!r})"
+        )
@@ -1,12 +1,22 @@
 from typing import Dict, Optional, Union
 
-from pydantic import BaseModel
-from requests import Session
+from infisical.utils.crypto import AsymmetricKeyPair
+from pydantic import BaseModel, PrivateAttr
 from typing_extensions import Literal
 
+class WorkspaceKeyEnvelope(BaseModel):
+    """The workspace key as returned by the API, encrypted for the token holder"""
+    workspace_id: str
+    encrypted_key: str
+    iv: Optional[str] = None
+    tag: Optional[str] = None
+    nonce: Optional[str] = None
+    public_key: Optional[str] = None
+
 class WorkspaceConfig(BaseModel):
     workspace_id: str
     workspace_key: str
+    key_envelope: Optional[WorkspaceKeyEnvelope]
 
 class ServiceTokenCredentials(BaseModel):
     service_token_key: str
@@ -20,3 +30,16 @@ class ClientConfig(BaseModel):
     credentials: Union[ServiceTokenCredentials, ServiceTokenV3Credentials]
     workspace_config: Optional[WorkspaceConfig]
     cache_ttl: int
+    _key_pair: Optional[AsymmetricKeyPair] = PrivateAttr(default=None)
+
+    def get_key_pair(self) -> AsymmetricKeyPair:
+        """Return the key pair of service token V3 credentials, parsed on first use
+        and kept with the config so that its peer boxes are reused
+        """
+        if self._key_pair is None:
+            if not isinstance(self.credentials, ServiceTokenV3Credentials):
+                raise Exception("Failed to find the private key of the token")
+
+            self._key_pair = AsymmetricKeyPair(self.credentials.private_key)
+
+        return self._key_pair
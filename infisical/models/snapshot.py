@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import List
+
+from infisical.models.secret_service import WorkspaceKeyEnvelope
+from pydantic import BaseModel
+
+
+class SnapshotScope(BaseModel):
+    environment: str
+    path: str
+    include_imports: bool
+    fetched_at: datetime
+    ciphertext: str
+    iv: str
+    tag: str
+
+
+class Snapshot(BaseModel):
+    version: int = 1
+    key_envelope: WorkspaceKeyEnvelope
+    scopes: List[SnapshotScope]
@@ -1,15 +1,24 @@
 import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
 
 from infisical.api.create_secret import create_secret_req
 from infisical.api.delete_secret import delete_secret_req
-from infisical.api.get_secret import get_secret_req
-from infisical.api.get_secrets import get_secrets_req
+from infisical.api.get_secret import get_secret_if_modified_req, get_secret_req
+from infisical.api.get_secrets import (
+    get_raw_secrets_if_modified_req,
+    get_raw_secrets_req,
+    iter_raw_secrets_req,
+)
 from infisical.api.get_service_token_data import get_service_token_data_req
 from infisical.api.get_service_token_data_key import get_service_token_data_key_req
 from infisical.api.update_secret import update_secret_req
-from infisical.helpers.secrets import transform_secret_to_secret_bundle
+from infisical.helpers.secrets import (
+    transform_raw_secret_to_secret_bundle,
+    transform_secret_to_secret_bundle,
+)
 from infisical.models.api import (
     CreateSecretDTO,
     DeleteSecretDTO,
@@ -17,52 +26,135 @@ from infisical.models.api import (
     GetSecretsDTO,
     UpdateSecretDTO,
 )
-from infisical.models.models import SecretBundle
-from infisical.models.secret_service import ClientConfig, WorkspaceConfig
+from infisical.models.lazy import LazySecretBundle
+from infisical.models.models import SecretBundle, SecretWriteResult
+from infisical.models.raw import RawSecret
+from infisical.models.secret_service import (
+    ClientConfig,
+    ServiceTokenCredentials,
+    WorkspaceConfig,
+    WorkspaceKeyEnvelope,
+)
 
 # from infisical.utils.crypto import decrypt_symmetric, encrypt_symmetric
 from infisical.utils.crypto import (
     decrypt_symmetric_128_bit_hex_key_utf8,
+    decrypt_symmetric_128_bit_hex_key_utf8_batch,
     encrypt_symmetric_128_bit_hex_key_utf8,
-    decrypt_asymmetric
+    encrypt_symmetric_128_bit_hex_key_utf8_batch,
 )
-from requests import Session
+from infisical.utils.instrumentation import Instrumentation
+from infisical.utils.sync import SyncedSecret, SyncedSecrets, get_secret_fingerprint
+from infisical.utils.validators import ResponseValidator
 from typing_extensions import Literal
 
+if TYPE_CHECKING:
+    from infisical.utils.http import ApiRequest
+
+
+def write_secrets(
+    secret_names: List[str],
+    write: Callable[[int], SecretBundle],
+    max_concurrency: int,
+) -> List[SecretWriteResult]:
+    """Call ``write`` with the index of each secret of ``secret_names``, at most
+    ``max_concurrency`` at a time, and collect the bundle or error of each secret.
+    """
+
+    def write_secret(index: int) -> SecretWriteResult:
+        try:
+            secret_bundle = write(index)
+        except Exception as exc:
+            return SecretWriteResult(
+                secret_name=secret_names[index], secret_bundle=None, error=exc
+            )
+
+        return SecretWriteResult(
+            secret_name=secret_names[index], secret_bundle=secret_bundle, error=None
+        )
+
+    if not secret_names:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(len(secret_names), max_concurrency))
+    ) as executor:
+        return list(executor.map(write_secret, range(len(secret_names))))
+
 
 class SecretService:
     @staticmethod
     def populate_client_config(
-        api_request: Session, client_config: ClientConfig
+        api_request: "ApiRequest", client_config: ClientConfig
     ) -> WorkspaceConfig:
+        key_envelope = SecretService.get_workspace_key_envelope(
+            api_request=api_request, client_config=client_config
+        )
+
+        return SecretService.open_workspace_key_envelope(
+            key_envelope=key_envelope, client_config=client_config
+        )
+
+    @staticmethod
+    def get_workspace_key_envelope(
+        api_request: "ApiRequest", client_config: ClientConfig
+    ) -> WorkspaceKeyEnvelope:
         if client_config.auth_mode == "service_token":
             service_token_details = get_service_token_data_req(api_request)
-            workspace_key = decrypt_symmetric_128_bit_hex_key_utf8(
-                ciphertext=service_token_details.encrypted_key,
+
+            return WorkspaceKeyEnvelope(
+                workspace_id=service_token_details.workspace,
+                encrypted_key=service_token_details.encrypted_key,
                 iv=service_token_details.iv,
                 tag=service_token_details.tag,
-                key=client_config.credentials.service_token_key,
             )
 
-            return WorkspaceConfig(
-                workspace_id=service_token_details.workspace,
-                workspace_key=workspace_key,
-            )
-        
-        if client_config.auth_mode == "service_token_v3":
-            service_token_key_details = get_service_token_data_key_req(api_request)
-            workspace_key = decrypt_asymmetric(
-                ciphertext=service_token_key_details.key.encrypted_key,
-                nonce=service_token_key_details.key.nonce,
-                public_key=service_token_key_details.key.public_key,
-                private_key=client_config.credentials.private_key
+        service_token_key_details = get_service_token_data_key_req(api_request)
+
+        return WorkspaceKeyEnvelope(
+            workspace_id=service_token_key_details.key.workspace,
+            encrypted_key=service_token_key_details.key.encrypted_key,
+            nonce=service_token_key_details.key.nonce,
+            public_key=service_token_key_details.key.public_key,
+        )
+
+    @staticmethod
+    def open_workspace_key_envelope(
+        key_envelope: WorkspaceKeyEnvelope, client_config: ClientConfig
+    ) -> WorkspaceConfig:
+        """Decrypt the workspace key of ``key_envelope`` with the credentials of
+        ``client_config``, without any request to the API.
+        """
+        credentials = client_config.credentials
+
+        if isinstance(credentials, ServiceTokenCredentials):
+            if key_envelope.iv is None or key_envelope.tag is None:
+                raise Exception("Failed to find the IV and tag of the workspace key")
+
+            workspace_key = decrypt_symmetric_128_bit_hex_key_utf8(
+                ciphertext=key_envelope.encrypted_key,
+                iv=key_envelope.iv,
+                tag=key_envelope.tag,
+                key=credentials.service_token_key,
             )
-            
-            return WorkspaceConfig(
-                workspace_id=service_token_key_details.key.workspace,
-                workspace_key=workspace_key
+        else:
+            if key_envelope.nonce is None or key_envelope.public_key is None:
+                raise Exception(
+                    "Failed to find the nonce and public key of the workspace key"
+                )
+
+            workspace_key = client_config.get_key_pair().decrypt(
+                ciphertext=key_envelope.encrypted_key,
+                nonce=key_envelope.nonce,
+                peer_public_key=key_envelope.public_key,
             )
 
+        return WorkspaceConfig(
+            workspace_id=key_envelope.workspace_id,
+            workspace_key=workspace_key,
+            key_envelope=key_envelope,
+        )
+
     @staticmethod
     def get_fallback_secret(secret_name: str) -> SecretBundle:
         return SecretBundle(
@@ -74,79 +166,343 @@ class SecretService:
 
     @staticmethod
     def get_decrypted_secrets(
-        api_request: Session,
+        api_request: "ApiRequest",
         workspace_key: str,
         workspace_id: str,
         environment: str,
         path: str,
-        include_imports: bool
+        include_imports: bool,
+        executor: Optional[Executor] = None,
+        lazy_decrypt: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
     ) -> List[SecretBundle]:
+        secret_bundles, _ = SecretService.sync_decrypted_secrets(
+            api_request=api_request,
+            workspace_key=workspace_key,
+            workspace_id=workspace_id,
+            environment=environment,
+            path=path,
+            include_imports=include_imports,
+            synced_secrets={},
+            executor=executor,
+            lazy_decrypt=lazy_decrypt,
+            instrumentation=instrumentation,
+        )
+
+        return secret_bundles
+
+    @staticmethod
+    def sync_decrypted_secrets(
+        api_request: "ApiRequest",
+        workspace_key: str,
+        workspace_id: str,
+        environment: str,
+        path: str,
+        include_imports: bool,
+        synced_secrets: SyncedSecrets,
+        executor: Optional[Executor] = None,
+        lazy_decrypt: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> Tuple[List[SecretBundle], SyncedSecrets]:
+        """Fetch the secrets of ``environment`` and ``path`` and decrypt only those
+        that changed since ``synced_secrets``, reusing the previous bundles of the
+        others.
+
+        :param synced_secrets: The secrets returned by the previous sync of the scope
+        :param executor: The executor spreading the decryption, or ``None`` to decrypt inline
+        :param lazy_decrypt: Whether to only decrypt the values when they are read
+        :param instrumentation: The instrumentation told about the decryption, if any
+        :return: The secret bundles, and the synced secrets to pass to the next sync
+        """
         options = GetSecretsDTO(
             workspace_id=workspace_id, environment=environment, path=path, include_imports=include_imports
         )
 
-        encrypted_secrets, secret_imports = get_secrets_req(api_request, options)
-        
+        secrets, imported_secrets = get_raw_secrets_req(api_request, options)
+
+        return SecretService.decrypt_raw_secrets(
+            workspace_key=workspace_key,
+            encrypted_secrets=secrets + imported_secrets,
+            synced_secrets=synced_secrets,
+            executor=executor,
+            lazy_decrypt=lazy_decrypt,
+            instrumentation=instrumentation,
+        )
+
+    @staticmethod
+    def sync_decrypted_secrets_if_modified(
+        api_request: "ApiRequest",
+        workspace_key: str,
+        workspace_id: str,
+        environment: str,
+        path: str,
+        include_imports: bool,
+        synced_secrets: SyncedSecrets,
+        validator: Optional[ResponseValidator] = None,
+        executor: Optional[Executor] = None,
+        lazy_decrypt: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> Tuple[Optional[Tuple[List[SecretBundle], SyncedSecrets]], ResponseValidator]:
+        """Sync the secrets of ``environment`` and ``path`` like
+        :meth:`sync_decrypted_secrets`, unless the response did not change since the
+        one identified by ``validator``, in which case nothing is parsed nor decrypted.
+
+        :param validator: The validator of the previous response of the scope, if any
+        :return: The secret bundles and synced secrets, or ``None`` if the secrets did
+            not change, and the validator of the response
+        """
+        options = GetSecretsDTO(
+            workspace_id=workspace_id,
+            environment=environment,
+            path=path,
+            include_imports=include_imports,
+        )
+
+        raw_secrets, next_validator = get_raw_secrets_if_modified_req(
+            api_request, options, validator
+        )
+
+        if raw_secrets is None:
+            return None, next_validator
+
+        secrets, imported_secrets = raw_secrets
+        synced = SecretService.decrypt_raw_secrets(
+            workspace_key=workspace_key,
+            encrypted_secrets=secrets + imported_secrets,
+            synced_secrets=synced_secrets,
+            executor=executor,
+            lazy_decrypt=lazy_decrypt,
+            instrumentation=instrumentation,
+        )
+
+        return synced, next_validator
+
+    @staticmethod
+    def decrypt_raw_secrets(
+        workspace_key: str,
+        encrypted_secrets: List[RawSecret],
+        synced_secrets: SyncedSecrets,
+        executor: Optional[Executor] = None,
+        lazy_decrypt: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> Tuple[List[SecretBundle], SyncedSecrets]:
+        """Decrypt the fetched ``encrypted_secrets`` that changed since
+        ``synced_secrets`` into bundles, reusing the previous bundles of the others.
+        """
+        fingerprints = [
+            get_secret_fingerprint(encrypted_secret)
+            for encrypted_secret in encrypted_secrets
+        ]
+        changed_secrets = [
+            encrypted_secret
+            for encrypted_secret, fingerprint in zip(encrypted_secrets, fingerprints)
+            if encrypted_secret.id not in synced_secrets
+            or synced_secrets[encrypted_secret.id].fingerprint != fingerprint
+        ]
+
+        # Names and values of the changed secrets are decrypted in a single batch,
+        # values are left encrypted until they are read in lazy mode
+        start = time.perf_counter() if instrumentation is not None else 0
+        plaintexts = decrypt_symmetric_128_bit_hex_key_utf8_batch(
+            key=workspace_key,
+            ciphertexts=[
+                ciphertext
+                for encrypted_secret in changed_secrets
+                for ciphertext in (
+                    (
+                        encrypted_secret.secret_key_ciphertext,
+                        encrypted_secret.secret_key_iv,
+                        encrypted_secret.secret_key_tag,
+                    ),
+                    (
+                        encrypted_secret.secret_value_ciphertext,
+                        encrypted_secret.secret_value_iv,
+                        encrypted_secret.secret_value_tag,
+                    ),
+                )[: 1 if lazy_decrypt else 2]
+            ],
+            executor=executor,
+        )
+
+        if instrumentation is not None:
+            instrumentation.on_decrypt(len(plaintexts), time.perf_counter() - start)
+
+        stride = 1 if lazy_decrypt else 2
+        decrypted_secrets = {
+            encrypted_secret.id: plaintexts[stride * index : stride * (index + 1)]
+            for index, encrypted_secret in enumerate(changed_secrets)
+        }
+
+        last_fetched_at = datetime.now()
         secret_bundles: List[SecretBundle] = []
+        next_synced_secrets: SyncedSecrets = {}
+
+        for encrypted_secret, fingerprint in zip(encrypted_secrets, fingerprints):
+            secret_bundle: SecretBundle
+
+            if encrypted_secret.id in decrypted_secrets and lazy_decrypt:
+                secret_bundle = LazySecretBundle.from_raw_secret(
+                    secret=encrypted_secret,
+                    secret_name=decrypted_secrets[encrypted_secret.id][0],
+                    workspace_key=workspace_key,
+                    last_fetched_at=last_fetched_at,
+                )
+            elif encrypted_secret.id in decrypted_secrets:
+                secret_name, secret_value = decrypted_secrets[encrypted_secret.id]
+                secret_bundle = transform_raw_secret_to_secret_bundle(
+                    secret=encrypted_secret,
+                    secret_name=secret_name,
+                    secret_value=secret_value,
+                    last_fetched_at=last_fetched_at,
+                )
+            else:
+                secret_bundle = synced_secrets[encrypted_secret.id].secret_bundle.copy(
+                    update={"last_fetched_at": last_fetched_at}
+                )
+
+            secret_bundles.append(secret_bundle)
+            next_synced_secrets[encrypted_secret.id] = SyncedSecret(
+                fingerprint, secret_bundle
+            )
+
+        return secret_bundles, next_synced_secrets
 
-        for encrypted_secret in encrypted_secrets:
-            secret_name = decrypt_symmetric_128_bit_hex_key_utf8(
-                ciphertext=encrypted_secret.secret_key_ciphertext,
-                iv=encrypted_secret.secret_key_iv,
-                tag=encrypted_secret.secret_key_tag,
+    @staticmethod
+    def iter_decrypted_secrets(
+        api_request: "ApiRequest",
+        workspace_key: str,
+        workspace_id: str,
+        environment: str,
+        path: str,
+        include_imports: bool,
+    ) -> Iterator[SecretBundle]:
+        """Fetch the secrets of ``environment`` and ``path`` and yield them one by one,
+        each decrypted as soon as it is read from the response.
+        """
+        options = GetSecretsDTO(
+            workspace_id=workspace_id,
+            environment=environment,
+            path=path,
+            include_imports=include_imports,
+        )
+
+        for encrypted_secret in iter_raw_secrets_req(api_request, options):
+            secret_name, secret_value = decrypt_symmetric_128_bit_hex_key_utf8_batch(
                 key=workspace_key,
+                ciphertexts=[
+                    (
+                        encrypted_secret.secret_key_ciphertext,
+                        encrypted_secret.secret_key_iv,
+                        encrypted_secret.secret_key_tag,
+                    ),
+                    (
+                        encrypted_secret.secret_value_ciphertext,
+                        encrypted_secret.secret_value_iv,
+                        encrypted_secret.secret_value_tag,
+                    ),
+                ],
             )
-            
+
+            yield transform_raw_secret_to_secret_bundle(
+                secret=encrypted_secret,
+                secret_name=secret_name,
+                secret_value=secret_value,
+            )
+
+    @staticmethod
+    def get_decrypted_secrets_by_name(
+        api_request: "ApiRequest",
+        workspace_key: str,
+        workspace_id: str,
+        environment: str,
+        path: str,
+        secret_names: List[str],
+        type: Literal["shared", "personal"],
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> Dict[str, SecretBundle]:
+        """Fetch the secrets of ``environment`` and ``path``, with those it imports, in
+        a single request and decrypt the values of ``secret_names`` only.
+
+        A personal secret takes precedence over the shared secret with the same name
+        unless ``type`` is "shared", mirroring :meth:`get_decrypted_secret`, and a
+        secret of the path over an imported one.
+
+        :return: The secret bundles found, keyed by secret name
+        """
+        options = GetSecretsDTO(
+            workspace_id=workspace_id,
+            environment=environment,
+            path=path,
+            include_imports=True,
+        )
+
+        secrets, imported_secrets = get_raw_secrets_req(api_request, options)
+        # Secrets of the path come first and take precedence over imported ones
+        encrypted_secrets = secrets + imported_secrets
+
+        if type == "shared":
+            encrypted_secrets = [
+                encrypted_secret
+                for encrypted_secret in encrypted_secrets
+                if encrypted_secret.type == "shared"
+            ]
+
+        start = time.perf_counter() if instrumentation is not None else 0
+        decrypted_names = decrypt_symmetric_128_bit_hex_key_utf8_batch(
+            key=workspace_key,
+            ciphertexts=[
+                (
+                    encrypted_secret.secret_key_ciphertext,
+                    encrypted_secret.secret_key_iv,
+                    encrypted_secret.secret_key_tag,
+                )
+                for encrypted_secret in encrypted_secrets
+            ],
+        )
+
+        wanted_names = set(secret_names)
+        matches: Dict[str, RawSecret] = {}
+
+        for encrypted_secret, secret_name in zip(encrypted_secrets, decrypted_names):
+            if secret_name not in wanted_names:
+                continue
+
+            if secret_name not in matches or encrypted_secret.type == "personal":
+                matches[secret_name] = encrypted_secret
+
+        secret_bundles: Dict[str, SecretBundle] = {}
+
+        for secret_name, encrypted_secret in matches.items():
             secret_value = decrypt_symmetric_128_bit_hex_key_utf8(
                 ciphertext=encrypted_secret.secret_value_ciphertext,
                 iv=encrypted_secret.secret_value_iv,
                 tag=encrypted_secret.secret_value_tag,
                 key=workspace_key,
             )
-            
-            secret_bundles.append(
-                transform_secret_to_secret_bundle(
-                    secret=encrypted_secret,
-                    secret_name=secret_name,
-                    secret_value=secret_value,
-                )
+
+            secret_bundles[secret_name] = transform_raw_secret_to_secret_bundle(
+                secret=encrypted_secret,
+                secret_name=secret_name,
+                secret_value=secret_value,
             )
-        
-        for secret_import in secret_imports:
-            for encrypted_secret in secret_import.secrets:
-                secret_name = decrypt_symmetric_128_bit_hex_key_utf8(
-                    ciphertext=encrypted_secret.secret_key_ciphertext,
-                    iv=encrypted_secret.secret_key_iv,
-                    tag=encrypted_secret.secret_key_tag,
-                    key=workspace_key,
-                )
-                
-                secret_value = decrypt_symmetric_128_bit_hex_key_utf8(
-                    ciphertext=encrypted_secret.secret_value_ciphertext,
-                    iv=encrypted_secret.secret_value_iv,
-                    tag=encrypted_secret.secret_value_tag,
-                    key=workspace_key,
-                )
 
-                secret_bundles.append(
-                    transform_secret_to_secret_bundle(
-                        secret=encrypted_secret,
-                        secret_name=secret_name,
-                        secret_value=secret_value,
-                    )
-                )
+        if instrumentation is not None:
+            instrumentation.on_decrypt(
+                len(encrypted_secrets) + len(matches), time.perf_counter() - start
+            )
 
         return secret_bundles
 
     @staticmethod
     def get_decrypted_secret(
-        api_request: Session,
+        api_request: "ApiRequest",
         secret_name: str,
         workspace_id: str,
         environment: str,
         workspace_key: str,
         type: Literal["shared", "personal"],
         path: str,
+        instrumentation: Optional[Instrumentation] = None,
     ):
         options = GetSecretDTO(
             secret_name=secret_name,
@@ -161,6 +517,7 @@ class SecretService:
             options,
         )
 
+        start = time.perf_counter() if instrumentation is not None else 0
         secret_value = decrypt_symmetric_128_bit_hex_key_utf8(
             ciphertext=encrypted_secret.secret.secret_value_ciphertext,
             iv=encrypted_secret.secret.secret_value_iv,
@@ -168,15 +525,70 @@ class SecretService:
             key=workspace_key,
         )
 
+        if instrumentation is not None:
+            instrumentation.on_decrypt(1, time.perf_counter() - start)
+
         return transform_secret_to_secret_bundle(
             secret=encrypted_secret.secret,
             secret_name=secret_name,
             secret_value=secret_value,
         )
 
+    @staticmethod
+    def get_decrypted_secret_if_modified(
+        api_request: "ApiRequest",
+        secret_name: str,
+        workspace_id: str,
+        environment: str,
+        workspace_key: str,
+        type: Literal["shared", "personal"],
+        path: str,
+        validator: Optional[ResponseValidator] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> Tuple[Optional[SecretBundle], ResponseValidator]:
+        """Fetch and decrypt a secret like :meth:`get_decrypted_secret`, unless the
+        response did not change since the one identified by ``validator``.
+
+        :return: The secret bundle, or ``None`` if the secret did not change, and the
+            validator of the response
+        """
+        options = GetSecretDTO(
+            secret_name=secret_name,
+            workspace_id=workspace_id,
+            environment=environment,
+            type=type,
+            path=path,
+        )
+
+        encrypted_secret, next_validator = get_secret_if_modified_req(
+            api_request, options, validator
+        )
+
+        if encrypted_secret is None:
+            return None, next_validator
+
+        start = time.perf_counter() if instrumentation is not None else 0
+        secret_value = decrypt_symmetric_128_bit_hex_key_utf8(
+            ciphertext=encrypted_secret.secret.secret_value_ciphertext,
+            iv=encrypted_secret.secret.secret_value_iv,
+            tag=encrypted_secret.secret.secret_value_tag,
+            key=workspace_key,
+        )
+
+        if instrumentation is not None:
+            instrumentation.on_decrypt(1, time.perf_counter() - start)
+
+        secret_bundle = transform_secret_to_secret_bundle(
+            secret=encrypted_secret.secret,
+            secret_name=secret_name,
+            secret_value=secret_value,
+        )
+
+        return secret_bundle, next_validator
+
     @staticmethod
     def create_secret(
-        api_request: Session,
+        api_request: "ApiRequest",
         workspace_key: str,
         workspace_id: str,
         environment: str,
@@ -225,7 +637,7 @@ class SecretService:
 
     @staticmethod
     def update_secret(
-        api_request: Session,
+        api_request: "ApiRequest",
         workspace_key: str,
         workspace_id: str,
         environment: str,
@@ -262,14 +674,14 @@ class SecretService:
 
     @staticmethod
     def delete_secret(
-        api_request: Session,
+        api_request: "ApiRequest",
         workspace_key: str,
         workspace_id: str,
         environment: str,
         type: Literal["shared", "personal"],
         path: str,
         secret_name: str,
-    ):
+    ) -> SecretBundle:
         options = DeleteSecretDTO(
             secret_name=secret_name,
             workspace_id=workspace_id,
@@ -292,3 +704,143 @@ class SecretService:
             secret_name=secret_name,
             secret_value=secret_value,
         )
+
+    @staticmethod
+    def create_secrets(
+        api_request: "ApiRequest",
+        workspace_key: str,
+        workspace_id: str,
+        environment: str,
+        type: Literal["shared", "personal"],
+        secrets: List[Tuple[str, str]],
+        path: str,
+        max_concurrency: int,
+    ) -> List[SecretWriteResult]:
+        """Create each of the ``(name, value)`` pairs of ``secrets``, encrypting them all
+        at once then sending at most ``max_concurrency`` requests at a time.
+
+        :return: The result of each secret, in the order of ``secrets``
+        """
+        secret_names = [secret_name for secret_name, _ in secrets]
+        ciphertexts = encrypt_symmetric_128_bit_hex_key_utf8_batch(
+            key=workspace_key,
+            plaintexts=[plaintext for secret in secrets for plaintext in secret],
+        )
+
+        def create_secret(index: int) -> SecretBundle:
+            secret_name, secret_value = secrets[index]
+            (
+                secret_key_ciphertext,
+                secret_key_iv,
+                secret_key_tag,
+            ) = ciphertexts[2 * index]
+            (
+                secret_value_ciphertext,
+                secret_value_iv,
+                secret_value_tag,
+            ) = ciphertexts[2 * index + 1]
+
+            options = CreateSecretDTO(
+                secret_name=secret_name,
+                workspace_id=workspace_id,
+                environment=environment,
+                type=type,
+                path=path,
+                secret_key_ciphertext=secret_key_ciphertext,
+                secret_key_iv=secret_key_iv,
+                secret_key_tag=secret_key_tag,
+                secret_value_ciphertext=secret_value_ciphertext,
+                secret_value_iv=secret_value_iv,
+                secret_value_tag=secret_value_tag,
+            )
+
+            encrypted_secret = create_secret_req(api_request, options)
+
+            return transform_secret_to_secret_bundle(
+                secret=encrypted_secret.secret,
+                secret_name=secret_name,
+                secret_value=secret_value,
+            )
+
+        return write_secrets(secret_names, create_secret, max_concurrency)
+
+    @staticmethod
+    def update_secrets(
+        api_request: "ApiRequest",
+        workspace_key: str,
+        workspace_id: str,
+        environment: str,
+        type: Literal["shared", "personal"],
+        secrets: List[Tuple[str, str]],
+        path: str,
+        max_concurrency: int,
+    ) -> List[SecretWriteResult]:
+        """Update each of the ``(name, value)`` pairs of ``secrets``, encrypting them all
+        at once then sending at most ``max_concurrency`` requests at a time.
+
+        :return: The result of each secret, in the order of ``secrets``
+        """
+        secret_names = [secret_name for secret_name, _ in secrets]
+        ciphertexts = encrypt_symmetric_128_bit_hex_key_utf8_batch(
+            key=workspace_key,
+            plaintexts=[secret_value for _, secret_value in secrets],
+        )
+
+        def update_secret(index: int) -> SecretBundle:
+            secret_name, secret_value = secrets[index]
+            (
+                secret_value_ciphertext,
+                secret_value_iv,
+                secret_value_tag,
+            ) = ciphertexts[index]
+
+            options = UpdateSecretDTO(
+                secret_name=secret_name,
+                workspace_id=workspace_id,
+                environment=environment,
+                type=type,
+                secret_value_ciphertext=secret_value_ciphertext,
+                secret_value_iv=secret_value_iv,
+                secret_value_tag=secret_value_tag,
+                path=path,
+            )
+
+            encrypted_secret = update_secret_req(api_request, options)
+
+            return transform_secret_to_secret_bundle(
+                secret=encrypted_secret.secret,
+                secret_name=secret_name,
+                secret_value=secret_value,
+            )
+
+        return write_secrets(secret_names, update_secret, max_concurrency)
+
+    @staticmethod
+    def delete_secrets(
+        api_request: "ApiRequest",
+        workspace_key: str,
+        workspace_id: str,
+        environment: str,
+        type: Literal["shared", "personal"],
+        secret_names: List[str],
+        path: str,
+        max_concurrency: int,
+    ) -> List[SecretWriteResult]:
+        """Delete each secret of ``secret_names``, sending at most ``max_concurrency``
+        requests at a time.
+
+        :return: The result of each secret, in the order of ``secret_names``
+        """
+
+        def delete_secret(index: int) -> SecretBundle:
+            return SecretService.delete_secret(
+                api_request=api_request,
+                workspace_key=workspace_key,
+                workspace_id=workspace_id,
+                environment=environment,
+                type=type,
+                path=path,
+                secret_name=secret_names[index],
+            )
+
+        return write_secrets(secret_names, delete_secret, max_concurrency)
@@ -0,0 +1,239 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional, Tuple
+
+from typing_extensions import Literal
+
+from infisical.models.models import SecretBundle
+from infisical.utils.instrumentation import Instrumentation
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class CacheKey(NamedTuple):
+    workspace_id: str
+    environment: str
+    path: str
+    type: Literal["shared", "personal"]
+    secret_name: str
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    stale_hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class _CacheEntry(NamedTuple):
+    # Entries are immutable and replaced as a whole, so readers never see a
+    # partially written entry
+    bundle: SecretBundle
+    expires_at: float
+    stale_until: float
+    # Whether personal lookups of the secret resolve to this shared entry, the
+    # secret having no personal override
+    serves_personal: bool
+
+
+class SecretCache:
+    """A bounded, thread-safe cache of secret bundles.
+
+    Entries expire ``ttl`` seconds after they were stored, minus a random share of
+    up to ``jitter`` of the ttl so that processes started together do not refresh
+    together. Expired entries can still be served as stale for ``max_stale`` more
+    seconds. The least recently used entry is evicted once ``max_entries`` is reached.
+
+    A shared secret without personal override is stored once and also serves its
+    personal lookups, so it counts as a single entry.
+
+    Reads never take a lock: entries are replaced as a whole and only their position
+    in the recency order is updated. Writes are serialized. Hit and miss counters
+    are not synchronized and may undercount under heavy contention.
+
+    :param ttl: Time-to-live of the entries, in seconds
+    :param max_entries: The maximum number of entries kept in the cache
+    :param max_stale: How long an expired entry can still be served, in seconds
+    :param jitter: The maximum share of the ttl randomly removed from each entry
+    :param instrumentation: The instrumentation told about every lookup, if any
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_stale: float = 0,
+        jitter: float = 0,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("The cache must be able to hold at least one entry!")
+
+        if not 0 <= jitter < 1:
+            raise ValueError("The jitter must be between 0 (included) and 1!")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_stale = max_stale
+        self.jitter = jitter
+        self.instrumentation = instrumentation
+        # Called with the change of the number of entries after every write, once the
+        # lock is released, e.g. to bound the entries of several caches together
+        self.on_resize: Optional[Callable[[int], None]] = None
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, CacheKey) and self._find(key) is not None
+
+    def get(self, key: CacheKey) -> Optional[SecretBundle]:
+        """Return the bundle stored for ``key`` if it has not expired yet"""
+        bundle, is_stale = self.get_or_stale(key)
+
+        return None if is_stale else bundle
+
+    def get_or_stale(self, key: CacheKey) -> Tuple[Optional[SecretBundle], bool]:
+        """Return the bundle stored for ``key`` and whether it has expired.
+
+        Entries past their ``max_stale`` bound are never returned.
+        """
+        entry_key, entry = self._find(key) or (key, None)
+        now = time.monotonic()
+
+        if entry is None or entry.stale_until <= now:
+            self.misses += 1
+            if self.instrumentation is not None:
+                self.instrumentation.on_cache_lookup("miss")
+            return None, False
+
+        try:
+            self._entries.move_to_end(entry_key)
+        except KeyError:  # Evicted or deleted by a concurrent write
+            pass
+
+        if entry.expires_at <= now:
+            self.stale_hits += 1
+            if self.instrumentation is not None:
+                self.instrumentation.on_cache_lookup("stale")
+            return entry.bundle, True
+
+        self.hits += 1
+        if self.instrumentation is not None:
+            self.instrumentation.on_cache_lookup("hit")
+
+        return entry.bundle, False
+
+    def get_stale(self, key: CacheKey) -> Optional[SecretBundle]:
+        """Return the bundle stored for ``key`` even if it has expired"""
+        found = self._find(key)
+
+        return found[1].bundle if found is not None else None
+
+    def set(
+        self,
+        key: CacheKey,
+        bundle: SecretBundle,
+        age: float = 0,
+        serves_personal: Optional[bool] = None,
+    ) -> None:
+        """Store ``bundle`` for ``key``
+
+        :param age: How long ago, in seconds, the bundle was fetched
+        :param serves_personal: Whether the shared secret has no personal override,
+            so that personal lookups resolve to it, or ``None`` if unknown
+        """
+        now = time.monotonic() - age
+        expires_at = now + self.ttl * (1 - self.jitter * random.random())
+
+        with self._lock:
+            size = len(self._entries)
+
+            if key.type == "personal":
+                serves_personal = False
+                self._stop_serving_personal(key)
+            elif serves_personal:
+                self._entries.pop(key._replace(type="personal"), None)
+            elif serves_personal is None:
+                # A secret known to have no personal override still has none
+                previous_entry = self._entries.get(key)
+                serves_personal = (
+                    previous_entry is not None and previous_entry.serves_personal
+                )
+
+            self._entries[key] = _CacheEntry(
+                bundle, expires_at, now + self.ttl + self.max_stale, serves_personal
+            )
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+            change = len(self._entries) - size
+
+        self._resized(change)
+
+    def delete(self, key: CacheKey) -> None:
+        with self._lock:
+            change = -1 if self._entries.pop(key, None) is not None else 0
+
+            if key.type == "personal":
+                self._stop_serving_personal(key)
+
+        self._resized(change)
+
+    def clear(self) -> None:
+        with self._lock:
+            change = -len(self._entries)
+            self._entries.clear()
+
+        self._resized(change)
+
+    def _resized(self, change: int) -> None:
+        if change and self.on_resize is not None:
+            self.on_resize(change)
+
+    def _stop_serving_personal(self, personal_key: CacheKey) -> None:
+        """Make the personal lookups of ``personal_key`` no longer resolve to the
+        shared secret, keeping its position in the recency order
+        """
+        shared_key = personal_key._replace(type="shared")
+        shared_entry = self._entries.get(shared_key)
+
+        if shared_entry is not None and shared_entry.serves_personal:
+            self._entries[shared_key] = shared_entry._replace(serves_personal=False)
+
+    def _find(self, key: CacheKey) -> Optional[Tuple[CacheKey, _CacheEntry]]:
+        """Return the key and entry serving ``key``, if any"""
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            return key, entry
+
+        if key.type == "personal":
+            shared_key = key._replace(type="shared")
+            shared_entry = self._entries.get(shared_key)
+
+            if shared_entry is not None and shared_entry.serves_personal:
+                return shared_key, shared_entry
+
+        return None
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            stale_hits=self.stale_hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._entries),
+        )
@@ -1,19 +1,49 @@
+import binascii
+import json
+import threading
 from base64 import b64decode, b64encode
-from typing import Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from Cryptodome.Cipher import AES
-from Cryptodome.Random import get_random_bytes
-from nacl import public, utils
+# The crypto libraries are imported on first use, not with the package: nacl is
+# only needed by service tokens V3, and cryptography replaces pycryptodome's AES
+# for batches when it is installed
+if TYPE_CHECKING:
+    from nacl import public
 
 Base64String = str
 Buffer = Union[bytes, bytearray, memoryview]
-import binascii
+# The ciphertext, iv and tag of a value encrypted with aes-256-gcm, base64-encoded
+SymmetricCiphertext = Tuple[Base64String, Base64String, Base64String]
+# The ciphertext and nonce of a value encrypted with x25519-xsalsa20-poly1305
+AsymmetricCiphertext = Tuple[Base64String, Base64String]
+
+DECRYPT_BATCH_SIZE = 256
+# The number of peers whose shared key is kept by an AsymmetricKeyPair
+MAX_CACHED_PEERS = 256
+
+
+@lru_cache(maxsize=None)
+def get_aes_gcm() -> Tuple[Any, Any]:
+    """Return the ``AESGCM`` class of the optional ``cryptography`` package, or
+    ``None`` if it is not installed, and the error of a tag mismatch, importing
+    them on first call
+    """
+    try:
+        from cryptography.exceptions import InvalidTag
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError:  # no cov
+        return None, ValueError
+
+    return AESGCM, InvalidTag
 
 
 def encrypt_asymmetric(
     plaintext: Union[Buffer, str],
-    public_key: Union[Buffer, Base64String, public.PublicKey],
-    private_key: Union[Buffer, Base64String, public.PrivateKey],
+    public_key: Union[Buffer, Base64String, "public.PublicKey"],
+    private_key: Union[Buffer, Base64String, "public.PrivateKey"],
 ) -> Tuple[Base64String, Base64String]:
     """Performs asymmetric encryption of the ``plaintext`` with x25519-xsalsa20-poly1305
     algorithm with the given parameters. Each of those params should be either the raw value in bytes
@@ -25,6 +55,8 @@ def encrypt_asymmetric(
     :raises ValueError: If ``plaintext``, ``public_key`` or ``private_key`` are empty
     :return: A tuple containing the ciphered text and the random nonce used for encryption
     """
+    from nacl import public, utils
+
     if (not isinstance(public_key, public.PublicKey) and len(public_key) == 0) or (
         not isinstance(private_key, public.PrivateKey) and len(private_key) == 0
     ):
@@ -60,8 +92,8 @@ def encrypt_asymmetric(
 def decrypt_asymmetric(
     ciphertext: Union[Buffer, Base64String],
     nonce: Union[Buffer, Base64String],
-    public_key: Union[Buffer, Base64String, public.PublicKey],
-    private_key: Union[Buffer, Base64String, public.PrivateKey],
+    public_key: Union[Buffer, Base64String, "public.PublicKey"],
+    private_key: Union[Buffer, Base64String, "public.PrivateKey"],
 ) -> str:
     """Performs asymmetric decryption of the ``ciphertext`` with x25519-xsalsa20-poly1305
     algorithm with the given parameters. Each of those params should be either the raw value in bytes
@@ -74,6 +106,8 @@ def decrypt_asymmetric(
     :raises ValueError: If ``ciphertext``, ``nonce``, ``public_key`` or ``private_key`` are empty
     :return: The deciphered text
     """
+    from nacl import public
+
     if (
         len(ciphertext) == 0
         or len(nonce) == 0
@@ -111,11 +145,187 @@ def decrypt_asymmetric(
     return plaintext.decode("utf-8")
 
 
+class AsymmetricKeyPair:
+    """A private key parsed once, with the boxes of its peers kept to encrypt and
+    decrypt values with x25519-xsalsa20-poly1305 like :func:`encrypt_asymmetric` and
+    :func:`decrypt_asymmetric`.
+
+    Building a box computes the key shared with the peer, which takes an X25519
+    scalar multiplication; the boxes of the ``max_peers`` most recently used peer
+    public keys are kept so that only the first exchange with a peer pays for it.
+
+    :param private_key: The private key, raw or base64-encoded
+    :param public_key: The public key of the pair, if known
+    :param max_peers: The number of peer boxes kept
+    """
+
+    def __init__(
+        self,
+        private_key: Union[Buffer, Base64String, "public.PrivateKey"],
+        public_key: Optional[Union[Buffer, Base64String, "public.PublicKey"]] = None,
+        max_peers: int = MAX_CACHED_PEERS,
+    ) -> None:
+        from nacl import public
+
+        if not isinstance(private_key, public.PrivateKey) and len(private_key) == 0:
+            raise ValueError("Private key cannot be empty!")
+
+        self.private_key = (
+            private_key
+            if isinstance(private_key, public.PrivateKey)
+            else public.PrivateKey(
+                b64decode(private_key)
+                if isinstance(private_key, Base64String)
+                else bytes(private_key)
+            )
+        )
+        self.public_key = (
+            self._parse_public_key(public_key)
+            if public_key is not None
+            else self.private_key.public_key
+        )
+        self.max_peers = max_peers
+        self._boxes: "OrderedDict[bytes, public.Box]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_token_json(
+        cls, token_json: Union[str, Dict[str, Any]]
+    ) -> "AsymmetricKeyPair":
+        """Return the key pair of a service token V3, as a JSON string or a dict"""
+        token_dict = (
+            json.loads(token_json) if isinstance(token_json, str) else token_json
+        )
+
+        return cls(
+            private_key=token_dict["privateKey"], public_key=token_dict["publicKey"]
+        )
+
+    @staticmethod
+    def _parse_public_key(
+        public_key: Union[Buffer, Base64String, "public.PublicKey"]
+    ) -> "public.PublicKey":
+        from nacl import public
+
+        if isinstance(public_key, public.PublicKey):
+            return public_key
+
+        if len(public_key) == 0:
+            raise ValueError("Public key cannot be empty!")
+
+        return public.PublicKey(
+            b64decode(public_key)
+            if isinstance(public_key, Base64String)
+            else bytes(public_key)
+        )
+
+    def get_box(
+        self, peer_public_key: Union[Buffer, Base64String, "public.PublicKey"]
+    ) -> "public.Box":
+        """Return the box of the peer with ``peer_public_key``, building it on first use"""
+        from nacl import public
+
+        peer_key = bytes(self._parse_public_key(peer_public_key))
+
+        with self._lock:
+            box = self._boxes.get(peer_key)
+
+            if box is not None:
+                self._boxes.move_to_end(peer_key)
+                return box
+
+        box = public.Box(self.private_key, public.PublicKey(peer_key))
+
+        with self._lock:
+            self._boxes[peer_key] = box
+
+            while len(self._boxes) > self.max_peers:
+                self._boxes.popitem(last=False)
+
+        return box
+
+    def encrypt(
+        self,
+        plaintext: Union[Buffer, str],
+        peer_public_key: Union[Buffer, Base64String, "public.PublicKey"],
+    ) -> AsymmetricCiphertext:
+        """Encrypt ``plaintext`` for the peer, like :func:`encrypt_asymmetric`
+
+        :return: The ciphertext and the random nonce used, base64-encoded
+        """
+        return self.encrypt_batch([plaintext], peer_public_key)[0]
+
+    def decrypt(
+        self,
+        ciphertext: Union[Buffer, Base64String],
+        nonce: Union[Buffer, Base64String],
+        peer_public_key: Union[Buffer, Base64String, "public.PublicKey"],
+    ) -> str:
+        """Decrypt ``ciphertext`` from the peer, like :func:`decrypt_asymmetric`"""
+        if len(ciphertext) == 0 or len(nonce) == 0:
+            raise ValueError("Ciphertext and nonce cannot be empty!")
+
+        box = self.get_box(peer_public_key)
+
+        return box.decrypt(
+            b64decode(ciphertext)
+            if isinstance(ciphertext, Base64String)
+            else ciphertext,
+            b64decode(nonce) if isinstance(nonce, Base64String) else nonce,
+        ).decode("utf-8")
+
+    def encrypt_batch(
+        self,
+        plaintexts: Sequence[Union[Buffer, str]],
+        peer_public_key: Union[Buffer, Base64String, "public.PublicKey"],
+    ) -> List[AsymmetricCiphertext]:
+        """Encrypt each of ``plaintexts`` for the peer, with the same box"""
+        from nacl import utils
+
+        box = self.get_box(peer_public_key)
+        ciphertexts: List[AsymmetricCiphertext] = []
+
+        for plaintext in plaintexts:
+            nonce = utils.random(24)
+            ciphertext = box.encrypt(
+                plaintext.encode("utf-8") if isinstance(plaintext, str) else plaintext,
+                nonce,
+            ).ciphertext
+            ciphertexts.append(
+                (
+                    b64encode(ciphertext).decode("utf-8"),
+                    b64encode(nonce).decode("utf-8"),
+                )
+            )
+
+        return ciphertexts
+
+    def decrypt_batch(
+        self,
+        ciphertexts: Sequence[AsymmetricCiphertext],
+        peer_public_key: Union[Buffer, Base64String, "public.PublicKey"],
+    ) -> List[str]:
+        """Decrypt each ``(ciphertext, nonce)`` of ``ciphertexts`` from the peer, with
+        the same box
+        """
+        box = self.get_box(peer_public_key)
+
+        return [
+            box.decrypt(b64decode(ciphertext), b64decode(nonce)).decode("utf-8")
+            for ciphertext, nonce in ciphertexts
+        ]
+
+
 def create_symmetric_key_helper():
+    from Cryptodome.Random import get_random_bytes
+
     return b64encode(get_random_bytes(32)).decode("utf-8")
 
 
 def encrypt_symmetric_helper(plaintext: str, key: str):
+    from Cryptodome.Cipher import AES
+    from Cryptodome.Random import get_random_bytes
+
     IV_BYTES_SIZE = 12
     iv = get_random_bytes(12)
 
@@ -131,6 +341,8 @@ def encrypt_symmetric_helper(plaintext: str, key: str):
 
 
 def decrypt_symmetric_helper(ciphertext: str, key: str, iv: str, tag: str):
+    from Cryptodome.Cipher import AES
+
     cipher = AES.new(b64decode(key), AES.MODE_GCM, nonce=b64decode(iv))
     plaintext = cipher.decrypt_and_verify(b64decode(ciphertext), b64decode(tag))
 
@@ -148,6 +360,9 @@ def encrypt_symmetric_128_bit_hex_key_utf8(
     :raises ValueError: If either ``plaintext`` or ``key`` is empty
     :return: Ciphered text
     """
+    from Cryptodome.Cipher import AES
+    from Cryptodome.Random import get_random_bytes
+
     if len(key) == 0:
         raise ValueError("The given key is empty!")
 
@@ -178,6 +393,8 @@ def decrypt_symmetric_128_bit_hex_key_utf8(
     :raises ValueError: If ``ciphertext``, ``iv``, ``tag`` or ``key`` are empty or tag/mac does not match
     :return: Deciphered text
     """
+    from Cryptodome.Cipher import AES
+
     if len(tag) == 0 or len(iv) == 0 or len(key) == 0:
         raise ValueError("One of the given parameter is empty!")
 
@@ -193,3 +410,113 @@ def decrypt_symmetric_128_bit_hex_key_utf8(
         return plaintext.decode("utf-8")
     except ValueError:
         raise ValueError("Incorrect decryption or MAC check failed")
+
+
+def encrypt_symmetric_128_bit_hex_key_utf8_batch(
+    key: str, plaintexts: Sequence[str]
+) -> List[SymmetricCiphertext]:
+    """Encrypts each of the ``plaintexts`` with aes-256-gcm using ``key``, like
+    :func:`encrypt_symmetric_128_bit_hex_key_utf8` but preparing the key only once,
+    with the optional ``cryptography`` package when it is installed.
+
+    :param key: UTF-8, 128-bit AES key used for encryption
+    :param plaintexts: texts to encrypt
+    :raises ValueError: If ``key`` is empty
+    :return: Ciphered texts, ivs and tags, in the order of ``plaintexts``
+    """
+    from Cryptodome.Cipher import AES
+    from Cryptodome.Random import get_random_bytes
+
+    if len(key) == 0:
+        raise ValueError("The given key is empty!")
+
+    BLOCK_SIZE_BYTES = 16
+
+    AESGCM, _ = get_aes_gcm()
+    key_bytes = bytes(key, "utf-8")
+    aes_gcm = AESGCM(key_bytes) if AESGCM is not None else None
+    ciphertexts = []
+
+    for plaintext in plaintexts:
+        iv = get_random_bytes(BLOCK_SIZE_BYTES)
+
+        if aes_gcm is not None:
+            sealed = aes_gcm.encrypt(iv, plaintext.encode("utf-8"), None)
+            ciphertext, tag = sealed[:-BLOCK_SIZE_BYTES], sealed[-BLOCK_SIZE_BYTES:]
+        else:
+            cipher = AES.new(key_bytes, AES.MODE_GCM, nonce=iv)
+            ciphertext, tag = cipher.encrypt_and_digest(plaintext.encode("utf-8"))
+
+        ciphertexts.append(
+            (
+                b64encode(ciphertext).decode("utf-8"),
+                b64encode(iv).decode("utf-8"),
+                b64encode(tag).decode("utf-8"),
+            )
+        )
+
+    return ciphertexts
+
+
+def decrypt_symmetric_128_bit_hex_key_utf8_batch(
+    key: str,
+    ciphertexts: Sequence[SymmetricCiphertext],
+    executor: Optional[Executor] = None,
+) -> List[str]:
+    """Decrypts each of the ``ciphertexts`` with aes-256-gcm using ``key``, like
+    :func:`decrypt_symmetric_128_bit_hex_key_utf8` but preparing the key only once.
+
+    The ciphertexts are split into batches of ``DECRYPT_BATCH_SIZE``, decrypted on
+    ``executor`` when given. When the optional ``cryptography`` package is installed,
+    its OpenSSL-backed AES-GCM is used, which is much faster on many small values.
+
+    :param key: UTF-8, 128-bit hex AES key
+    :param ciphertexts: base64 ciphered texts, ivs and tags to decrypt
+    :param executor: The executor running the batches, or ``None`` to run them inline
+    :raises ValueError: If ``key`` or any iv or tag is empty or a tag/mac does not match
+    :return: Deciphered texts, in the order of ``ciphertexts``
+    """
+    from Cryptodome.Cipher import AES
+
+    if len(key) == 0:
+        raise ValueError("One of the given parameter is empty!")
+
+    AESGCM, InvalidTag = get_aes_gcm()
+    key_bytes = bytes(key, "utf-8")
+    aes_gcm = AESGCM(key_bytes) if AESGCM is not None else None
+
+    def decrypt_batch(batch: Sequence[SymmetricCiphertext]) -> List[str]:
+        plaintexts = []
+
+        for ciphertext, iv, tag in batch:
+            if len(tag) == 0 or len(iv) == 0:
+                raise ValueError("One of the given parameter is empty!")
+
+            try:
+                if aes_gcm is not None:
+                    plaintext = aes_gcm.decrypt(
+                        b64decode(iv), b64decode(ciphertext) + b64decode(tag), None
+                    )
+                else:
+                    cipher = AES.new(key_bytes, AES.MODE_GCM, nonce=b64decode(iv))
+                    plaintext = cipher.decrypt_and_verify(
+                        b64decode(ciphertext), b64decode(tag)
+                    )
+            except (ValueError, InvalidTag):
+                raise ValueError("Incorrect decryption or MAC check failed") from None
+
+            plaintexts.append(plaintext.decode("utf-8"))
+
+        return plaintexts
+
+    batches = [
+        ciphertexts[start : start + DECRYPT_BATCH_SIZE]
+        for start in range(0, len(ciphertexts), DECRYPT_BATCH_SIZE)
+    ]
+
+    if executor is None or len(batches) < 2:
+        results = [decrypt_batch(batch) for batch in batches]
+    else:
+        results = list(executor.map(decrypt_batch, batches))
+
+    return [plaintext for batch_plaintexts in results for plaintext in batch_plaintexts]
@@ -1,15 +1,51 @@
-from typing import Any, Optional, Union
-from urllib.parse import urljoin
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+from urllib.parse import urljoin, urlsplit
 
 import requests
-from requests.adapters import HTTPAdapter
+from infisical.constants import DEFAULT_TIMEOUT
+from infisical.utils.instrumentation import Instrumentation, RequestEvent, get_endpoint
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
 from urllib3.util import Retry
 
-DEFAULT_TIMEOUT = 40  # seconds
+if TYPE_CHECKING:
+    import httpx
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# A single timeout, or separate connect and read timeouts, in seconds
+Timeout = Union[float, Tuple[float, float]]
+# What holds the connections of a session, which sessions can share
+ConnectionPool = Union[HTTPAdapter, "httpx.HTTPTransport"]
+
+
+class PoolStats(NamedTuple):
+    scheme: str
+    host: str
+    port: Optional[int]
+    # Connections opened since the pool was created, including discarded ones
+    num_connections: int
+    num_requests: int
+    idle_connections: int
+    maxsize: int
 
 
 class BaseUrlSession(requests.Session):
     base_url = ""
+    instrumentation: Optional[Instrumentation] = None
 
     def __init__(self, base_url: Optional[str] = None) -> None:
         if base_url:
@@ -23,8 +59,46 @@ class BaseUrlSession(requests.Session):
         *args: Any,
         **kwargs: Any,
     ) -> requests.Response:
-        url = self.create_url(url)
-        return super().request(method, url, *args, **kwargs)
+        if self.instrumentation is None:
+            return super().request(method, self.create_url(url), *args, **kwargs)
+
+        start = time.perf_counter()
+        method = method.decode() if isinstance(method, bytes) else method
+        event = RequestEvent(
+            method=method.upper(),
+            endpoint=get_endpoint(url),
+            status_code=None,
+            duration=0,
+            retries=0,
+            bytes_sent=0,
+            bytes_received=0,
+        )
+
+        try:
+            response = super().request(method, self.create_url(url), *args, **kwargs)
+        except Exception:
+            self.instrumentation.on_request(
+                event._replace(duration=time.perf_counter() - start)
+            )
+            raise
+
+        retries = getattr(response.raw, "retries", None)
+        body = response.request.body
+        self.instrumentation.on_request(
+            event._replace(
+                status_code=response.status_code,
+                duration=time.perf_counter() - start,
+                retries=len(retries.history) if retries is not None else 0,
+                bytes_sent=len(body) if body is not None else 0,
+                bytes_received=(
+                    len(response.content)
+                    if not kwargs.get("stream")
+                    else int(response.headers.get("Content-Length", 0))
+                ),
+            )
+        )
+
+        return response
 
     def prepare_request(self, request: requests.Request) -> requests.PreparedRequest:
         request.url = self.create_url(request.url)
@@ -51,30 +125,398 @@ class TimeoutHTTPAdapter(HTTPAdapter):
         return super().send(request, *args, **kwargs)
 
 
+class HTTP2Response:
+    """The part of :class:`requests.Response` used by the SDK, over a response of
+    :class:`HTTP2Session`.
+    """
+
+    def __init__(self, response: "httpx.Response", retries: int = 0) -> None:
+        self._response = response
+        self.retries = retries
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> Any:
+        return self._response.headers
+
+    @property
+    def url(self) -> str:
+        return str(self._response.url)
+
+    @property
+    def http_version(self) -> str:
+        return self._response.http_version
+
+    @property
+    def content(self) -> bytes:
+        return self._response.read()
+
+    @property
+    def text(self) -> str:
+        self._response.read()
+        return self._response.text
+
+    def json(self, **kwargs: Any) -> Any:
+        self._response.read()
+        return self._response.json(**kwargs)
+
+    def iter_content(self, chunk_size: Optional[int] = 1) -> Iterator[bytes]:
+        return self._response.iter_bytes(chunk_size=chunk_size)
+
+    def raise_for_status(self) -> None:
+        if 400 <= self.status_code < 600:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.HTTPError(
+                f"{self.status_code} {kind} Error: {self._response.reason_phrase} "
+                f"for url: {self.url}",
+                response=self,
+            )
+
+    def close(self) -> None:
+        self._response.close()
+
+    def __enter__(self) -> "HTTP2Response":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class HTTP2Session:
+    """A drop-in replacement of :class:`BaseUrlSession` sending the requests over
+    HTTP/2 with `httpx <https://www.python-httpx.org>`_, so that concurrent requests
+    share one connection per host instead of a pool of connections.
+
+    HTTP/2 is negotiated with ALPN over https and falls back to HTTP/1.1 if the server
+    does not support it. Over plain http, HTTP/2 is only used with ``prior_knowledge``.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        retries: int = 3,
+        backoff_factor: float = 1,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        prior_knowledge: bool = False,
+        transport: Optional["httpx.HTTPTransport"] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "HTTP/2 requires httpx and h2: pip install 'infisical[http2]'"
+            ) from None
+
+        self.base_url = base_url or ""
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        # Decides which responses are retried, and for how long to wait, like the
+        # adapter of BaseUrlSession does: only idempotent methods are retried
+        self.retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+        )
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.instrumentation = instrumentation
+        self.num_requests = 0
+        self._lock = threading.Lock()
+
+        # The transport holds the connections, and can be shared between sessions
+        self.transport = transport or httpx.HTTPTransport(
+            http1=not prior_knowledge,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize
+            ),
+            retries=retries,
+        )
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=self._get_timeout(timeout),
+            transport=self.transport,
+        )
+
+    @property
+    def headers(self) -> Any:
+        return self._client.headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        timeout: Optional[Timeout] = None,
+    ) -> HTTP2Response:
+        request_options: Dict[str, Any] = {}
+
+        if timeout is not None:
+            request_options["timeout"] = self._get_timeout(timeout)
+
+        request = self._client.build_request(
+            method, url, params=params, json=json, headers=headers, **request_options
+        )
+
+        if self.instrumentation is None:
+            return self._send(request, stream)
+
+        start = time.perf_counter()
+        event = RequestEvent(
+            method=request.method,
+            endpoint=get_endpoint(url),
+            status_code=None,
+            duration=0,
+            retries=0,
+            bytes_sent=len(request.content),
+            bytes_received=0,
+        )
+
+        try:
+            response = self._send(request, stream)
+        except Exception:
+            self.instrumentation.on_request(
+                event._replace(duration=time.perf_counter() - start)
+            )
+            raise
+
+        self.instrumentation.on_request(
+            event._replace(
+                status_code=response.status_code,
+                duration=time.perf_counter() - start,
+                retries=response.retries,
+                bytes_received=(
+                    len(response.content)
+                    if not stream
+                    else int(response.headers.get("Content-Length", 0))
+                ),
+            )
+        )
+
+        return response
+
+    def _get_timeout(self, timeout: Timeout) -> "httpx.Timeout":
+        import httpx
+
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+        else:
+            connect_timeout = read_timeout = timeout
+
+        # Without pool_block, waiting for a connection never times out like the
+        # connection pool of requests would open a new one
+        return httpx.Timeout(
+            read_timeout,
+            connect=connect_timeout,
+            pool=read_timeout if self.pool_block else None,
+        )
+
+    def _send(self, request: "httpx.Request", stream: bool) -> HTTP2Response:
+        for attempt in range(self.retries + 1):
+            # The cookies are never read, like the cookies rejected by BaseUrlSession
+            response = self._client.send(request, stream=True)
+            self._client.cookies.clear()
+
+            with self._lock:
+                self.num_requests += 1
+
+            retry_after = response.headers.get("Retry-After")
+
+            if attempt == self.retries or not self.retry.is_retry(
+                request.method, response.status_code, retry_after is not None
+            ):
+                break
+
+            response.close()
+
+            if (
+                retry_after is not None
+                and response.status_code in Retry.RETRY_AFTER_STATUS_CODES
+            ):
+                time.sleep(self.retry.parse_retry_after(retry_after))
+            elif attempt > 0:
+                time.sleep(self.backoff_factor * (2**attempt))
+
+        if not stream:
+            response.read()
+
+        return HTTP2Response(response, retries=attempt)
+
+    def get(self, url: str, **kwargs: Any) -> HTTP2Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> HTTP2Response:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> HTTP2Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> HTTP2Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def get_pool_stats(self) -> List[PoolStats]:
+        connections = getattr(getattr(self.transport, "_pool", None), "connections", [])
+        if not connections and not self.num_requests:
+            return []
+
+        url = urlsplit(self.base_url)
+
+        return [
+            PoolStats(
+                scheme=url.scheme,
+                host=url.hostname or "",
+                port=url.port,
+                num_connections=len(connections),
+                num_requests=self.num_requests,
+                idle_connections=len(
+                    [connection for connection in connections if connection.is_idle()]
+                ),
+                maxsize=self.pool_maxsize,
+            )
+        ]
+
+    def close(self) -> None:
+        self._client.close()
+
+
+# The session of a client, sending its requests over HTTP/1.1 or HTTP/2
+ApiRequest = Union[BaseUrlSession, HTTP2Session]
+
+
 def get_http_client(
     base_url: Optional[str],
     retries: int = 3,
-    backoff_factor: int = 1,
-    timeout: int = DEFAULT_TIMEOUT,
-) -> BaseUrlSession:
-    """Returns a pre-configured :class:`requests.Session` with a optional ``base_url``
-    and some sane options for timeout and retry handling.
+    backoff_factor: float = 1,
+    timeout: Timeout = DEFAULT_TIMEOUT,
+    pool_connections: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+    http2: bool = False,
+    http2_prior_knowledge: bool = False,
+    connection_pool: Optional[ConnectionPool] = None,
+    instrumentation: Optional[Instrumentation] = None,
+) -> Union[BaseUrlSession, HTTP2Session]:
+    """Returns a pre-configured :class:`BaseUrlSession`, a :class:`requests.Session`
+    with an optional ``base_url``, or a :class:`HTTP2Session` with ``http2``, with
+    some sane options for timeout and retry handling.
 
     :param base_url: (optional) A base url used for each request made with this client
-    :param retries: The number of retries to do if request fail, defaults to 3
+    :param retries: The number of retries of the requests of idempotent methods that
+        fail, defaults to 3
     :param backoff_factor: A backoff factor to apply between attempts after the second try, defaults to 1
-    :param timeout: The timeout in seconds, defaults to 40
-    :return: A ready-to-use instance of :class:`requests.Session`
+    :param timeout: The timeout in seconds, or a ``(connect, read)`` tuple, defaults to 40
+    :param pool_connections: The number of hosts to keep a connection pool for, defaults to 10
+    :param pool_maxsize: The number of connections kept open per host, defaults to 10
+    :param pool_block: Whether to wait for a free connection instead of opening one that
+        is discarded after use when all of them are busy, defaults to False
+    :param http2: Whether to return a :class:`HTTP2Session` instead, defaults to False
+    :param http2_prior_knowledge: Whether to use HTTP/2 over plain http without
+        negotiating it first, defaults to False
+    :param connection_pool: The connection pool of another client, from
+        :func:`get_connection_pool`, to share instead of creating one with the
+        options above
+    :param instrumentation: The instrumentation receiving the measurements of every
+        request, if any
+    :return: A ready-to-use :class:`BaseUrlSession` or :class:`HTTP2Session`
     """
-    retry_strategy = Retry(
-        total=retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=[429, 500, 502, 503, 504],
+    # A connection pool only holds the connections of the HTTP version it was made for
+    if http2:
+        if isinstance(connection_pool, HTTPAdapter):
+            raise ValueError(
+                "An HTTP/2 client cannot share the pool of an HTTP/1.1 client!"
+            )
+
+        return HTTP2Session(
+            base_url=base_url,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            timeout=timeout,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            prior_knowledge=http2_prior_knowledge,
+            transport=connection_pool,
+            instrumentation=instrumentation,
+        )
+
+    if connection_pool is not None and not isinstance(connection_pool, HTTPAdapter):
+        raise ValueError(
+            "An HTTP/1.1 client cannot share the pool of an HTTP/2 client!"
+        )
+
+    adapter = connection_pool or TimeoutHTTPAdapter(
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+        ),
+        timeout=timeout,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
     )
-    adapter = TimeoutHTTPAdapter(max_retries=retry_strategy, timeout=timeout)
 
     http = BaseUrlSession(base_url=base_url)
+    http.instrumentation = instrumentation
+    # The API authenticates with a bearer token: rejecting cookies leaves the pool
+    # of the adapter, which is thread-safe, as the only state shared between threads
+    http.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
     http.mount("https://", adapter)
     http.mount("http://", adapter)
 
     return http
+
+
+def get_connection_pool(http: Union[requests.Session, HTTP2Session]) -> ConnectionPool:
+    """Returns the connection pool of ``http``, to share with other sessions created
+    with :func:`get_http_client`
+    """
+    if isinstance(http, HTTP2Session):
+        return http.transport
+
+    return cast(HTTPAdapter, http.get_adapter("https://"))
+
+
+def get_pool_stats(http: Union[requests.Session, HTTP2Session]) -> List[PoolStats]:
+    """Returns the statistics of the connection pools of the adapters of ``http``,
+    one per host it connected to.
+    """
+    if isinstance(http, HTTP2Session):
+        return http.get_pool_stats()
+
+    stats: List[PoolStats] = []
+    adapters = {id(adapter): adapter for adapter in http.adapters.values()}
+
+    for adapter in adapters.values():
+        pool_manager = getattr(adapter, "poolmanager", None)
+
+        if pool_manager is None:
+            continue
+
+        for pool_key in pool_manager.pools.keys():
+            pool = pool_manager.pools.get(pool_key)
+
+            if pool is None:
+                continue
+
+            stats.append(
+                PoolStats(
+                    scheme=pool.scheme,
+                    host=pool.host,
+                    port=pool.port,
+                    num_connections=pool.num_connections,
+                    num_requests=pool.num_requests,
+                    idle_connections=pool.pool.qsize() if pool.pool else 0,
+                    maxsize=pool.pool.maxsize if pool.pool else 0,
+                )
+            )
+
+    return stats
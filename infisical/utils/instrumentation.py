@@ -0,0 +1,153 @@
+import time
+from typing import Any, Dict, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from typing_extensions import Literal
+
+SECRET_ROUTE_PREFIX = "/api/v3/secrets/"
+
+CacheLookupResult = Literal["hit", "stale", "miss"]
+
+
+class RequestEvent(NamedTuple):
+    method: str
+    # The route of the request, e.g. "/api/v3/secrets/{secret_name}"
+    endpoint: str
+    # None when no response was received, e.g. after a connection error
+    status_code: Optional[int]
+    # From sending the request to receiving the response, retries included, in
+    # seconds; streamed responses are measured up to their headers
+    duration: float
+    retries: int
+    bytes_sent: int
+    bytes_received: int
+
+
+def get_endpoint(url: str) -> str:
+    """Return the route of ``url``, without the name of the secret it may contain so
+    that measurements are not split per secret
+    """
+    path = urlsplit(url).path
+
+    if path.startswith(SECRET_ROUTE_PREFIX) and path != SECRET_ROUTE_PREFIX:
+        return SECRET_ROUTE_PREFIX + "{secret_name}"
+
+    return path
+
+
+class Instrumentation:
+    """Receives the measurements of a client, given as its ``instrumentation``.
+
+    Every hook does nothing by default: subclasses override the ones they need. Hooks
+    are called synchronously by the threads making the calls, so they should be fast
+    and must not raise. Without instrumentation, the client measures nothing.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Called once per API call, after its retries, even if it failed"""
+
+    def on_decrypt(self, count: int, duration: float) -> None:
+        """Called after decrypting ``count`` ciphertexts in ``duration`` seconds"""
+
+    def on_cache_lookup(self, result: CacheLookupResult) -> None:
+        """Called for every read of the secret cache"""
+
+    def on_bootstrap(self, duration: float) -> None:
+        """Called once the project key was fetched and opened, in ``duration`` seconds"""
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Record the measurements of a client as OpenTelemetry metrics, and its API calls
+    as spans.
+
+    Requires ``opentelemetry-api``; the metrics and spans go wherever the
+    OpenTelemetry SDK of the application exports them.
+
+    :param meter: The meter of the metrics, the ``infisical`` meter of the global
+        meter provider by default
+    :param tracer: The tracer of the spans, or ``None`` to record no span
+    """
+
+    def __init__(self, meter: Any = None, tracer: Any = None) -> None:
+        if meter is None:
+            from infisical.__version__ import __version__
+            from opentelemetry import metrics
+
+            meter = metrics.get_meter("infisical", __version__)
+
+        self.tracer = tracer
+
+        if tracer is not None:
+            from opentelemetry.trace import SpanKind
+
+            self._span_kind = SpanKind.CLIENT
+        self.request_duration = meter.create_histogram(
+            "infisical.client.request.duration",
+            unit="s",
+            description="Duration of the API calls",
+        )
+        self.request_retries = meter.create_counter(
+            "infisical.client.request.retries",
+            description="Retries of the API calls",
+        )
+        self.request_sent = meter.create_counter(
+            "infisical.client.request.sent", unit="By", description="Bytes sent"
+        )
+        self.request_received = meter.create_counter(
+            "infisical.client.request.received", unit="By", description="Bytes received"
+        )
+        self.decrypt_duration = meter.create_histogram(
+            "infisical.client.decrypt.duration",
+            unit="s",
+            description="Duration of the decryption of fetched secrets",
+        )
+        self.decrypt_count = meter.create_counter(
+            "infisical.client.decrypt.ciphertexts",
+            description="Ciphertexts decrypted",
+        )
+        self.cache_lookups = meter.create_counter(
+            "infisical.client.cache.lookups",
+            description="Reads of the secret cache, by result",
+        )
+        self.bootstrap_duration = meter.create_histogram(
+            "infisical.client.bootstrap.duration",
+            unit="s",
+            description="Duration of fetching and opening the project key",
+        )
+
+    def on_request(self, event: RequestEvent) -> None:
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.template": event.endpoint,
+        }
+
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+
+        self.request_duration.record(event.duration, attributes)
+        self.request_sent.add(event.bytes_sent, attributes)
+        self.request_received.add(event.bytes_received, attributes)
+
+        if event.retries:
+            self.request_retries.add(event.retries, attributes)
+
+        if self.tracer is not None:
+            # The span is recorded once the call is over, as a child of the current one
+            end_time = time.time_ns()
+            span = self.tracer.start_span(
+                f"{event.method} {event.endpoint}",
+                kind=self._span_kind,
+                attributes={**attributes, "http.request.resend_count": event.retries},
+                start_time=end_time - int(event.duration * 1e9),
+            )
+            span.end(end_time=end_time)
+
+    def on_decrypt(self, count: int, duration: float) -> None:
+        self.decrypt_duration.record(duration)
+        self.decrypt_count.add(count)
+
+    def on_cache_lookup(self, result: CacheLookupResult) -> None:
+        self.cache_lookups.add(1, {"infisical.cache.result": result})
+
+    def on_bootstrap(self, duration: float) -> None:
+        self.bootstrap_duration.record(duration)
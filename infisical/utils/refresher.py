@@ -0,0 +1,95 @@
+import queue
+import threading
+from typing import Callable, Dict, Hashable, List, Set
+
+from infisical.logger import logger
+
+# Queued once per worker thread to stop it
+_STOP = object()
+
+
+class BackgroundRefresher:
+    """Run refresh jobs on daemon worker threads, at most once per pending key.
+
+    Scheduling a key that is already waiting or running is a no-op, so a hot key
+    read by many threads triggers a single refresh.
+
+    :param max_workers: The number of worker threads, started on first use
+    """
+
+    def __init__(self, max_workers: int = 2) -> None:
+        self.max_workers = max_workers
+        self._queue: "queue.Queue[Hashable]" = queue.Queue()
+        self._jobs: Dict[Hashable, Callable[[], object]] = {}
+        self._pending: Set[Hashable] = set()
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def schedule(self, key: Hashable, job: Callable[[], object]) -> bool:
+        """Schedule ``job`` to refresh ``key``
+
+        :return: Whether the job was scheduled, ``False`` if ``key`` is already pending
+            or the refresher is closed
+        """
+        with self._lock:
+            if key in self._pending or self._closed:
+                return False
+
+            self._pending.add(key)
+            self._jobs[key] = job
+
+            if len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._work, name="infisical-refresher", daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+
+        self._queue.put(key)
+
+        return True
+
+    def is_pending(self, key: Hashable) -> bool:
+        return key in self._pending
+
+    def _work(self) -> None:
+        while True:
+            key = self._queue.get()
+
+            if key is _STOP:
+                self._queue.task_done()
+                return
+
+            try:
+                job = self._jobs.get(key)
+
+                # Jobs still pending when the refresher was closed are dropped
+                if job is not None:
+                    job()
+            except Exception as exc:
+                logger.warning("Background refresh of %s failed: %s", key, exc)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                    self._jobs.pop(key, None)
+                self._queue.task_done()
+
+    def join(self) -> None:
+        """Block until every scheduled job has run"""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Drop the pending jobs and stop the worker threads, once they finish the
+        jobs they are running
+        """
+        with self._lock:
+            if self._closed:
+                return
+
+            self._closed = True
+            self._jobs.clear()
+            workers = len(self._workers)
+
+        for _ in range(workers):
+            self._queue.put(_STOP)
@@ -0,0 +1,93 @@
+import hashlib
+import threading
+import weakref
+from typing import TYPE_CHECKING, Callable, Hashable, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from infisical.models.secret_service import ClientConfig
+    from infisical.utils.cache import SecretCache
+    from infisical.utils.http import BaseUrlSession, HTTP2Session
+    from infisical.utils.singleflight import SingleFlight
+
+# The site URL and a fingerprint of the token, never the token itself, followed by
+# any option the state depends on
+RegistryKey = Tuple[Hashable, ...]
+
+
+def get_registry_key(site_url: str, token: str, *options: Hashable) -> RegistryKey:
+    return (
+        site_url.rstrip("/"),
+        hashlib.sha256(token.encode("utf-8")).hexdigest(),
+        *options,
+    )
+
+
+class SharedClientState:
+    """The HTTP session, the client config with its workspace key, the cache and the
+    in-flight requests shared by the clients of a process using the same credentials
+    and options.
+
+    The session is only created by the first request of one of the clients.
+    """
+
+    def __init__(
+        self,
+        api_request_factory: Callable[[], Union["BaseUrlSession", "HTTP2Session"]],
+        client_config: "ClientConfig",
+        cache: "SecretCache",
+        flights: "SingleFlight",
+    ) -> None:
+        self.client_config = client_config
+        self.cache = cache
+        self.flights = flights
+        self._api_request: Optional[Union["BaseUrlSession", "HTTP2Session"]] = None
+        self._api_request_factory = api_request_factory
+        self._lock = threading.Lock()
+
+    @property
+    def api_request(self) -> Union["BaseUrlSession", "HTTP2Session"]:
+        if self._api_request is None:
+            with self._lock:
+                if self._api_request is None:
+                    self._api_request = self._api_request_factory()
+
+        return self._api_request
+
+
+class ClientStateRegistry:
+    """The states shared by the clients of a process, by site URL, token and options.
+
+    A state is only referenced weakly, so it is released with the last client
+    using it.
+    """
+
+    def __init__(self) -> None:
+        self._states: "weakref.WeakValueDictionary[RegistryKey, SharedClientState]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def register(
+        self, key: RegistryKey, create_state: Callable[[], SharedClientState]
+    ) -> SharedClientState:
+        """Return the state registered for ``key``, registering the one returned by
+        ``create_state`` if there is none yet
+        """
+        with self._lock:
+            state = self._states.get(key)
+
+            if state is None:
+                state = create_state()
+                self._states[key] = state
+
+            return state
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+
+client_state_registry = ClientStateRegistry()
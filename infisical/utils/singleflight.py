@@ -0,0 +1,45 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls sharing the same key into a single execution.
+
+    The first caller for a key runs the function while the callers arriving before it
+    completes wait for, and receive, the same result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run ``func`` unless a call for ``key`` is already in flight, and return its result"""
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+
+        if not is_leader:
+            return cast(T, future.result())
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
@@ -0,0 +1,203 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from infisical.logger import logger
+from infisical.models.lazy import LazySecretBundle
+from infisical.models.models import SecretBundle
+from infisical.models.secret_service import WorkspaceKeyEnvelope
+from infisical.models.snapshot import Snapshot, SnapshotScope
+from infisical.utils.crypto import (
+    decrypt_symmetric_128_bit_hex_key_utf8,
+    encrypt_symmetric_128_bit_hex_key_utf8,
+)
+from pydantic import ValidationError
+
+try:
+    import fcntl
+except ImportError:  # no cov
+    fcntl = None  # type: ignore
+
+ScopeKey = Tuple[str, str, bool]
+
+
+class SecretSnapshot:
+    """A local file holding the secrets last fetched for each environment and path.
+
+    The secrets are encrypted with the workspace key, which is itself stored the way
+    the API returns it, encrypted for the token. Reading the snapshot back therefore
+    requires the same token but no request to the API.
+
+    The file can be shared by the processes of a host: it is only re-read when
+    another process replaced it, and :meth:`lock` serializes its updates across
+    processes (on platforms providing ``fcntl``).
+
+    :param path: The path of the snapshot file
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.key_envelope: Optional[WorkspaceKeyEnvelope] = None
+        self.scopes: Dict[ScopeKey, SnapshotScope] = {}
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file: Optional[IO[Any]] = None
+        self._file_state: Optional[Tuple[int, int, int]] = None
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold the snapshot exclusively, against the other threads and processes.
+
+        The lock is reentrant within a thread.
+        """
+        with self._lock:
+            if self._lock_depth == 0 and fcntl is not None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._lock_file = open(f"{self.path}.lock", "a")
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+
+            self._lock_depth += 1
+
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+
+                if self._lock_depth == 0 and self._lock_file is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def load(self) -> bool:
+        """Read the snapshot file, unless it did not change since the last read
+
+        :return: Whether a valid snapshot is loaded
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return self.key_envelope is not None
+
+        file_state = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        if file_state == self._file_state:
+            return self.key_envelope is not None
+
+        try:
+            snapshot = Snapshot.parse_file(self.path)
+        except (OSError, ValueError, ValidationError) as exc:
+            logger.warning("Ignoring unreadable snapshot %s: %s", self.path, exc)
+            return self.key_envelope is not None
+
+        with self._lock:
+            self._file_state = file_state
+            self.key_envelope = snapshot.key_envelope
+            self.scopes = {
+                (scope.environment, scope.path, scope.include_imports): scope
+                for scope in snapshot.scopes
+            }
+
+        return True
+
+    def get_secrets(
+        self, scope_key: ScopeKey, workspace_key: str
+    ) -> Optional[Tuple[List[SecretBundle], datetime]]:
+        """Decrypt the secrets stored for ``scope_key``
+
+        :return: The secret bundles and when they were fetched, or ``None``
+        """
+        scope = self.scopes.get(scope_key)
+
+        if scope is None:
+            return None
+
+        plaintext = decrypt_symmetric_128_bit_hex_key_utf8(
+            ciphertext=scope.ciphertext,
+            iv=scope.iv,
+            tag=scope.tag,
+            key=workspace_key,
+        )
+
+        secret_bundles = [
+            LazySecretBundle.from_encrypted_dict(obj, workspace_key)
+            if "secretValueCiphertext" in obj
+            else SecretBundle.parse_obj(obj)
+            for obj in json.loads(plaintext)
+        ]
+
+        return secret_bundles, scope.fetched_at
+
+    def save(
+        self,
+        key_envelope: WorkspaceKeyEnvelope,
+        workspace_key: str,
+        scope_key: Optional[ScopeKey] = None,
+        secret_bundles: Optional[List[SecretBundle]] = None,
+    ) -> None:
+        """Store ``secret_bundles`` for ``scope_key``, or only the key envelope, and
+        atomically rewrite the file, keeping the scopes stored by other processes.
+        """
+        with self.lock():
+            self.load()
+
+            if self.key_envelope != key_envelope:
+                # Scopes encrypted with another workspace key cannot be read anymore
+                self.scopes = {}
+
+            self.key_envelope = key_envelope
+
+            if scope_key is not None and secret_bundles is not None:
+                # Lazy bundles are stored encrypted, without decrypting their value
+                plaintext = json.dumps(
+                    [
+                        secret_bundle.to_encrypted_dict()
+                        if isinstance(secret_bundle, LazySecretBundle)
+                        else json.loads(secret_bundle.json(by_alias=True))
+                        for secret_bundle in secret_bundles
+                    ]
+                )
+                ciphertext, iv, tag = encrypt_symmetric_128_bit_hex_key_utf8(
+                    plaintext=plaintext, key=workspace_key
+                )
+                environment, path, include_imports = scope_key
+
+                self.scopes[scope_key] = SnapshotScope(
+                    environment=environment,
+                    path=path,
+                    include_imports=include_imports,
+                    fetched_at=datetime.now(),
+                    ciphertext=ciphertext,
+                    iv=iv,
+                    tag=tag,
+                )
+
+            snapshot = Snapshot(
+                key_envelope=key_envelope, scopes=list(self.scopes.values())
+            )
+            self._write(snapshot.json())
+
+    def _write(self, content: str) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        # The temporary file is created with 0600 permissions in the same directory,
+        # so that the final rename is atomic and readers never see a partial file
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=directory, prefix=".infisical-snapshot-"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                file.write(content)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+        stat = os.stat(self.path)
+        self._file_state = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,130 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+WHITESPACE = " \t\n\r"
+
+
+class JSONStream:
+    """An incremental reader of a JSON document received in chunks.
+
+    Containers can be walked one item at a time with :meth:`iter_object` and
+    :meth:`iter_array`, and any value can be read whole with :meth:`read_value`, so
+    that only the value being read is held in memory instead of the whole document.
+
+    :param chunks: The bytes of the document, e.g. ``response.iter_content()``
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def _read_more(self) -> bool:
+        """Append the next chunk to the buffer, dropping what was consumed already
+
+        :return: Whether there was more data to read
+        """
+        if self._exhausted:
+            return False
+
+        self._buffer = self._buffer[self._position :]
+        self._position = 0
+
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+
+            if text:
+                self._buffer += text
+                return True
+
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._exhausted = True
+
+        return False
+
+    def peek(self) -> str:
+        """Return the next character that is not whitespace, without consuming it"""
+        while True:
+            while self._position < len(self._buffer):
+                if self._buffer[self._position] not in WHITESPACE:
+                    return self._buffer[self._position]
+                self._position += 1
+
+            if not self._read_more():
+                raise ValueError("Unexpected end of JSON document")
+
+    def _expect(self, character: str) -> None:
+        if self.peek() != character:
+            raise ValueError(
+                f"Expected {character!r} at {self._position} of the JSON document"
+            )
+
+        self._position += 1
+
+    def read_value(self) -> Any:
+        """Read the next value whole"""
+        self.peek()
+
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._read_more():
+                    continue
+                raise
+
+            # A number at the end of the buffer may continue in the next chunk
+            if end < len(self._buffer) or not self._read_more():
+                self._position = end
+                return value
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate over the keys of the next object.
+
+        Each value must be consumed, with :meth:`read_value` or by iterating over it,
+        before resuming the iteration.
+        """
+        self._expect("{")
+
+        if self.peek() == "}":
+            self._position += 1
+            return
+
+        while True:
+            key = self.read_value()
+
+            if not isinstance(key, str):
+                raise ValueError("Expected a key in the JSON object")
+
+            self._expect(":")
+            yield key
+
+            if self.peek() == "}":
+                self._position += 1
+                return
+
+            self._expect(",")
+
+    def iter_array(self) -> Iterator[None]:
+        """Iterate over the items of the next array.
+
+        Like with :meth:`iter_object`, each item must be consumed before resuming.
+        """
+        self._expect("[")
+
+        if self.peek() == "]":
+            self._position += 1
+            return
+
+        while True:
+            yield None
+
+            if self.peek() == "]":
+                self._position += 1
+                return
+
+            self._expect(",")
@@ -0,0 +1,60 @@
+from typing import Dict, Hashable, NamedTuple, Tuple
+
+from infisical.models.models import SecretBundle
+from infisical.models.raw import RawSecret
+
+SecretFingerprint = Tuple[int, str, str, str]
+
+
+class SyncedSecret(NamedTuple):
+    fingerprint: SecretFingerprint
+    secret_bundle: SecretBundle
+
+
+# The secrets decrypted by the last sync of a scope, keyed by secret id
+SyncedSecrets = Dict[str, SyncedSecret]
+
+
+def get_secret_fingerprint(secret: RawSecret) -> SecretFingerprint:
+    """Return what identifies the content of ``secret``: any change of its version,
+    update time or ciphertexts means it must be decrypted again.
+    """
+    return (
+        secret.version,
+        secret.raw_updated_at,
+        secret.secret_key_ciphertext,
+        secret.secret_value_ciphertext,
+    )
+
+
+class SecretSyncState:
+    """The secrets last decrypted for each environment and path, so that a sync only
+    decrypts the secrets that changed since the previous one.
+
+    The secrets of a scope are replaced as a whole, so readers never see a
+    partially updated scope.
+    """
+
+    def __init__(self) -> None:
+        self.decrypted = 0
+        self.reused = 0
+        self._scopes: Dict[Hashable, SyncedSecrets] = {}
+
+    def get(self, scope_key: Hashable) -> SyncedSecrets:
+        return self._scopes.get(scope_key, {})
+
+    def set(self, scope_key: Hashable, synced_secrets: SyncedSecrets) -> None:
+        previous_secrets = self._scopes.get(scope_key, {})
+        reused = sum(
+            1
+            for secret_id, synced_secret in synced_secrets.items()
+            if secret_id in previous_secrets
+            and previous_secrets[secret_id].fingerprint == synced_secret.fingerprint
+        )
+
+        self.reused += reused
+        self.decrypted += len(synced_secrets) - reused
+        self._scopes[scope_key] = synced_secrets
+
+    def clear(self) -> None:
+        self._scopes.clear()
@@ -0,0 +1,78 @@
+import hashlib
+from typing import Any, Dict, Hashable, Mapping, NamedTuple, Optional
+
+
+def hash_content(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+class ResponseValidator(NamedTuple):
+    """What identifies the content of a response, to ask the API whether it changed
+    and to recognize an identical response when the API cannot tell.
+    """
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+
+    @classmethod
+    def from_response(
+        cls, headers: Mapping[str, str], content: bytes
+    ) -> "ResponseValidator":
+        return cls(
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            content_hash=hash_content(content),
+        )
+
+    def to_headers(self) -> Dict[str, str]:
+        """Return the headers making a request conditional on a change of content"""
+        headers = {}
+
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class ValidatedResponse(NamedTuple):
+    validator: ResponseValidator
+    # What was decoded from the response, reused while it does not change
+    value: Any
+
+
+class ResponseValidatorCache:
+    """The validators of the last responses of each request, with what was decoded
+    from them, so that unchanged responses are neither parsed nor decrypted again.
+
+    Entries are replaced as a whole, so readers never see a validator paired with
+    the value of another response.
+    """
+
+    def __init__(self) -> None:
+        self.not_modified = 0
+        self.modified = 0
+        self._entries: Dict[Hashable, ValidatedResponse] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[ValidatedResponse]:
+        return self._entries.get(key)
+
+    def get_validator(self, key: Hashable) -> Optional[ResponseValidator]:
+        validated_response = self._entries.get(key)
+
+        return validated_response.validator if validated_response else None
+
+    def set(self, key: Hashable, validator: ResponseValidator, value: Any) -> None:
+        self._entries[key] = ValidatedResponse(validator, value)
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
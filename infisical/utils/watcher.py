@@ -0,0 +1,252 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from infisical.logger import logger
+from infisical.models.models import SecretBundle, SecretChanges
+from infisical.utils.snapshot import ScopeKey
+
+SecretChangesCallback = Callable[[SecretChanges], None]
+
+
+def diff_secrets(
+    environment: str,
+    path: str,
+    previous: List[SecretBundle],
+    current: List[SecretBundle],
+) -> SecretChanges:
+    """Return the secrets added, changed and removed from ``previous`` to ``current``.
+
+    Secrets are matched by type and name, the first one winning like the secrets of
+    a path win over the imported ones, and changed when their version or update
+    time differ, so that values decrypted lazily are not decrypted to be compared.
+    """
+
+    def index(
+        secret_bundles: List[SecretBundle],
+    ) -> Dict[Tuple[Optional[str], str], SecretBundle]:
+        indexed: Dict[Tuple[Optional[str], str], SecretBundle] = {}
+
+        for secret_bundle in secret_bundles:
+            indexed.setdefault(
+                (secret_bundle.type, secret_bundle.secret_name), secret_bundle
+            )
+
+        return indexed
+
+    previous_secrets = index(previous)
+    current_secrets = index(current)
+
+    return SecretChanges(
+        environment=environment,
+        path=path,
+        added=[
+            secret_bundle
+            for key, secret_bundle in current_secrets.items()
+            if key not in previous_secrets
+        ],
+        changed=[
+            secret_bundle
+            for key, secret_bundle in current_secrets.items()
+            if key in previous_secrets
+            and (
+                previous_secrets[key].version != secret_bundle.version
+                or previous_secrets[key].updated_at != secret_bundle.updated_at
+            )
+        ],
+        removed=[
+            secret_bundle
+            for key, secret_bundle in previous_secrets.items()
+            if key not in current_secrets
+        ],
+    )
+
+
+class SecretWatch:
+    """A subscription to the changes of the secrets of an environment and path,
+    returned by :meth:`SecretWatcher.watch`.
+    """
+
+    def __init__(
+        self,
+        watcher: "SecretWatcher",
+        scope_key: ScopeKey,
+        callback: SecretChangesCallback,
+        interval: float,
+    ) -> None:
+        self.scope_key = scope_key
+        self.callback = callback
+        self.interval = interval
+        self._watcher = watcher
+
+    @property
+    def active(self) -> bool:
+        return self._watcher.is_watching(self)
+
+    def cancel(self) -> None:
+        """Stop calling the callback, and stop polling once no one watches the scope"""
+        self._watcher.unwatch(self)
+
+
+class _ScopePoller:
+    def __init__(self, scope_key: ScopeKey) -> None:
+        self.scope_key = scope_key
+        self.watches: List[SecretWatch] = []
+        # The secrets of the last successful poll, compared with the next one
+        self.secret_bundles: Optional[List[SecretBundle]] = None
+        self.stopped = threading.Event()
+        # Set when the watches change, to wake the thread up at the new interval
+        self.changed = threading.Event()
+        # Polls of a scope are serialized so that each one is compared with the last
+        self.polling = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def interval(self) -> float:
+        return min(watch.interval for watch in self.watches)
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.changed.set()
+
+
+class SecretWatcher:
+    """Poll the secrets of the environments and paths being watched and call the
+    callbacks of their watches with what changed.
+
+    Each scope is polled by a single daemon thread, at the shortest interval of its
+    watches, however many watch it. The first poll of a scope only records its
+    secrets; the callbacks are called for the changes found by the next ones.
+
+    :param fetch: The function fetching the secrets of a scope
+    """
+
+    def __init__(self, fetch: Callable[[ScopeKey], List[SecretBundle]]) -> None:
+        self.fetch = fetch
+        self._pollers: Dict[ScopeKey, _ScopePoller] = {}
+        self._lock = threading.Lock()
+
+    def watch(
+        self, scope_key: ScopeKey, callback: SecretChangesCallback, interval: float
+    ) -> SecretWatch:
+        """Call ``callback`` with the changes of the secrets of ``scope_key``, polling
+        them at least every ``interval`` seconds
+        """
+        if interval <= 0:
+            raise ValueError("The polling interval must be positive!")
+
+        watch = SecretWatch(self, scope_key, callback, interval)
+
+        with self._lock:
+            poller = self._pollers.get(scope_key)
+
+            if poller is None:
+                poller = self._pollers[scope_key] = _ScopePoller(scope_key)
+
+            poller.watches.append(watch)
+            poller.changed.set()
+
+            if poller.thread is None:
+                poller.thread = threading.Thread(
+                    target=self._run,
+                    args=(poller,),
+                    name="infisical-watcher",
+                    daemon=True,
+                )
+                poller.thread.start()
+
+        return watch
+
+    def unwatch(self, watch: SecretWatch) -> None:
+        with self._lock:
+            poller = self._pollers.get(watch.scope_key)
+
+            if poller is None or watch not in poller.watches:
+                return
+
+            poller.watches.remove(watch)
+
+            if poller.watches:
+                poller.changed.set()
+            else:
+                poller.stop()
+                del self._pollers[watch.scope_key]
+
+    def is_watching(self, watch: SecretWatch) -> bool:
+        poller = self._pollers.get(watch.scope_key)
+
+        return poller is not None and watch in poller.watches
+
+    def poll(self, scope_key: ScopeKey) -> Optional[SecretChanges]:
+        """Poll ``scope_key`` now, calling the callbacks if its secrets changed
+
+        :return: The changes, or ``None`` if the scope is not watched, was never
+            polled before or could not be fetched
+        """
+        poller = self._pollers.get(scope_key)
+
+        return self._poll(poller) if poller is not None else None
+
+    def close(self) -> None:
+        """Cancel every watch and stop the polling threads"""
+        with self._lock:
+            for poller in self._pollers.values():
+                poller.watches.clear()
+                poller.stop()
+
+            self._pollers.clear()
+
+    def _run(self, poller: _ScopePoller) -> None:
+        while not poller.stopped.is_set():
+            self._poll(poller)
+            polled_at = time.monotonic()
+
+            # Sleep until the interval elapsed, starting over when it changes
+            while not poller.stopped.is_set():
+                with self._lock:
+                    poller.changed.clear()
+                    interval = poller.interval if poller.watches else 0
+
+                remaining = polled_at + interval - time.monotonic()
+
+                if remaining <= 0:
+                    break
+
+                poller.changed.wait(remaining)
+
+    def _poll(self, poller: _ScopePoller) -> Optional[SecretChanges]:
+        with poller.polling:
+            return self._poll_serialized(poller)
+
+    def _poll_serialized(self, poller: _ScopePoller) -> Optional[SecretChanges]:
+        try:
+            secret_bundles = self.fetch(poller.scope_key)
+        except Exception as exc:
+            logger.warning(
+                "Failed to poll the secrets of %s: %s", poller.scope_key, exc
+            )
+            return None
+
+        with self._lock:
+            previous_secret_bundles = poller.secret_bundles
+            poller.secret_bundles = secret_bundles
+            watches = list(poller.watches)
+
+        if previous_secret_bundles is None:
+            return None
+
+        environment, path, _ = poller.scope_key
+        changes = diff_secrets(
+            environment, path, previous_secret_bundles, secret_bundles
+        )
+
+        if changes.is_empty:
+            return changes
+
+        for watch in watches:
+            try:
+                watch.callback(changes)
+            except Exception:
+                logger.exception("Secret watch callback of %s failed", poller.scope_key)
+
+        return changes
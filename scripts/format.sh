@@ -1,6 +1,6 @@
 #!/bin/sh -e
 set -x
 
-ruff check infisical tests --fix
-black infisical tests
-isort infisical tests
+ruff check infisical tests testing --fix
+black infisical tests testing
+isort infisical tests testing
@@ -4,6 +4,6 @@ set -e
 set -x
 
 mypy infisical
-ruff check infisical tests
-black infisical tests --check
-isort infisical tests --check-only
+ruff check infisical tests testing
+black infisical tests testing --check
+isort infisical tests testing --check-only
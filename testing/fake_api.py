@@ -0,0 +1,249 @@
+"""An in-memory stand-in for the Infisical API, shared by the tests and the
+benchmarks
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+from base64 import b64encode
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+from Cryptodome.Cipher import AES
+from Cryptodome.Random import get_random_bytes
+
+SITE_URL = "https://infisical.test"
+WORKSPACE_ID = "6437ffd2e7cb0d9b4fa3ff89"
+SERVICE_TOKEN_KEY = "5b3e0a4c1f2d9e8a7b6c5d4e3f2a1b0c"
+WORKSPACE_KEY = "a1b2c3d4e5f60718293a4b5c6d7e8f90"
+SERVICE_TOKEN = (
+    f"st.6438c7d1e7cb0d9b4fa3ff8a.9f8e7d6c5b4a39281706f5e4d3c2b1a0.{SERVICE_TOKEN_KEY}"
+)
+
+
+def encrypt(plaintext: str, key: str) -> Tuple[str, str, str]:
+    iv = get_random_bytes(16)
+    cipher = AES.new(bytes(key, "utf-8"), AES.MODE_GCM, nonce=iv)
+    ciphertext, tag = cipher.encrypt_and_digest(plaintext.encode("utf-8"))
+
+    return (
+        b64encode(ciphertext).decode("utf-8"),
+        b64encode(iv).decode("utf-8"),
+        b64encode(tag).decode("utf-8"),
+    )
+
+
+class FakeInfisicalAPI:
+    """In-memory stand-in for the subset of the Infisical API used by the SDK.
+
+    Secrets are stored encrypted with :data:`WORKSPACE_KEY`, exactly as the real
+    API would return them, so the SDK decryption path is fully exercised.
+    """
+
+    def __init__(self) -> None:
+        self.secrets: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.imports: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        self.calls: List[Tuple[str, str]] = []
+        self.deny_list = False
+        # Environments and paths whose secrets cannot be listed
+        self.denied_scopes: List[Tuple[str, str]] = []
+        self.fail = False
+        self.delay = 0.0
+        # Like Express, tag GET responses and answer 304 when the tag matches
+        self.etags = True
+        self._next_id = 0
+        self._lock = threading.RLock()
+
+    def add_secret(
+        self,
+        name: str,
+        value: str,
+        type: str = "shared",
+        environment: str = "dev",
+        path: str = "/",
+        version: int = 1,
+    ) -> Dict[str, Any]:
+        self.delete_secret(name, type, environment, path)
+        self._next_id += 1
+        key_ciphertext, key_iv, key_tag = encrypt(name, WORKSPACE_KEY)
+        value_ciphertext, value_iv, value_tag = encrypt(value, WORKSPACE_KEY)
+        now = datetime.utcnow().isoformat() + "Z"
+        secret = {
+            "id": f"{self._next_id:024x}",
+            "version": version,
+            "type": type,
+            "secretKeyCiphertext": key_ciphertext,
+            "secretKeyIV": key_iv,
+            "secretKeyTag": key_tag,
+            "secretValueCiphertext": value_ciphertext,
+            "secretValueIV": value_iv,
+            "secretValueTag": value_tag,
+            "createdAt": now,
+            "updatedAt": now,
+            "_name": name,
+        }
+        self.secrets.setdefault((environment, path), []).append(secret)
+        return secret
+
+    def delete_secret(
+        self, name: str, type: str, environment: str, path: str
+    ) -> Optional[Dict[str, Any]]:
+        secrets = self.secrets.get((environment, path), [])
+        for secret in secrets:
+            if secret["_name"] == name and secret["type"] == type:
+                secrets.remove(secret)
+                return secret
+        return None
+
+    def add_import(
+        self, environment: str, path: str, from_environment: str, from_path: str
+    ) -> None:
+        self.imports.setdefault((environment, path), []).append(
+            (from_environment, from_path)
+        )
+
+    def count(self, method: str, path_prefix: str) -> int:
+        return len(
+            [
+                call
+                for call in self.calls
+                if call[0] == method and call[1].startswith(path_prefix)
+            ]
+        )
+
+    def handle(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[int, Dict[str, str], str]:
+        parsed = urlparse(url)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        payload = json.loads(body) if body else {}
+        params = {**query, **payload}
+        self.calls.append((method, parsed.path))
+        time.sleep(self.delay)
+
+        with self._lock:
+            status, response_headers, content = self._handle(
+                method, parsed.path, params
+            )
+
+        if self.etags and method == "GET" and status == 200:
+            etag = 'W/"%s"' % hashlib.sha1(content.encode("utf-8")).hexdigest()
+            response_headers = {**response_headers, "ETag": etag}
+
+            request_headers = {k.lower(): v for k, v in (headers or {}).items()}
+
+            if request_headers.get("if-none-match") == etag:
+                return 304, {"ETag": etag}, ""
+
+        return status, response_headers, content
+
+    def _handle(
+        self, method: str, path: str, params: Dict[str, Any]
+    ) -> Tuple[int, Dict[str, str], str]:
+        if self.fail:
+            return 500, {}, json.dumps({"message": "Internal server error"})
+
+        if path == "/api/v2/service-token":
+            key_ciphertext, key_iv, key_tag = encrypt(WORKSPACE_KEY, SERVICE_TOKEN_KEY)
+            return self._json(
+                {
+                    "id": "6438c7d1e7cb0d9b4fa3ff8a",
+                    "name": "test",
+                    "projectId": WORKSPACE_ID,
+                    "expiresAt": None,
+                    "encryptedKey": key_ciphertext,
+                    "iv": key_iv,
+                    "tag": key_tag,
+                    "createdAt": "2023-04-14T10:00:00.000Z",
+                    "updatedAt": "2023-04-14T10:00:00.000Z",
+                }
+            )
+
+        if path == "/api/v3/secrets" and method == "GET":
+            scope = (params["environment"], params["secretPath"])
+            if self.deny_list or scope in self.denied_scopes:
+                return 403, {}, json.dumps({"message": "Forbidden"})
+            imports = []
+            if params.get("include_imports") == "true":
+                for from_scope in self.imports.get(scope, []):
+                    imports.append(
+                        {
+                            "environment": from_scope[0],
+                            "secretPath": from_scope[1],
+                            "folderId": "root",
+                            "secrets": self._render(self.secrets.get(from_scope, [])),
+                        }
+                    )
+            return self._json(
+                {
+                    "secrets": self._render(self.secrets.get(scope, [])),
+                    "imports": imports,
+                }
+            )
+
+        match = re.fullmatch(r"/api/v3/secrets/(.+)", path)
+        if match:
+            name = unquote(match.group(1))
+            scope = (params["environment"], params["secretPath"])
+            secrets = self.secrets.get(scope, [])
+            if method == "GET":
+                candidates = [s for s in secrets if s["_name"] == name]
+                candidates.sort(key=lambda s: s["type"] != params["type"])
+                if params["type"] == "shared":
+                    candidates = [s for s in candidates if s["type"] == "shared"]
+                if not candidates:
+                    return 404, {}, json.dumps({"message": "Secret not found"})
+                return self._json({"secret": self._render([candidates[0]])[0]})
+            if method == "POST":
+                secret = self.add_secret(
+                    name,
+                    "",
+                    params["type"],
+                    params["environment"],
+                    params["secretPath"],
+                )
+                for field in (
+                    "secretValueCiphertext",
+                    "secretValueIV",
+                    "secretValueTag",
+                ):
+                    secret[field] = params[field]
+                return self._json({"secret": self._render([secret])[0]})
+            if method == "PATCH":
+                for secret in secrets:
+                    if secret["_name"] == name and secret["type"] == params["type"]:
+                        for field in (
+                            "secretValueCiphertext",
+                            "secretValueIV",
+                            "secretValueTag",
+                        ):
+                            secret[field] = params[field]
+                        secret["version"] += 1
+                        return self._json({"secret": self._render([secret])[0]})
+                return 404, {}, json.dumps({"message": "Secret not found"})
+            if method == "DELETE":
+                secret = self.delete_secret(
+                    name, params["type"], params["environment"], params["secretPath"]
+                )
+                if secret is None:
+                    return 404, {}, json.dumps({"message": "Secret not found"})
+                return self._json({"secret": self._render([secret])[0]})
+
+        return 404, {}, json.dumps({"message": "Not found"})
+
+    @staticmethod
+    def _render(secrets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            {key: value for key, value in secret.items() if not key.startswith("_")}
+            for secret in secrets
+        ]
+
+    @staticmethod
+    def _json(payload: Any) -> Tuple[int, Dict[str, str], str]:
+        return 200, {"Content-Type": "application/json"}, json.dumps(payload)
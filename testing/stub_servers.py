@@ -0,0 +1,209 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import h2.connection
+
+# Answers a request from its method, path with query string, body and headers
+Handler = Callable[
+    [str, str, Optional[bytes], Dict[str, str]], Tuple[int, Dict[str, str], str]
+]
+
+
+class HTTP1StubServer:
+    """A threaded HTTP/1.1 server on localhost, with keep-alive connections"""
+
+    def __init__(self, handle: Handler) -> None:
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately: with Nagle's algorithm, the
+            # body would wait for the delayed acknowledgement of the headers
+            disable_nagle_algorithm = True
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                status, headers, payload = handle(
+                    self.command, self.path, body, dict(self.headers.items())
+                )
+                data = payload.encode("utf-8")
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        server = self
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 128
+
+            def process_request(self, request: Any, client_address: Any) -> None:
+                server.connections += 1
+                super().process_request(request, client_address)
+
+        self.connections = 0
+        self._server = Server(("127.0.0.1", 0), RequestHandler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "HTTP1StubServer":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class H2StubServer:
+    """A minimal cleartext HTTP/2 server (with prior knowledge) on localhost.
+
+    Every request is answered by ``handle`` on its own thread, so the streams of a
+    connection are served concurrently like on a real HTTP/2 server.
+    """
+
+    def __init__(self, handle: Handler) -> None:
+        self.handle = handle
+        self.connections = 0
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(128)
+        self.url = f"http://127.0.0.1:{self._server.getsockname()[1]}"
+        self._sockets: List[socket.socket] = []
+
+    def start(self) -> "H2StubServer":
+        threading.Thread(target=self._accept, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.close()
+        for sock in self._sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._server.accept()
+            except OSError:
+                return
+
+            self.connections += 1
+            self._sockets.append(sock)
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock: socket.socket) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        window_updated = threading.Condition()
+        requests: Dict[int, Tuple[Dict[str, str], bytearray]] = {}
+
+        with window_updated:
+            connection.initiate_connection()
+            sock.sendall(connection.data_to_send())
+
+        while True:
+            try:
+                data = sock.recv(65535)
+            except OSError:
+                return
+
+            if not data:
+                return
+
+            with window_updated:
+                events = connection.receive_data(data)
+                sock.sendall(connection.data_to_send())
+
+                for event in events:
+                    if isinstance(event, h2.events.RequestReceived):
+                        headers = {
+                            name.decode(): value.decode()
+                            for name, value in event.headers
+                        }
+                        requests[event.stream_id] = (headers, bytearray())
+                    elif isinstance(event, h2.events.DataReceived):
+                        requests[event.stream_id][1].extend(event.data)
+                        connection.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                        sock.sendall(connection.data_to_send())
+                    elif isinstance(event, h2.events.StreamEnded):
+                        threading.Thread(
+                            target=self._respond,
+                            args=(
+                                sock,
+                                connection,
+                                window_updated,
+                                event.stream_id,
+                                *requests.pop(event.stream_id),
+                            ),
+                            daemon=True,
+                        ).start()
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        window_updated.notify_all()
+
+    def _respond(
+        self,
+        sock: socket.socket,
+        connection: "h2.connection.H2Connection",
+        window_updated: threading.Condition,
+        stream_id: int,
+        headers: Dict[str, str],
+        body: bytearray,
+    ) -> None:
+        status, response_headers, payload = self.handle(
+            headers[":method"],
+            headers[":path"],
+            bytes(body) or None,
+            {name: value for name, value in headers.items() if name[0] != ":"},
+        )
+        data = payload.encode("utf-8")
+
+        with window_updated:
+            connection.send_headers(
+                stream_id,
+                [(":status", str(status))]
+                + [(name.lower(), value) for name, value in response_headers.items()]
+                + [("content-length", str(len(data)))],
+            )
+
+            while data:
+                window = min(
+                    connection.local_flow_control_window(stream_id),
+                    connection.max_outbound_frame_size,
+                )
+
+                if window <= 0:
+                    sock.sendall(connection.data_to_send())
+                    window_updated.wait()
+                    continue
+
+                connection.send_data(stream_id, data[:window])
+                data = data[window:]
+
+            connection.end_stream(stream_id)
+
+            try:
+                sock.sendall(connection.data_to_send())
+            except OSError:
+                pass
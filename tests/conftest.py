@@ -0,0 +1,74 @@
+import re
+
+import pytest
+import responses
+from infisical import InfisicalClient
+
+from testing.fake_api import SERVICE_TOKEN, SITE_URL, FakeInfisicalAPI
+from testing.stub_servers import H2StubServer, HTTP1StubServer
+
+
+@pytest.fixture
+def fake_api():
+    api = FakeInfisicalAPI()
+
+    def callback(request):
+        return api.handle(request.method, request.url, request.body, request.headers)
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        for method in (
+            responses.GET,
+            responses.POST,
+            responses.PATCH,
+            responses.DELETE,
+        ):
+            mock.add_callback(method, re.compile(f"{SITE_URL}/.*"), callback=callback)
+        yield api
+
+
+@pytest.fixture
+def stub_server():
+    """Serve a :class:`FakeInfisicalAPI` over real sockets on localhost"""
+    api = FakeInfisicalAPI()
+    server = HTTP1StubServer(api.handle).start()
+
+    yield api, server.url
+
+    server.stop()
+
+
+@pytest.fixture
+def h2_stub_server():
+    """Serve a :class:`FakeInfisicalAPI` over cleartext HTTP/2 on localhost"""
+    pytest.importorskip("h2")
+    api = FakeInfisicalAPI()
+    server = H2StubServer(api.handle).start()
+
+    yield api, server
+
+    server.stop()
+
+
+@pytest.fixture
+def make_client():
+    """Create clients with the service token, closing them after the test"""
+    clients = []
+
+    def make_client(
+        token: str = SERVICE_TOKEN, site_url: str = SITE_URL, **options
+    ) -> InfisicalClient:
+        client = InfisicalClient(token=token, site_url=site_url, **options)
+        clients.append(client)
+
+        return client
+
+    yield make_client
+
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def client(fake_api: FakeInfisicalAPI, make_client) -> InfisicalClient:
+    """A client of :func:`fake_api`"""
+    return make_client()
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from infisical import AsyncInfisicalClient
+
+from testing.fake_api import SERVICE_TOKEN, SITE_URL, FakeInfisicalAPI
+
+
+@pytest.fixture
+def async_client(fake_api: FakeInfisicalAPI):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+
+    return AsyncInfisicalClient(token=SERVICE_TOKEN, site_url=SITE_URL)
+
+
+def test_get_secret(async_client: AsyncInfisicalClient):
+    async def main():
+        async with async_client:
+            return await async_client.get_secret("KEY_ONE")
+
+    secret = asyncio.run(main())
+    assert secret.secret_name == "KEY_ONE"
+    assert secret.secret_value == "KEY_ONE_VAL"
+    assert secret.type == "shared"
+
+
+def test_get_secrets_concurrently(async_client: AsyncInfisicalClient):
+    async def main():
+        async with async_client:
+            return await asyncio.gather(
+                async_client.get_secret("KEY_ONE"),
+                async_client.get_secret("KEY_TWO"),
+                async_client.get_all_secrets(),
+            )
+
+    key_one, key_two, all_secrets = asyncio.run(main())
+    assert key_one.secret_value == "KEY_ONE_VAL"
+    assert key_two.secret_value == "KEY_TWO_VAL"
+    assert sorted(secret.secret_name for secret in all_secrets) == [
+        "KEY_ONE",
+        "KEY_TWO",
+    ]
+
+
+def test_create_update_delete_secret(async_client: AsyncInfisicalClient):
+    async def main():
+        async with async_client:
+            created = await async_client.create_secret("KEY_THREE", "FOO")
+            updated = await async_client.update_secret("KEY_THREE", "BAR")
+            deleted = await async_client.delete_secret("KEY_THREE")
+            return created, updated, deleted
+
+    created, updated, deleted = asyncio.run(main())
+    assert created.secret_value == "FOO"
+    assert updated.secret_value == "BAR"
+    assert updated.version == 2
+    assert deleted.secret_value == "BAR"
+
+
+def test_closing_closes_the_client(
+    async_client: AsyncInfisicalClient, monkeypatch: pytest.MonkeyPatch
+):
+    closed = []
+    monkeypatch.setattr(async_client.client.watcher, "close", lambda: closed.append(1))
+
+    async def main():
+        async with async_client:
+            await async_client.get_secret("KEY_ONE")
+
+    asyncio.run(main())
+    assert closed == [1]
+    assert async_client.client.decryption_executor is None
+
+
+def test_max_concurrency_sizes_the_thread_pool(fake_api: FakeInfisicalAPI):
+    async def main():
+        async with AsyncInfisicalClient(
+            token=SERVICE_TOKEN, site_url=SITE_URL, pool_maxsize=4
+        ) as default_client, AsyncInfisicalClient(
+            token=SERVICE_TOKEN, site_url=SITE_URL, max_concurrency=32
+        ) as client:
+            return default_client._executor._max_workers, client._executor._max_workers
+
+    assert asyncio.run(main()) == (4, 32)
@@ -0,0 +1,48 @@
+from infisical import InfisicalClient
+from infisical.services.secret_service import SecretService
+from requests import HTTPError
+
+from testing.fake_api import FakeInfisicalAPI
+
+
+def test_create_update_and_delete_secrets(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    secrets = [(f"KEY_{index}", f"VALUE_{index}") for index in range(20)]
+
+    results = client.create_secrets(secrets, max_concurrency=4)
+
+    assert [result.secret_name for result in results] == [name for name, _ in secrets]
+    assert all(result.ok for result in results)
+    assert fake_api.count("POST", "/api/v3/secrets/") == 20
+    assert client.get_secret("KEY_3").secret_value == "VALUE_3"
+    assert {
+        secret.secret_name: secret.secret_value for secret in client.get_all_secrets()
+    } == dict(secrets)
+
+    results = client.update_secrets([("KEY_3", "NEW_VALUE"), ("MISSING", "VALUE")])
+
+    assert results[0].secret_bundle.secret_value == "NEW_VALUE"
+    assert results[0].secret_bundle.version == 2
+    assert not results[1].ok
+    assert isinstance(results[1].error, HTTPError)
+    assert client.get_secret("KEY_3").secret_value == "NEW_VALUE"
+
+    results = client.delete_secrets(["KEY_3", "KEY_4"])
+
+    assert [result.secret_bundle.secret_value for result in results] == [
+        "NEW_VALUE",
+        "VALUE_4",
+    ]
+    assert len(client.get_all_secrets()) == 18
+
+
+def test_failed_bootstrap_fails_every_secret(client: InfisicalClient, monkeypatch):
+    def fail(**kwargs):
+        raise RuntimeError("unreachable")
+
+    monkeypatch.setattr(SecretService, "populate_client_config", fail)
+
+    results = client.create_secrets([("KEY_ONE", "VALUE"), ("KEY_TWO", "VALUE")])
+
+    assert [str(result.error) for result in results] == ["unreachable"] * 2
@@ -0,0 +1,88 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from infisical import InfisicalClient
+
+from testing.fake_api import FakeInfisicalAPI
+
+
+@pytest.fixture
+def client(fake_api: FakeInfisicalAPI, make_client):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL_PERSONAL", type="personal")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+
+    return make_client()
+
+
+def test_get_secret_is_served_from_cache(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    for _ in range(5):
+        assert client.get_secret("KEY_TWO").secret_value == "KEY_TWO_VAL"
+
+    assert fake_api.count("GET", "/api/v3/secrets/") == 1
+    assert client.cache.stats().hits == 4
+
+
+def test_get_all_secrets_fills_cache(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_PROD", environment="prod")
+    client.get_all_secrets(environment="dev")
+    client.get_all_secrets(environment="prod")
+
+    assert client.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL_PERSONAL"
+    assert client.get_secret("KEY_ONE", type="shared").secret_value == "KEY_ONE_VAL"
+    assert client.get_secret("KEY_TWO").secret_value == "KEY_TWO_VAL"
+    assert (
+        client.get_secret("KEY_TWO", environment="prod").secret_value == "KEY_TWO_PROD"
+    )
+    assert fake_api.count("GET", "/api/v3/secrets/") == 0
+
+
+def test_update_secret_refreshes_cache(client: InfisicalClient):
+    assert client.get_secret("KEY_TWO").secret_value == "KEY_TWO_VAL"
+
+    client.update_secret("KEY_TWO", "NEW_VAL")
+
+    assert client.get_secret("KEY_TWO").secret_value == "NEW_VAL"
+
+
+def test_background_refresh_serves_stale_secret(
+    fake_api: FakeInfisicalAPI, make_client
+):
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+    client = make_client(cache_ttl=0, background_refresh=True)
+    assert client.get_secret("KEY_TWO").secret_value == "KEY_TWO_VAL"
+
+    fake_api.add_secret("KEY_TWO", "NEW_VAL")
+    assert client.get_secret("KEY_TWO").secret_value == "KEY_TWO_VAL"
+
+    client.refresher.join()
+    assert client.cache.stats().stale_hits == 1
+    assert fake_api.count("GET", "/api/v3/secrets/") == 2
+    assert client.get_secret("KEY_TWO").secret_value == "NEW_VAL"
+
+
+def test_background_refresh_respects_max_stale(fake_api: FakeInfisicalAPI, make_client):
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+    client = make_client(cache_ttl=0, cache_max_stale=0, background_refresh=True)
+    client.get_secret("KEY_TWO")
+    time.sleep(0.01)
+
+    fake_api.add_secret("KEY_TWO", "NEW_VAL")
+    assert client.get_secret("KEY_TWO").secret_value == "NEW_VAL"
+
+
+def test_concurrent_misses_share_one_request(fake_api: FakeInfisicalAPI, client):
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+    fake_api.delay = 0.05
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        secrets = list(executor.map(lambda _: client.get_secret("KEY_TWO"), range(20)))
+
+    assert {secret.secret_value for secret in secrets} == {"KEY_TWO_VAL"}
+    assert fake_api.count("GET", "/api/v2/service-token") == 1
+    assert fake_api.count("GET", "/api/v3/secrets/") == 1
@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+from infisical import InfisicalClientPool
+from infisical.exceptions import InfisicalTokenError
+
+from testing.fake_api import SERVICE_TOKEN, SITE_URL, FakeInfisicalAPI
+from tests.test_client.test_shared_state import OTHER_SERVICE_TOKEN
+
+
+@pytest.fixture
+def pool():
+    pool = InfisicalClientPool(site_url=SITE_URL, max_cached_secrets=3)
+    yield pool
+    pool.close()
+
+
+def test_clients_are_created_once_per_token_and_share_connections(
+    pool: InfisicalClientPool, fake_api: FakeInfisicalAPI
+):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+
+    first = pool.get_client(token=SERVICE_TOKEN)
+    other = pool.get_client(token=OTHER_SERVICE_TOKEN)
+
+    assert pool.get_client(token=SERVICE_TOKEN) is first
+    assert other is not first
+    assert other.cache is not first.cache
+    assert fake_api.count("GET", "/api/v2/service-token") == 0
+    # Sessions are only created by the first request of their client
+    assert first._api_request is None and other._api_request is None
+    assert first.api_request.get_adapter(SITE_URL) is other.api_request.get_adapter(
+        SITE_URL
+    )
+
+    assert first.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL"
+    assert other.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL"
+    assert len(pool) == 2
+
+    with pytest.raises(InfisicalTokenError):
+        pool.get_client()
+
+
+def test_least_recently_used_tenants_are_evicted_over_the_budget(
+    pool: InfisicalClientPool, fake_api: FakeInfisicalAPI, monkeypatch
+):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+
+    first = pool.get_client(token=SERVICE_TOKEN)
+    first.get_all_secrets()
+    other = pool.get_client(token=OTHER_SERVICE_TOKEN)
+    close = first.close
+    # Closing a client waits for its threads, without blocking the other tenants
+    monkeypatch.setattr(
+        first, "close", lambda: close() if not pool._lock.locked() else None
+    )
+
+    assert pool.stats() == (2, 2, 0)
+
+    # The budget is enforced as soon as a tenant caches more, sparing that tenant
+    other.get_all_secrets()
+
+    assert pool.stats() == (1, 2, 1)
+    assert len(first.cache) == 0
+    assert first.refresher._closed
+    assert pool.get_client(token=OTHER_SERVICE_TOKEN) is other
+
+    # An evicted tenant gets a new client, which still works
+    assert pool.get_client(token=SERVICE_TOKEN) is not first
+    assert first.get_secret("KEY_ONE", type="shared").secret_value == "KEY_ONE_VAL"
+
+
+def test_removed_tenants_keep_the_shared_connections_open(
+    pool: InfisicalClientPool, fake_api: FakeInfisicalAPI
+):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    pool.get_client(token=SERVICE_TOKEN)
+    other = pool.get_client(token=OTHER_SERVICE_TOKEN)
+
+    assert pool.remove(token=SERVICE_TOKEN)
+    assert not pool.remove(token=SERVICE_TOKEN)
+    assert other.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL"
+
+    with pytest.raises(ValueError):
+        InfisicalClientPool(site_url=SITE_URL, share_state=True)
+
+
+def test_evicted_tenants_stop_their_threads(fake_api: FakeInfisicalAPI):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+    pool = InfisicalClientPool(
+        site_url=SITE_URL, max_cached_secrets=2, cache_ttl=0, background_refresh=True
+    )
+    threads = set(threading.enumerate())
+
+    for index in range(5):
+        client = pool.get_client(token=SERVICE_TOKEN.replace("st.6438", f"st.{index}"))
+        client.get_all_secrets()
+        # The expired secret is served and refreshed by a thread of the client
+        client.get_secret("KEY_ONE")
+        client.refresher.join()
+
+    assert pool.stats() == (1, 2, 4)
+
+    pool.close()
+
+    for thread in set(threading.enumerate()) - threads:
+        thread.join(timeout=1)
+
+    assert set(threading.enumerate()) <= threads
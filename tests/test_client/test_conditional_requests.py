@@ -0,0 +1,79 @@
+import pytest
+from infisical import InfisicalClient
+from infisical.services.secret_service import SecretService
+
+from testing.fake_api import FakeInfisicalAPI
+
+
+@pytest.fixture
+def client(fake_api: FakeInfisicalAPI, make_client):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+
+    return make_client(cache_ttl=0, conditional_requests=True)
+
+
+@pytest.fixture
+def decrypted(monkeypatch: pytest.MonkeyPatch):
+    decrypted = []
+    decrypt_raw_secrets = SecretService.decrypt_raw_secrets
+
+    def spy(**kwargs):
+        decrypted.extend(secret.id for secret in kwargs["encrypted_secrets"])
+        return decrypt_raw_secrets(**kwargs)
+
+    monkeypatch.setattr(SecretService, "decrypt_raw_secrets", staticmethod(spy))
+
+    return decrypted
+
+
+@pytest.mark.parametrize("etags", [True, False])
+def test_unchanged_secrets_are_not_parsed_again(
+    client: InfisicalClient,
+    fake_api: FakeInfisicalAPI,
+    decrypted: list,
+    etags: bool,
+):
+    fake_api.etags = etags
+
+    first = client.get_all_secrets()
+    second = client.get_all_secrets()
+
+    assert [secret.secret_value for secret in second] == [
+        secret.secret_value for secret in first
+    ]
+    assert second[0].last_fetched_at > first[0].last_fetched_at
+    assert len(decrypted) == 2
+    assert client.validators.modified == 1
+    assert client.validators.not_modified == 1
+    assert fake_api.count("GET", "/api/v3/secrets") == 2
+
+
+def test_changed_secrets_are_fetched(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    client.get_all_secrets()
+
+    fake_api.add_secret("KEY_ONE", "NEW_VAL", version=2)
+
+    assert {
+        secret.secret_name: secret.secret_value for secret in client.get_all_secrets()
+    } == {"KEY_ONE": "NEW_VAL", "KEY_TWO": "KEY_TWO_VAL"}
+    assert client.validators.modified == 2
+    assert client.validators.not_modified == 0
+
+
+def test_unchanged_secret_is_revalidated(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    first = client.get_secret("KEY_ONE", type="shared")
+    second = client.get_secret("KEY_ONE", type="shared")
+
+    assert second.secret_value == "KEY_ONE_VAL"
+    assert second.last_fetched_at > first.last_fetched_at
+    assert client.validators.not_modified == 1
+
+    fake_api.add_secret("KEY_ONE", "NEW_VAL", version=2)
+
+    assert client.get_secret("KEY_ONE", type="shared").secret_value == "NEW_VAL"
+    assert client.validators.modified == 2
@@ -0,0 +1,66 @@
+import time
+
+import pytest
+from infisical import InfisicalClient
+
+from testing.fake_api import FakeInfisicalAPI
+
+
+@pytest.fixture
+def client(fake_api: FakeInfisicalAPI, make_client):
+    fake_api.add_secret("DB_URL", "dev-db")
+    fake_api.add_secret("API_KEY", "dev-key")
+    fake_api.add_secret("API_KEY", "my-key", type="personal")
+    fake_api.add_secret("DB_URL", "dev-db-override", path="/db")
+    fake_api.add_secret("DB_POOL", "10", path="/db")
+    fake_api.add_secret("QUEUE_URL", "staging-queue", environment="staging")
+    fake_api.add_secret("SHARED", "imported", environment="staging", path="/shared")
+    fake_api.add_import("staging", "/", "staging", "/shared")
+
+    return make_client()
+
+
+def test_secrets_are_merged_by_precedence(client: InfisicalClient):
+    secrets = client.get_all_secrets_many(
+        [("dev", "/"), ("dev", "/db"), ("staging", "/")]
+    )
+
+    assert secrets.ok
+    assert [
+        (secret.secret_name, secret.secret_value) for secret in secrets.secret_bundles
+    ] == [
+        ("DB_URL", "dev-db-override"),
+        ("API_KEY", "my-key"),
+        ("DB_POOL", "10"),
+        ("QUEUE_URL", "staging-queue"),
+        ("SHARED", "imported"),
+    ]
+
+
+def test_scopes_are_fetched_concurrently(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    client.get_secret("DB_URL")
+    fake_api.delay = 0.2
+
+    start = time.monotonic()
+    client.get_all_secrets_many([("dev", "/"), ("dev", "/db"), ("staging", "/")])
+
+    assert time.monotonic() - start < 0.5
+    assert fake_api.count("GET", "/api/v3/secrets") == 4
+
+
+def test_scopes_that_cannot_be_fetched_are_reported(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    fake_api.denied_scopes.append(("dev", "/db"))
+
+    secrets = client.get_all_secrets_many([("dev", "/"), ("dev", "/db")])
+
+    assert not secrets.ok
+    assert [scope.ok for scope in secrets.scopes] == [True, False]
+    assert secrets.scopes[1].secret_bundles == []
+    assert [secret.secret_value for secret in secrets.secret_bundles] == [
+        "dev-db",
+        "my-key",
+    ]
@@ -0,0 +1,78 @@
+import pytest
+from infisical import InfisicalClient
+
+from testing.fake_api import FakeInfisicalAPI
+
+
+@pytest.fixture
+def client(fake_api: FakeInfisicalAPI, make_client):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL_PERSONAL", type="personal")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+    fake_api.add_secret("KEY_THREE", "KEY_THREE_VAL")
+
+    return make_client()
+
+
+def test_get_secrets_in_one_request(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    secrets = client.get_secrets(["KEY_TWO", "KEY_ONE"])
+
+    assert [secret.secret_name for secret in secrets] == ["KEY_TWO", "KEY_ONE"]
+    assert [secret.secret_value for secret in secrets] == [
+        "KEY_TWO_VAL",
+        "KEY_ONE_VAL_PERSONAL",
+    ]
+    assert fake_api.count("GET", "/api/v3/secrets") == 1
+
+
+def test_get_shared_secrets(client: InfisicalClient):
+    secrets = client.get_secrets(["KEY_ONE", "KEY_TWO"], type="shared")
+
+    assert [secret.secret_value for secret in secrets] == ["KEY_ONE_VAL", "KEY_TWO_VAL"]
+    assert {secret.type for secret in secrets} == {"shared"}
+
+
+def test_get_secrets_falls_back_to_single_requests(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    fake_api.deny_list = True
+
+    secrets = client.get_secrets(["KEY_ONE", "KEY_THREE"])
+
+    assert [secret.secret_value for secret in secrets] == [
+        "KEY_ONE_VAL_PERSONAL",
+        "KEY_THREE_VAL",
+    ]
+    assert fake_api.count("GET", "/api/v3/secrets/") == 2
+
+
+def test_get_secrets_missing_secret_uses_environment(
+    client: InfisicalClient,
+    fake_api: FakeInfisicalAPI,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("KEY_FROM_ENV", "ENV_VAL")
+
+    key_two, key_from_env = client.get_secrets(["KEY_TWO", "KEY_FROM_ENV"])
+
+    assert key_two.secret_value == "KEY_TWO_VAL"
+    assert key_from_env.secret_value == "ENV_VAL"
+    assert key_from_env.is_fallback
+    assert fake_api.count("GET", "/api/v3/secrets") == 1
+
+
+def test_get_secrets_includes_imported_secrets(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_PROD", environment="prod")
+    fake_api.add_secret("KEY_IMPORTED", "KEY_IMPORTED_VAL", environment="prod")
+    fake_api.add_import("dev", "/", "prod", "/")
+
+    key_two, key_imported = client.get_secrets(["KEY_TWO", "KEY_IMPORTED"])
+
+    assert key_two.secret_value == "KEY_TWO_VAL"
+    assert key_imported.secret_value == "KEY_IMPORTED_VAL"
+    assert not key_imported.is_fallback
+    assert fake_api.count("GET", "/api/v3/secrets") == 1
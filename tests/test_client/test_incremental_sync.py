@@ -0,0 +1,51 @@
+import pytest
+from infisical import InfisicalClient
+
+from testing.fake_api import FakeInfisicalAPI
+
+
+@pytest.fixture
+def client(fake_api: FakeInfisicalAPI, make_client):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+    fake_api.add_secret("KEY_THREE", "KEY_THREE_VAL", environment="prod")
+    fake_api.add_import("dev", "/", "prod", "/")
+
+    return make_client(cache_ttl=0, incremental_sync=True)
+
+
+def get_values(client: InfisicalClient):
+    return {
+        secret.secret_name: secret.secret_value for secret in client.get_all_secrets()
+    }
+
+
+def test_unchanged_secrets_are_not_decrypted_again(client: InfisicalClient):
+    first = client.get_all_secrets()
+    second = client.get_all_secrets()
+
+    assert [secret.secret_value for secret in second] == [
+        secret.secret_value for secret in first
+    ]
+    assert second[0].last_fetched_at >= first[0].last_fetched_at
+    assert client.sync_state.decrypted == 3
+    assert client.sync_state.reused == 3
+
+
+def test_changed_secrets_are_synced(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    get_values(client)
+
+    fake_api.add_secret("KEY_ONE", "NEW_VAL", version=2)
+    fake_api.delete_secret("KEY_TWO", "shared", "dev", "/")
+    fake_api.add_secret("KEY_FOUR", "KEY_FOUR_VAL")
+
+    assert get_values(client) == {
+        "KEY_ONE": "NEW_VAL",
+        "KEY_FOUR": "KEY_FOUR_VAL",
+        "KEY_THREE": "KEY_THREE_VAL",
+    }
+    assert client.sync_state.decrypted == 5
+    assert client.sync_state.reused == 1
+    assert client.get_secret("KEY_ONE").secret_value == "NEW_VAL"
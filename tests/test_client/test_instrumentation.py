@@ -0,0 +1,129 @@
+from typing import List, Tuple
+
+import pytest
+from infisical.utils.instrumentation import (
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    RequestEvent,
+)
+
+from testing.fake_api import FakeInfisicalAPI
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self) -> None:
+        self.requests: List[RequestEvent] = []
+        self.decrypts: List[Tuple[int, float]] = []
+        self.cache_lookups: List[str] = []
+        self.bootstraps: List[float] = []
+
+    def on_request(self, event: RequestEvent) -> None:
+        self.requests.append(event)
+
+    def on_decrypt(self, count: int, duration: float) -> None:
+        self.decrypts.append((count, duration))
+
+    def on_cache_lookup(self, result: str) -> None:
+        self.cache_lookups.append(result)
+
+    def on_bootstrap(self, duration: float) -> None:
+        self.bootstraps.append(duration)
+
+
+@pytest.fixture
+def instrumentation(fake_api: FakeInfisicalAPI):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+
+    return RecordingInstrumentation()
+
+
+def test_requests_decryption_cache_and_bootstrap_are_measured(
+    instrumentation: RecordingInstrumentation, make_client
+):
+    client = make_client(instrumentation=instrumentation)
+
+    client.get_secret("KEY_ONE")
+    client.get_secret("KEY_ONE")
+    client.get_all_secrets()
+
+    assert [(event.method, event.endpoint) for event in instrumentation.requests] == [
+        ("GET", "/api/v2/service-token"),
+        ("GET", "/api/v3/secrets/{secret_name}"),
+        ("GET", "/api/v3/secrets"),
+    ]
+    assert all(event.status_code == 200 for event in instrumentation.requests)
+    assert all(event.bytes_received > 0 for event in instrumentation.requests)
+    assert [count for count, _ in instrumentation.decrypts] == [1, 4]
+    assert instrumentation.cache_lookups == ["miss", "hit"]
+    assert len(instrumentation.bootstraps) == 1
+
+
+def test_failed_requests_are_measured(
+    instrumentation: RecordingInstrumentation,
+    monkeypatch: pytest.MonkeyPatch,
+    make_client,
+):
+    monkeypatch.setenv("KEY_ONE", "KEY_ONE_ENV_VAL")
+    client = make_client(
+        site_url="https://unreachable.test", instrumentation=instrumentation
+    )
+
+    assert client.get_secret("KEY_ONE").secret_value == "KEY_ONE_ENV_VAL"
+    assert instrumentation.requests == [
+        RequestEvent(
+            method="GET",
+            endpoint="/api/v2/service-token",
+            status_code=None,
+            duration=instrumentation.requests[0].duration,
+            retries=0,
+            bytes_sent=0,
+            bytes_received=0,
+        )
+    ]
+    assert instrumentation.bootstraps == []
+
+
+def test_opentelemetry_instrumentation_records_metrics_and_spans(
+    instrumentation: RecordingInstrumentation, make_client
+):
+    metrics = pytest.importorskip("opentelemetry.sdk.metrics")
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    reader = InMemoryMetricReader()
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    client = make_client(
+        instrumentation=OpenTelemetryInstrumentation(
+            meter=metrics.MeterProvider(metric_readers=[reader]).get_meter("test"),
+            tracer=tracer_provider.get_tracer("test"),
+        ),
+    )
+
+    client.get_secret("KEY_ONE")
+    client.get_secret("KEY_ONE")
+
+    points = {
+        metric.name: metric.data.data_points
+        for resource_metrics in reader.get_metrics_data().resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+    assert (
+        sum(point.count for point in points["infisical.client.request.duration"]) == 2
+    )
+    assert {
+        point.attributes["infisical.cache.result"]: point.value
+        for point in points["infisical.client.cache.lookups"]
+    } == {"miss": 1, "hit": 1}
+    assert [span.name for span in exporter.get_finished_spans()] == [
+        "GET /api/v2/service-token",
+        "GET /api/v3/secrets/{secret_name}",
+    ]
@@ -0,0 +1,40 @@
+import pytest
+from infisical import InfisicalClient
+
+from testing.fake_api import FakeInfisicalAPI
+
+
+@pytest.fixture
+def client(fake_api: FakeInfisicalAPI, make_client):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+    fake_api.add_secret("KEY_THREE", "KEY_THREE_VAL", environment="prod")
+    fake_api.add_import("dev", "/", "prod", "/")
+
+    return make_client()
+
+
+def test_iter_secrets_matches_get_all_secrets(client: InfisicalClient):
+    secrets = client.iter_secrets()
+
+    assert next(secrets).secret_value == "KEY_ONE_VAL"
+    assert [secret.secret_name for secret in secrets] == ["KEY_TWO", "KEY_THREE"]
+    assert [
+        (secret.secret_name, secret.secret_value, secret.version)
+        for secret in client.iter_secrets()
+    ] == [
+        (secret.secret_name, secret.secret_value, secret.version)
+        for secret in client.get_all_secrets()
+    ]
+
+
+def test_iter_secrets_over_http(stub_server, make_client):
+    api, url = stub_server
+    for index in range(50):
+        api.add_secret(f"KEY_{index}", "x" * 1000)
+
+    client = make_client(site_url=url)
+
+    assert [secret.secret_name for secret in client.iter_secrets()] == [
+        f"KEY_{index}" for index in range(50)
+    ]
@@ -0,0 +1,70 @@
+import os
+
+import pytest
+from infisical import InfisicalClient
+from infisical.models.lazy import LazySecretBundle
+from infisical.models.models import SecretBundle
+
+from testing.fake_api import FakeInfisicalAPI
+
+
+@pytest.fixture
+def client(fake_api: FakeInfisicalAPI, make_client):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+
+    return make_client(lazy_decrypt=True)
+
+
+def test_values_are_decrypted_on_access(client: InfisicalClient):
+    secret_one, secret_two = client.get_all_secrets()
+
+    assert isinstance(secret_one, LazySecretBundle)
+    assert [secret_one.secret_name, secret_two.secret_name] == ["KEY_ONE", "KEY_TWO"]
+    assert not secret_one.is_decrypted
+    assert secret_one.secret_value == "KEY_ONE_VAL"
+    assert secret_one.is_decrypted
+    assert not secret_two.is_decrypted
+    assert secret_two.dict()["secret_value"] == "KEY_TWO_VAL"
+    assert type(secret_two.to_secret_bundle()) is SecretBundle
+
+
+def test_lazy_bundles_are_cached_and_copied_lazily(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    client.get_all_secrets()
+
+    secret = client.get_secret("KEY_TWO")
+    copy = secret.copy()
+
+    assert fake_api.count("GET", "/api/v3/secrets/") == 0
+    assert not copy.is_decrypted
+    assert copy.secret_value == "KEY_TWO_VAL"
+
+
+def test_attach_to_os_environ_decrypts(client: InfisicalClient, monkeypatch):
+    monkeypatch.setenv("KEY_ONE", "")
+    monkeypatch.setenv("KEY_TWO", "")
+    client.get_all_secrets(attach_to_os_environ=True)
+
+    assert os.environ["KEY_ONE"] == "KEY_ONE_VAL"
+
+
+def test_snapshot_keeps_lazy_bundles_encrypted(
+    fake_api: FakeInfisicalAPI, make_client, tmp_path
+):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    snapshot_path = str(tmp_path / "snapshot.json")
+    client = make_client(lazy_decrypt=True, snapshot_path=snapshot_path)
+
+    (secret,) = client.get_all_secrets()
+
+    assert not secret.is_decrypted
+
+    fake_api.fail = True
+    restored_client = make_client(lazy_decrypt=True, snapshot_path=snapshot_path)
+    restored_secret = restored_client.get_secret("KEY_ONE")
+
+    assert isinstance(restored_secret, LazySecretBundle)
+    assert not restored_secret.is_decrypted
+    assert restored_secret.secret_value == "KEY_ONE_VAL"
@@ -0,0 +1,82 @@
+import gc
+
+from infisical import InfisicalClient
+from infisical.utils.registry import client_state_registry
+
+from testing.fake_api import SERVICE_TOKEN, SITE_URL, FakeInfisicalAPI
+
+OTHER_SERVICE_TOKEN = SERVICE_TOKEN.replace("st.6438", "st.7438")
+
+
+def test_clients_with_the_same_token_share_state(fake_api: FakeInfisicalAPI):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+
+    first = InfisicalClient(token=SERVICE_TOKEN, site_url=SITE_URL, share_state=True)
+    second = InfisicalClient(
+        token=SERVICE_TOKEN, site_url=SITE_URL + "/", share_state=True
+    )
+
+    assert first.api_request is second.api_request
+    assert first.cache is second.cache
+
+    assert first.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL"
+    assert second.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL"
+
+    assert fake_api.count("GET", "/api/v2/service-token") == 1
+    assert fake_api.count("GET", "/api/v3/secrets/KEY_ONE") == 1
+    assert second.cache.stats().hits == 1
+
+
+def test_clients_are_not_shared_by_default_nor_across_tokens(
+    fake_api: FakeInfisicalAPI,
+):
+    shared = InfisicalClient(token=SERVICE_TOKEN, site_url=SITE_URL, share_state=True)
+    private = InfisicalClient(token=SERVICE_TOKEN, site_url=SITE_URL)
+    other = InfisicalClient(
+        token=OTHER_SERVICE_TOKEN, site_url=SITE_URL, share_state=True
+    )
+
+    assert private.cache is not shared.cache
+    assert other.cache is not shared.cache
+    assert other.client_config is not shared.client_config
+
+
+def test_clients_with_other_options_do_not_share_state():
+    first = InfisicalClient(token=SERVICE_TOKEN, site_url=SITE_URL, share_state=True)
+    shorter_ttl = InfisicalClient(
+        token=SERVICE_TOKEN, site_url=SITE_URL, cache_ttl=60, share_state=True
+    )
+    http2 = InfisicalClient(
+        token=SERVICE_TOKEN, site_url=SITE_URL, http2=True, share_state=True
+    )
+
+    lazy = InfisicalClient(
+        token=SERVICE_TOKEN, site_url=SITE_URL, lazy_decrypt=True, share_state=True
+    )
+    conditional = InfisicalClient(
+        token=SERVICE_TOKEN,
+        site_url=SITE_URL,
+        conditional_requests=True,
+        share_state=True,
+    )
+
+    assert shorter_ttl.cache is not first.cache
+    assert shorter_ttl.cache.ttl == 60
+    assert http2.cache is not first.cache
+    assert lazy.cache is not first.cache
+    assert conditional.cache is not first.cache
+
+
+def test_shared_state_is_released_with_the_last_client():
+    client_state_registry.clear()
+    clients = [
+        InfisicalClient(token=SERVICE_TOKEN, site_url=SITE_URL, share_state=True)
+        for _ in range(2)
+    ]
+
+    assert len(client_state_registry) == 1
+
+    del clients
+    gc.collect()
+
+    assert len(client_state_registry) == 0
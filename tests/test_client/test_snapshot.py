@@ -0,0 +1,120 @@
+import json
+
+import pytest
+
+from testing.fake_api import SERVICE_TOKEN, FakeInfisicalAPI
+
+
+@pytest.fixture
+def snapshot_path(fake_api: FakeInfisicalAPI, make_client, tmp_path):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_PROD", environment="prod")
+
+    path = str(tmp_path / "snapshot.json")
+    client = make_client(snapshot_path=path)
+    client.get_all_secrets(environment="dev")
+    client.get_all_secrets(environment="prod")
+
+    return path
+
+
+def test_snapshot_is_encrypted(snapshot_path: str):
+    with open(snapshot_path) as file:
+        content = file.read()
+
+    assert "KEY_ONE" not in content
+    assert "KEY_TWO_VAL" not in content
+    assert len(json.loads(content)["scopes"]) == 2
+
+
+def test_boot_from_snapshot_without_api(
+    snapshot_path: str, fake_api: FakeInfisicalAPI, make_client
+):
+    fake_api.fail = True
+    fake_api.calls.clear()
+
+    client = make_client(snapshot_path=snapshot_path)
+
+    assert client.client_config.workspace_config is not None
+    assert client.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL"
+    assert (
+        client.get_secret("KEY_TWO", environment="prod").secret_value == "KEY_TWO_PROD"
+    )
+    assert [secret.secret_name for secret in client.get_all_secrets()] == [
+        "KEY_ONE",
+        "KEY_TWO",
+    ]
+    assert fake_api.count("GET", "/api/v2/service-token") == 0
+
+
+def test_snapshot_is_revalidated_in_background(
+    snapshot_path: str, fake_api: FakeInfisicalAPI, make_client
+):
+    fake_api.add_secret("KEY_ONE", "NEW_VAL")
+
+    client = make_client(snapshot_path=snapshot_path)
+    client.refresher.join()
+
+    assert client.get_secret("KEY_ONE").secret_value == "NEW_VAL"
+
+
+def test_snapshot_of_another_token_is_ignored(
+    snapshot_path: str, fake_api: FakeInfisicalAPI, make_client
+):
+    other_token = SERVICE_TOKEN[: -len("0123456789abcdef0123456789abcdef")] + "0" * 32
+    client = make_client(token=other_token, snapshot_path=snapshot_path)
+
+    assert client.client_config.workspace_config is None
+    assert len(client.cache) == 0
+
+
+def test_shared_snapshot_serves_other_processes(
+    snapshot_path: str, fake_api: FakeInfisicalAPI, make_client
+):
+    client = make_client(snapshot_path=snapshot_path, share_snapshot=True)
+    fake_api.calls.clear()
+
+    assert client.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL"
+    assert [secret.secret_name for secret in client.get_all_secrets()] == [
+        "KEY_ONE",
+        "KEY_TWO",
+    ]
+    client.refresher.join()
+    assert fake_api.calls == []
+
+
+def test_shared_snapshot_is_filled_once(
+    fake_api: FakeInfisicalAPI, make_client, tmp_path
+):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    path = str(tmp_path / "snapshot.json")
+    clients = [make_client(snapshot_path=path, share_snapshot=True) for _ in range(3)]
+
+    for client in clients:
+        assert [secret.secret_name for secret in client.get_all_secrets()] == [
+            "KEY_ONE"
+        ]
+        assert client.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL"
+
+    assert fake_api.count("GET", "/api/v2/service-token") == 1
+    assert fake_api.count("GET", "/api/v3/secrets") == 1
+
+
+def test_shared_snapshot_fetches_secret_of_untracked_scope(
+    fake_api: FakeInfisicalAPI, make_client, tmp_path
+):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+    client = make_client(
+        snapshot_path=str(tmp_path / "snapshot.json"), share_snapshot=True
+    )
+
+    assert client.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL"
+    assert fake_api.count("GET", "/api/v3/secrets/KEY_ONE") == 1
+    assert fake_api.count("GET", "/api/v3/secrets") == 1
+
+
+def test_share_snapshot_requires_path(make_client):
+    with pytest.raises(ValueError):
+        make_client(share_snapshot=True)
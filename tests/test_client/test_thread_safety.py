@@ -0,0 +1,61 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+SECRET_NAMES = [f"KEY_{index}" for index in range(10)]
+
+
+def test_concurrent_access(stub_server, make_client):
+    fake_api, site_url = stub_server
+    for secret_name in SECRET_NAMES:
+        fake_api.add_secret(secret_name, f"{secret_name}_VAL")
+
+    # A tiny cache forces concurrent refreshes and evictions
+    client = make_client(site_url=site_url, cache_ttl=0, cache_max_entries=4)
+
+    def worker(seed: int):
+        picker = random.Random(seed)
+        results = []
+        for _ in range(20):
+            if picker.random() < 0.1:
+                results.extend(client.get_all_secrets())
+            else:
+                results.append(client.get_secret(picker.choice(SECRET_NAMES)))
+        return results
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = [
+            secret for secrets in executor.map(worker, range(32)) for secret in secrets
+        ]
+
+    assert fake_api.count("GET", "/api/v2/service-token") == 1
+    assert len(results) >= 32 * 20
+    for secret in results:
+        assert not secret.is_fallback
+        assert secret.secret_value == f"{secret.secret_name}_VAL"
+    assert len(client.cache) <= 4
+
+
+def test_blocking_pool_reuses_connections(stub_server, make_client):
+    fake_api, site_url = stub_server
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.delay = 0.01
+
+    client = make_client(
+        site_url=site_url,
+        cache_ttl=0,
+        pool_maxsize=4,
+        pool_block=True,
+        connect_timeout=1,
+        read_timeout=5,
+    )
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda _: client.get_all_secrets(), range(64)))
+        list(executor.map(lambda _: client.get_secret("KEY_ONE"), range(64)))
+
+    (pool_stats,) = client.get_pool_stats()
+
+    assert pool_stats.host == "127.0.0.1"
+    assert pool_stats.maxsize == 4
+    assert pool_stats.num_connections <= 4
+    assert pool_stats.num_requests == fake_api.count("GET", "/")
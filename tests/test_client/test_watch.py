@@ -0,0 +1,102 @@
+import queue
+import threading
+import time
+
+import pytest
+from infisical import InfisicalClient
+from infisical.models.models import SecretChanges
+
+from testing.fake_api import FakeInfisicalAPI
+
+SCOPE_KEY = ("dev", "/", True)
+
+
+@pytest.fixture
+def client(fake_api: FakeInfisicalAPI, make_client):
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.add_secret("KEY_TWO", "KEY_TWO_VAL")
+
+    return make_client()
+
+
+def watch(client: InfisicalClient) -> "queue.Queue[SecretChanges]":
+    changes: "queue.Queue[SecretChanges]" = queue.Queue()
+    client.watch("dev", "/", changes.put, interval=60)
+
+    return changes
+
+
+def wait_for_first_poll(fake_api: FakeInfisicalAPI) -> None:
+    for _ in range(100):
+        if fake_api.count("GET", "/api/v3/secrets"):
+            return
+        time.sleep(0.01)
+
+
+def test_watchers_of_a_scope_share_a_poller(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    first_changes = watch(client)
+    second_changes = watch(client)
+    wait_for_first_poll(fake_api)
+
+    assert client.watcher.poll(SCOPE_KEY).is_empty
+    assert first_changes.empty()
+
+    fake_api.add_secret("KEY_ONE", "NEW_VAL", version=2)
+    fake_api.delete_secret("KEY_TWO", "shared", "dev", "/")
+    fake_api.add_secret("KEY_THREE", "KEY_THREE_VAL")
+    client.watcher.poll(SCOPE_KEY)
+
+    for changes in (first_changes.get(timeout=1), second_changes.get(timeout=1)):
+        assert changes.environment == "dev"
+        assert [secret.secret_name for secret in changes.added] == ["KEY_THREE"]
+        assert [secret.secret_value for secret in changes.changed] == ["NEW_VAL"]
+        assert [secret.secret_name for secret in changes.removed] == ["KEY_TWO"]
+
+    assert fake_api.count("GET", "/api/v3/secrets") == 3
+    assert client.get_secret("KEY_ONE", type="shared").secret_value == "NEW_VAL"
+    assert len([t for t in threading.enumerate() if t.name == "infisical-watcher"]) == 1
+
+
+def test_failed_polls_are_not_changes(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    changes = watch(client)
+    wait_for_first_poll(fake_api)
+    client.watcher.poll(SCOPE_KEY)
+
+    fake_api.fail = True
+
+    assert client.watcher.poll(SCOPE_KEY) is None
+    assert changes.empty()
+
+
+def test_cancel_stops_polling(client: InfisicalClient):
+    secret_watch = client.watch("dev", "/", lambda changes: None, interval=0.01)
+
+    assert secret_watch.active
+
+    secret_watch.cancel()
+
+    assert not secret_watch.active
+    assert client.watcher.poll(SCOPE_KEY) is None
+
+    with pytest.raises(ValueError):
+        client.watch("dev", "/", lambda changes: None, interval=0)
+
+
+def test_shorter_interval_wakes_the_poller_up(
+    client: InfisicalClient, fake_api: FakeInfisicalAPI
+):
+    watch(client)
+    wait_for_first_poll(fake_api)
+
+    client.watch("dev", "/", lambda changes: None, interval=0.01)
+
+    for _ in range(100):
+        if fake_api.count("GET", "/api/v3/secrets") > 1:
+            break
+        time.sleep(0.01)
+
+    assert fake_api.count("GET", "/api/v3/secrets") > 1
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+from testing.fake_api import SERVICE_TOKEN, SITE_URL
+
+HEAVY_MODULES = ("Cryptodome", "asyncio", "cryptography", "nacl", "requests", "urllib3")
+
+
+def get_loaded_heavy_modules(code: str) -> str:
+    """Run ``code`` in a new interpreter and return the heavy modules it loaded"""
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{code}\n"
+            "import sys\n"
+            "loaded = {module.split('.')[0] for module in sys.modules}\n"
+            f"print(sorted(loaded.intersection({HEAVY_MODULES})))",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+
+    return process.stdout.splitlines()[-1]
+
+
+def test_creating_a_client_does_not_load_the_crypto_nor_http_stacks():
+    code = (
+        "from infisical import InfisicalClient\n"
+        f"InfisicalClient(token={SERVICE_TOKEN!r}, site_url={SITE_URL!r})"
+    )
+
+    assert get_loaded_heavy_modules(code) == "[]"
+
+
+def test_sharing_state_does_not_load_the_http_stack():
+    code = (
+        "from infisical import InfisicalClient\n"
+        f"clients = [InfisicalClient(token={SERVICE_TOKEN!r}, site_url={SITE_URL!r}, "
+        "share_state=True) for _ in range(2)]"
+    )
+
+    assert get_loaded_heavy_modules(code) == "[]"
+
+
+def test_the_async_client_loads_asyncio():
+    code = "from infisical import AsyncInfisicalClient"
+
+    assert get_loaded_heavy_modules(code) == "['asyncio']"
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from infisical.models.models import Secret
+from infisical.models.raw import RawSecret
+
+from testing.fake_api import WORKSPACE_ID, FakeInfisicalAPI
+
+
+def test_raw_secret_matches_model():
+    api = FakeInfisicalAPI()
+    json_object = api._render([api.add_secret("KEY_ONE", "KEY_ONE_VAL")])[0]
+
+    raw_secret = RawSecret(json_object, WORKSPACE_ID, "dev")
+
+    assert raw_secret._updated_at is None
+    assert isinstance(raw_secret.updated_at, datetime)
+    assert raw_secret.to_model() == Secret.parse_obj(
+        {**json_object, "workspace": WORKSPACE_ID, "environment": "dev"}
+    )
+    assert "workspace" not in json_object
@@ -0,0 +1,106 @@
+import time
+from datetime import datetime
+
+from infisical.models.models import SecretBundle
+from infisical.utils.cache import CacheKey, SecretCache
+
+
+def make_bundle(secret_name: str, secret_value: str = "VALUE") -> SecretBundle:
+    return SecretBundle(
+        secret_name=secret_name,
+        secret_value=secret_value,
+        type="shared",
+        is_fallback=False,
+        last_fetched_at=datetime.now(),
+    )
+
+
+def make_key(secret_name: str, environment: str = "dev") -> CacheKey:
+    return CacheKey("workspace", environment, "/", "shared", secret_name)
+
+
+def test_key_includes_environment():
+    cache = SecretCache(ttl=60)
+    cache.set(make_key("KEY", "dev"), make_bundle("KEY", "DEV"))
+    cache.set(make_key("KEY", "prod"), make_bundle("KEY", "PROD"))
+
+    assert cache.get(make_key("KEY", "dev")).secret_value == "DEV"
+    assert cache.get(make_key("KEY", "prod")).secret_value == "PROD"
+
+
+def test_expired_entry_is_only_returned_stale():
+    cache = SecretCache(ttl=0.01)
+    cache.set(make_key("KEY"), make_bundle("KEY"))
+    time.sleep(0.02)
+
+    assert cache.get(make_key("KEY")) is None
+    assert cache.get_stale(make_key("KEY")).secret_name == "KEY"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SecretCache(ttl=60, max_entries=2)
+    cache.set(make_key("ONE"), make_bundle("ONE"))
+    cache.set(make_key("TWO"), make_bundle("TWO"))
+    cache.get(make_key("ONE"))
+    cache.set(make_key("THREE"), make_bundle("THREE"))
+
+    assert make_key("ONE") in cache
+    assert make_key("TWO") not in cache
+    assert make_key("THREE") in cache
+    assert cache.stats().evictions == 1
+
+
+def test_shared_secret_serves_personal_lookups_as_a_single_entry():
+    cache = SecretCache(ttl=60, max_entries=2)
+    personal_key = make_key("KEY")._replace(type="personal")
+    cache.set(make_key("KEY"), make_bundle("KEY"), serves_personal=True)
+    cache.set(make_key("OTHER"), make_bundle("OTHER"))
+
+    assert cache.get(personal_key).secret_name == "KEY"
+    assert cache.stats().size == 2
+
+    # A refetch of the shared secret keeps serving personal lookups
+    cache.set(make_key("KEY"), make_bundle("KEY", "NEW"))
+    assert cache.get(personal_key).secret_value == "NEW"
+
+    # Until a personal override is written or deleted
+    cache.delete(personal_key)
+    assert cache.get(personal_key) is None
+    assert cache.get(make_key("KEY")).secret_value == "NEW"
+
+
+def test_stats_count_hits_and_misses():
+    cache = SecretCache(ttl=60)
+    cache.set(make_key("KEY"), make_bundle("KEY"))
+    cache.get(make_key("KEY"))
+    cache.get(make_key("KEY"))
+    cache.get(make_key("OTHER"))
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+
+
+def test_expired_entry_is_served_stale_until_max_stale():
+    cache = SecretCache(ttl=0, max_stale=60)
+    cache.set(make_key("KEY"), make_bundle("KEY"))
+
+    bundle, is_stale = cache.get_or_stale(make_key("KEY"))
+    assert bundle.secret_name == "KEY"
+    assert is_stale
+
+    cache = SecretCache(ttl=0, max_stale=0)
+    cache.set(make_key("KEY"), make_bundle("KEY"))
+
+    assert cache.get_or_stale(make_key("KEY")) == (None, False)
+
+
+def test_jitter_shortens_ttl():
+    cache = SecretCache(ttl=100, jitter=0.5)
+    for index in range(20):
+        cache.set(make_key(str(index)), make_bundle(str(index)))
+
+    expiries = {
+        entry.expires_at - time.monotonic() for entry in cache._entries.values()
+    }
+    assert all(40 < expiry <= 100 for expiry in expiries)
+    assert len(expiries) > 1
@@ -0,0 +1,132 @@
+import json
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from infisical.models.secret_service import ClientConfig, WorkspaceKeyEnvelope
+from infisical.services.secret_service import SecretService
+from infisical.utils import crypto
+from infisical.utils.crypto import (
+    DECRYPT_BATCH_SIZE,
+    AsymmetricKeyPair,
+    decrypt_asymmetric,
+    decrypt_symmetric_128_bit_hex_key_utf8_batch,
+    encrypt_asymmetric,
+    encrypt_symmetric_128_bit_hex_key_utf8,
+)
+from nacl import public
+
+from testing.fake_api import WORKSPACE_KEY
+
+
+@pytest.fixture(autouse=True, params=["cryptography", "pycryptodome"])
+def backend(request, monkeypatch):
+    if request.param == "pycryptodome":
+        monkeypatch.setattr(crypto, "get_aes_gcm", lambda: (None, ValueError))
+
+
+def test_batch_decryption_keeps_order():
+    plaintexts = [f"VALUE_{index}" for index in range(DECRYPT_BATCH_SIZE * 3 + 1)]
+    ciphertexts = [
+        encrypt_symmetric_128_bit_hex_key_utf8(plaintext, WORKSPACE_KEY)
+        for plaintext in plaintexts
+    ]
+
+    assert (
+        decrypt_symmetric_128_bit_hex_key_utf8_batch(WORKSPACE_KEY, ciphertexts)
+        == plaintexts
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert (
+            decrypt_symmetric_128_bit_hex_key_utf8_batch(
+                WORKSPACE_KEY, ciphertexts, executor=executor
+            )
+            == plaintexts
+        )
+
+
+def test_batch_decryption_verifies_tags():
+    ciphertext, iv, _ = encrypt_symmetric_128_bit_hex_key_utf8("VALUE", WORKSPACE_KEY)
+    _, _, other_tag = encrypt_symmetric_128_bit_hex_key_utf8("OTHER", WORKSPACE_KEY)
+
+    with pytest.raises(ValueError):
+        decrypt_symmetric_128_bit_hex_key_utf8_batch(
+            WORKSPACE_KEY, [(ciphertext, iv, other_tag)]
+        )
+
+
+def b64(key) -> str:
+    return b64encode(bytes(key)).decode("utf-8")
+
+
+def test_key_pair_interoperates_with_asymmetric_functions():
+    peer = public.PrivateKey.generate()
+    private_key = public.PrivateKey.generate()
+    key_pair = AsymmetricKeyPair.from_token_json(
+        json.dumps(
+            {"publicKey": b64(private_key.public_key), "privateKey": b64(private_key)}
+        )
+    )
+
+    ciphertext, nonce = encrypt_asymmetric(
+        "VALUE", b64(private_key.public_key), b64(peer)
+    )
+    assert key_pair.decrypt(ciphertext, nonce, b64(peer.public_key)) == "VALUE"
+
+    ciphertexts = key_pair.encrypt_batch(["ONE", "TWO"], peer.public_key)
+    assert [
+        decrypt_asymmetric(ciphertext, nonce, b64(private_key.public_key), b64(peer))
+        for ciphertext, nonce in ciphertexts
+    ] == ["ONE", "TWO"]
+    assert key_pair.decrypt_batch(ciphertexts, bytes(peer.public_key)) == [
+        "ONE",
+        "TWO",
+    ]
+
+
+def test_key_pair_keeps_the_boxes_of_recent_peers():
+    key_pair = AsymmetricKeyPair(b64(public.PrivateKey.generate()), max_peers=2)
+    peers = [public.PrivateKey.generate().public_key for _ in range(3)]
+
+    first_box = key_pair.get_box(b64(peers[0]))
+
+    assert key_pair.get_box(bytes(peers[0])) is first_box
+
+    key_pair.get_box(peers[1])
+    key_pair.get_box(peers[2])
+
+    assert key_pair.get_box(peers[0]) is not first_box
+
+    with pytest.raises(ValueError):
+        key_pair.decrypt("", "", peers[0])
+
+
+def test_client_config_keeps_the_key_pair_of_its_token():
+    private_key = public.PrivateKey.generate()
+    peer = public.PrivateKey.generate()
+    ciphertext, nonce = encrypt_asymmetric(
+        WORKSPACE_KEY, b64(private_key.public_key), b64(peer)
+    )
+    client_config = ClientConfig(
+        auth_mode="service_token_v3",
+        credentials={
+            "public_key": b64(private_key.public_key),
+            "private_key": b64(private_key),
+        },
+        cache_ttl=300,
+    )
+    key_envelope = WorkspaceKeyEnvelope(
+        workspace_id="workspace",
+        encrypted_key=ciphertext,
+        nonce=nonce,
+        public_key=b64(peer.public_key),
+    )
+
+    workspace_config = SecretService.open_workspace_key_envelope(
+        key_envelope, client_config
+    )
+
+    assert workspace_config.workspace_key == WORKSPACE_KEY
+    assert client_config.get_key_pair() is client_config.get_key_pair()
+    assert len(client_config.get_key_pair()._boxes) == 1
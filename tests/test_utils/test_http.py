@@ -0,0 +1,139 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from infisical import InfisicalClient
+from infisical.api import create_api_request_with_auth
+from infisical.utils.http import HTTP2Session, get_connection_pool, get_http_client
+from infisical.utils.instrumentation import Instrumentation
+
+from testing.fake_api import SERVICE_TOKEN
+from testing.stub_servers import HTTP1StubServer
+
+pytest.importorskip("httpx")
+
+BEARER_TOKEN = SERVICE_TOKEN.rsplit(".", 1)[0]
+
+
+def create_http2_client(make_client, site_url: str, **kwargs) -> InfisicalClient:
+    client = make_client(site_url=site_url, http2=True, **kwargs)
+    # The stub server speaks cleartext HTTP/2, which is never negotiated over http
+    client.api_request = create_api_request_with_auth(
+        site_url, BEARER_TOKEN, http2=True, http2_prior_knowledge=True
+    )
+    return client
+
+
+def test_http2_multiplexes_requests(h2_stub_server, make_client):
+    fake_api, server = h2_stub_server
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+    fake_api.delay = 0.01
+
+    client = create_http2_client(make_client, server.url, cache_ttl=0)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(lambda _: client.get_secret("KEY_ONE"), range(32)))
+
+    assert {secret.secret_value for secret in results} == {"KEY_ONE_VAL"}
+    assert server.connections == 1
+
+    (pool_stats,) = client.get_pool_stats()
+
+    assert pool_stats.num_connections == 1
+    assert pool_stats.num_requests == fake_api.count("GET", "/")
+
+
+def test_http2_streams_and_writes(h2_stub_server, make_client):
+    fake_api, server = h2_stub_server
+    for index in range(50):
+        fake_api.add_secret(f"KEY_{index}", f"VAL_{index}")
+
+    client = create_http2_client(make_client, server.url)
+
+    assert len(list(client.iter_secrets())) == 50
+
+    client.create_secret("NEW_KEY", "NEW_VAL")
+    client.update_secret("NEW_KEY", "NEW_VAL_2")
+
+    assert client.get_secret("NEW_KEY").secret_value == "NEW_VAL_2"
+
+    client.delete_secret("NEW_KEY")
+
+    assert fake_api.count("DELETE", "/api/v3/secrets/NEW_KEY") == 1
+
+
+def test_http2_falls_back_to_http1(stub_server, make_client):
+    fake_api, site_url = stub_server
+    fake_api.add_secret("KEY_ONE", "KEY_ONE_VAL")
+
+    client = make_client(site_url=site_url, http2=True)
+
+    assert isinstance(client.api_request, HTTP2Session)
+    assert client.get_secret("KEY_ONE").secret_value == "KEY_ONE_VAL"
+    assert client.api_request.get("/api/v2/service-token").http_version == "HTTP/1.1"
+
+
+def test_connection_pools_are_only_shared_over_the_same_http_version():
+    http1 = get_http_client(base_url=None)
+    http2 = get_http_client(base_url=None, http2=True)
+
+    with pytest.raises(ValueError):
+        get_http_client(base_url=None, connection_pool=get_connection_pool(http2))
+
+    with pytest.raises(ValueError):
+        get_http_client(
+            base_url=None, http2=True, connection_pool=get_connection_pool(http1)
+        )
+
+
+def test_http2_raises_http_errors(stub_server):
+    fake_api, site_url = stub_server
+    fake_api.fail = True
+
+    instrumentation = Instrumentation()
+    events = []
+    instrumentation.on_request = events.append  # type: ignore[assignment]
+
+    http = HTTP2Session(
+        base_url=site_url, retries=1, backoff_factor=0, instrumentation=instrumentation
+    )
+    response = http.get("/api/v2/service-token")
+
+    assert response.status_code == 500
+    assert fake_api.count("GET", "/") == 2
+    assert [(event.status_code, event.retries) for event in events] == [(500, 1)]
+
+    with pytest.raises(requests.HTTPError) as exc_info:
+        response.raise_for_status()
+
+    assert exc_info.value.response is response
+
+
+def test_http2_only_retries_idempotent_methods(stub_server):
+    fake_api, site_url = stub_server
+    fake_api.fail = True
+
+    http = HTTP2Session(base_url=site_url, retries=3, backoff_factor=0)
+
+    assert http.post("/api/v3/secrets/KEY_ONE", json={}).status_code == 500
+    assert fake_api.count("POST", "/") == 1
+    assert http.delete("/api/v3/secrets/KEY_ONE", json={}).status_code == 500
+    assert fake_api.count("DELETE", "/") == 4
+
+
+def test_http2_honours_retry_after(monkeypatch):
+    responses = iter([(503, {"Retry-After": "7"}, ""), (200, {}, "{}")])
+    server = HTTP1StubServer(lambda *args: next(responses)).start()
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    try:
+        http = HTTP2Session(base_url=server.url, retries=3, timeout=(1, 5))
+
+        assert http.get("/api/v2/service-token").status_code == 200
+        assert sleeps == [7]
+        assert http._client.timeout.connect == 1
+        assert http._get_timeout((2, 10)).connect == 2
+    finally:
+        server.stop()
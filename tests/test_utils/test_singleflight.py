@@ -0,0 +1,35 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from infisical.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_are_coalesced():
+    flights = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(threading.get_ident())
+        time.sleep(0.1)
+        return "VALUE"
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(lambda _: flights.do("KEY", fetch), range(10)))
+
+    assert results == ["VALUE"] * 10
+    assert len(calls) == 1
+    assert not flights.in_flight("KEY")
+
+
+def test_exception_is_shared_and_not_cached():
+    flights = SingleFlight()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flights.do("KEY", fail)
+
+    assert flights.do("KEY", lambda: "VALUE") == "VALUE"
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+from infisical.utils.stream import JSONStream
+
+DOCUMENT = {
+    "secrets": [{"id": "1", "version": 12, "value": "é\\"}, {"id": "2", "flag": True}],
+    "imports": [{"environment": "prod", "secrets": [{"id": "3", "number": -1.5e3}]}],
+    "empty": [],
+    "nothing": None,
+}
+
+
+def read(stream: JSONStream):
+    items = []
+
+    for key in stream.iter_object():
+        if key in ("secrets", "empty"):
+            items.extend((key, stream.read_value()) for _ in stream.iter_array())
+        elif key == "imports":
+            for _ in stream.iter_array():
+                for import_key in stream.iter_object():
+                    items.append((import_key, stream.read_value()))
+        else:
+            items.append((key, stream.read_value()))
+
+    return items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_document_is_read_incrementally(chunk_size: int):
+    data = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode("utf-8")
+    chunks = [
+        data[start : start + chunk_size] for start in range(0, len(data), chunk_size)
+    ]
+
+    assert read(JSONStream(chunks)) == [
+        ("secrets", DOCUMENT["secrets"][0]),
+        ("secrets", DOCUMENT["secrets"][1]),
+        ("environment", "prod"),
+        ("secrets", DOCUMENT["imports"][0]["secrets"]),
+        ("nothing", None),
+    ]
+
+
+def test_truncated_document_raises():
+    with pytest.raises(ValueError):
+        read(JSONStream([b'{"secrets": [{"id": "1"']))